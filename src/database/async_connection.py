@@ -0,0 +1,170 @@
+"""
+Adaptador asíncrono sobre la conexión síncrona del backend configurado.
+
+Las consultas se ejecutan en un pool de hilos dedicado, de modo que el
+hilo que espera (el bucle de asyncio, la GUI o una petición web) no se
+bloquea. El pool de MySQLConnection es thread-safe y SQLiteConnection usa
+una conexión por hilo, así que ambos backends funcionan sin cambios.
+"""
+import os
+import asyncio
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Lock
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+from .base_connection import BaseConnection
+from .backend import get_connection
+from .bulk import BulkResult
+from .query_result import QueryResult
+from .row_formats import RowFormat
+from .retry import RetryPolicy
+
+T = TypeVar('T')
+
+# Marca de fin de un fetch_iter asíncrono
+_END = object()
+
+class AsyncConnection:
+    """Versión asíncrona de BaseConnection basada en un ThreadPoolExecutor
+
+    Ejemplo:
+        db = get_async_connection()
+        serials = await db.fetch_all("SELECT * FROM serials")
+
+    Las transacciones fijan la conexión al hilo que las abre, por eso no se
+    exponen begin/commit por separado: el bloque transaccional completo se
+    ejecuta en un solo hilo con ``run_transaction``.
+    """
+
+    def __init__(self, connection: Optional[BaseConnection] = None,
+                 max_workers: Optional[int] = None):
+        """Inicializa el adaptador
+
+        Args:
+            connection (BaseConnection, optional): Conexión síncrona; por defecto la del backend
+            max_workers (int, optional): Hilos del executor; por defecto DB_ASYNC_WORKERS
+                o el tamaño del pool de conexiones
+        """
+        self.connection = connection or get_connection()
+        if max_workers is None:
+            max_workers = int(os.getenv('DB_ASYNC_WORKERS', os.getenv('DB_POOL_SIZE', '5')))
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db-async')
+
+    def submit(self, func: Callable[..., T], *args, **kwargs) -> 'Future[T]':
+        """Ejecuta ``func`` en el pool de hilos sin usar asyncio
+
+        Útil desde código que no corre en un bucle de eventos (p. ej. la GUI):
+        el Future admite ``add_done_callback`` y ``result()``.
+        """
+        return self._executor.submit(func, *args, **kwargs)
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Ejecuta una función síncrona en el pool de hilos y espera su resultado"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def execute(self, query: str, params: Optional[tuple] = None) -> QueryResult:
+        """Ejecuta una consulta SQL (equivalente a ``execute_query``)"""
+        return await self.run(self.connection.execute_query, query, params)
+
+    async def fetch_all(self, query: str, params: Optional[tuple] = None,
+                        row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Ejecuta una consulta y devuelve todos los resultados"""
+        return await self.run(self.connection.fetch_all, query, params, row_format)
+
+    async def fetch_one(self, query: str, params: Optional[tuple] = None) -> Optional[Dict]:
+        """Ejecuta una consulta y devuelve un solo resultado"""
+        return await self.run(self.connection.fetch_one, query, params)
+
+    async def execute_many(self, query: str, rows: Iterable[Sequence[Any]],
+                           chunk_size: int = 1000) -> BulkResult:
+        """Ejecuta la misma sentencia para muchas filas"""
+        return await self.run(self.connection.execute_many, query, rows, chunk_size)
+
+    async def insert_many(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                          chunk_size: int = 1000) -> BulkResult:
+        """Inserta muchas filas con sentencias INSERT multi-fila"""
+        return await self.run(self.connection.insert_many, table, columns, rows, chunk_size)
+
+    async def run_transaction(self, func: Callable[[], T],
+                              policy: Optional[RetryPolicy] = None) -> T:
+        """Ejecuta ``func`` (síncrona) dentro de una transacción en un solo hilo"""
+        return await self.run(self.connection.run_transaction, func, policy)
+
+    async def fetch_iter(self, query: str, params: Optional[tuple] = None,
+                         batch_size: int = 500, row_format: str = RowFormat.DICT,
+                         prefetch: int = 2) -> AsyncIterator[Any]:
+        """Recorre el resultado de una consulta sin cargarlo completo
+
+        Un hilo del executor lee el cursor y entrega bloques de filas a una
+        cola acotada a ``prefetch`` bloques; si el consumidor se detiene,
+        la lectura se cancela y la conexión se libera.
+
+        Yields:
+            Cada fila (o cada bloque, con RowFormat.COLUMNAR)
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+        cancelled = Event()
+
+        def put(item: Any) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce() -> None:
+            rows = self.connection.fetch_iter(query, params, batch_size, row_format)
+            try:
+                batch = []
+                for row in rows:
+                    if cancelled.is_set():
+                        return
+                    if row_format == RowFormat.COLUMNAR:
+                        put([row])
+                        continue
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        put(batch)
+                        batch = []
+                if batch and not cancelled.is_set():
+                    put(batch)
+                put(_END)
+            except BaseException as e:
+                if not cancelled.is_set():
+                    put(e)
+            finally:
+                rows.close()
+
+        producer = loop.run_in_executor(self._executor, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                for row in item:
+                    yield row
+        finally:
+            cancelled.set()
+            # Vaciar la cola desbloquea al productor si estaba esperando espacio
+            while not producer.done():
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.sleep(0.005)
+            await producer
+
+    def close(self, wait: bool = True) -> None:
+        """Detiene el pool de hilos (la conexión síncrona sigue abierta)"""
+        self._executor.shutdown(wait=wait)
+
+_async_connection: Optional[AsyncConnection] = None
+_async_lock = Lock()
+
+def get_async_connection() -> AsyncConnection:
+    """Devuelve el adaptador asíncrono compartido sobre la conexión del backend"""
+    global _async_connection
+    if _async_connection is None:
+        with _async_lock:
+            if _async_connection is None:
+                _async_connection = AsyncConnection()
+    return _async_connection
@@ -0,0 +1,32 @@
+"""
+Selección del backend de base de datos a partir de la variable DB_BACKEND.
+
+    DB_BACKEND=mysql   (por defecto) servidor MySQL configurado con DB_HOST...
+    DB_BACKEND=sqlite  archivo local DB_SQLITE_PATH para terminales sin red
+"""
+import os
+from dotenv import load_dotenv
+from .base_connection import BaseConnection
+
+load_dotenv()
+
+BACKENDS = ('mysql', 'sqlite')
+
+def get_backend_name() -> str:
+    """Devuelve el nombre del backend configurado"""
+    backend = os.getenv('DB_BACKEND', 'mysql').strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"DB_BACKEND no soportado: {backend} (opciones: {', '.join(BACKENDS)})")
+    return backend
+
+def get_connection() -> BaseConnection:
+    """Devuelve la conexión (singleton) del backend configurado
+
+    Los drivers se importan solo al elegirse, de modo que una terminal con
+    SQLite no necesita mysql-connector instalado.
+    """
+    if get_backend_name() == 'sqlite':
+        from .sqlite_connection import SQLiteConnection
+        return SQLiteConnection()
+    from .connection import MySQLConnection
+    return MySQLConnection()
@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Optional
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Callable, List, Dict, Optional, Sequence, Iterable, Iterator, TypeVar
 import logging
+from .bulk import BulkResult
+from .row_formats import RowFormat
+from .retry import RetryPolicy, call_with_retry
+
+T = TypeVar('T')
 
 # Configurar logging
 logging.basicConfig(
@@ -11,10 +18,14 @@ logging.basicConfig(
 class BaseConnection(ABC):
     """Clase base abstracta para conexiones a bases de datos"""
     
+    _savepoint_ids = count(1)
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self._connection = None
         self._cursor = None
+        self.retry_policy = RetryPolicy()
+        self.retries = 0
 
     @abstractmethod
     def connect(self) -> Any:
@@ -32,8 +43,12 @@ class BaseConnection(ABC):
         pass
 
     @abstractmethod
-    def fetch_all(self, query: str, params: Optional[tuple] = None) -> List[Dict]:
-        """Ejecuta una consulta y devuelve todos los resultados"""
+    def fetch_all(self, query: str, params: Optional[tuple] = None,
+                  row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Ejecuta una consulta y devuelve todos los resultados
+
+        ``row_format`` permite pedir filas compactas (ver RowFormat).
+        """
         pass
 
     @abstractmethod
@@ -41,6 +56,39 @@ class BaseConnection(ABC):
         """Ejecuta una consulta y devuelve un solo resultado"""
         pass
 
+    def fetch_iter(self, query: str, params: Optional[tuple] = None,
+                   batch_size: int = 500, row_format: str = RowFormat.DICT) -> Iterator[Dict]:
+        """Ejecuta una consulta y devuelve sus filas de forma incremental
+
+        Las implementaciones con cursores sin buffer leen el resultado en
+        bloques de ``batch_size`` filas para mantener la memoria constante.
+        Esta implementación por defecto materializa el resultado completo.
+        """
+        rows = self.fetch_all(query, params, row_format)
+        if row_format == RowFormat.COLUMNAR:
+            yield rows
+        else:
+            yield from rows
+
+    @abstractmethod
+    def execute_many(self, query: str, rows: Iterable[Sequence[Any]],
+                     chunk_size: int = 1000) -> BulkResult:
+        """Ejecuta la misma sentencia para muchas filas en lotes de ``chunk_size``
+
+        Todas las filas se escriben en una sola transacción.
+        """
+        pass
+
+    @abstractmethod
+    def insert_many(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                    chunk_size: int = 1000) -> BulkResult:
+        """Inserta muchas filas con sentencias INSERT multi-fila
+
+        Las filas se agrupan en lotes que respetan el tamaño máximo de paquete
+        del servidor. El resultado incluye los rangos de IDs generados.
+        """
+        pass
+
     @abstractmethod
     def begin_transaction(self) -> None:
         """Inicia una transacción"""
@@ -56,7 +104,110 @@ class BaseConnection(ABC):
         """Revierte una transacción"""
         pass
 
+    def estimate_row_count(self, table: str) -> int:
+        """Devuelve el número aproximado de filas de una tabla
+
+        Los backends sobrescriben este método con una estimación que no
+        recorre la tabla; esta implementación por defecto cuenta las filas.
+        """
+        row = self.fetch_one(f"SELECT COUNT(*) AS row_count FROM {table}")
+        return int(row['row_count']) if row else 0
+
+    def table_versions(self, tables: Sequence[str]) -> Optional[tuple]:
+        """Devuelve una versión barata del contenido de las tablas
+
+        Dos llamadas devuelven el mismo valor si las tablas no cambiaron.
+        None indica que el backend no puede calcularla.
+        """
+        return None
+
+    def has_unique_index(self, table: str, column: str) -> Optional[bool]:
+        """Indica si la columna tiene un índice único propio (de una sola columna)
+
+        None indica que el backend no puede informarlo.
+        """
+        return None
+
     @property
     def is_connected(self) -> bool:
         """Verifica si la conexión está activa"""
-        return self._connection is not None 
\ No newline at end of file
+        return self._connection is not None
+
+    @property
+    def in_transaction(self) -> bool:
+        """Indica si el hilo actual tiene una transacción abierta"""
+        return False
+
+    @contextmanager
+    def transaction(self):
+        """Agrupa las sentencias del bloque en una sola transacción
+
+        Confirma al salir del bloque y revierte si se lanza una excepción.
+        Si ya hay una transacción abierta, el bloque se anida como savepoint.
+
+        Ejemplo:
+            with db.transaction():
+                db.execute_query(...)
+                db.execute_query(...)
+        """
+        if self.in_transaction:
+            with self.savepoint():
+                yield self
+            return
+        self.begin_transaction()
+        try:
+            yield self
+        except BaseException:
+            try:
+                self.rollback()
+            except Exception as e:
+                # Se propaga el error original, no el de la reversión
+                self.logger.error(f"No se pudo revertir la transacción tras un error: {str(e)}")
+            raise
+        self.commit()
+
+    @contextmanager
+    def savepoint(self, name: Optional[str] = None):
+        """Marca un savepoint dentro de la transacción actual
+
+        Si el bloque falla solo se revierte hasta el savepoint y la
+        transacción externa sigue abierta. Fuera de una transacción abre una.
+        """
+        if not self.in_transaction:
+            with self.transaction():
+                yield self
+            return
+        name = name or f"sp_{next(self._savepoint_ids)}"
+        self.execute_query(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except BaseException:
+            try:
+                self.execute_query(f"ROLLBACK TO SAVEPOINT {name}")
+            except Exception as e:
+                self.logger.error(f"Error al revertir el savepoint {name}: {str(e)}")
+            raise
+        self.execute_query(f"RELEASE SAVEPOINT {name}")
+
+    def run_transaction(self, func: Callable[[], T], policy: Optional[RetryPolicy] = None) -> T:
+        """Ejecuta ``func`` dentro de una transacción, repitiéndola ante errores transitorios
+
+        Si la transacción aborta por deadlock, espera de bloqueo o pérdida de
+        conexión, se revierte y se vuelve a ejecutar completa con espera
+        exponencial. ``func`` debe poder repetirse sin efectos externos.
+
+        Returns:
+            El valor devuelto por ``func``
+        """
+        def attempt() -> T:
+            with self.transaction():
+                return func()
+        if self.in_transaction:
+            # Un deadlock aborta la transacción externa completa: solo ella puede repetirse
+            return attempt()
+        return call_with_retry(attempt, policy or self.retry_policy, on_retry=self._on_retry)
+
+    def _on_retry(self, attempt: int, error: BaseException, delay: float) -> None:
+        """Registra un reintento por error transitorio"""
+        self.retries += 1
+        self.logger.warning(f"Error transitorio (intento {attempt}), reintentando en {delay:.2f}s: {str(error)}")
@@ -0,0 +1,101 @@
+"""
+Utilidades para escrituras masivas: construcción de INSERT multi-fila y
+partición de filas en lotes que respeten el tamaño máximo de paquete.
+"""
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Margen reservado en cada paquete para el texto fijo de la sentencia
+PACKET_MARGIN = 0.9
+
+class BulkResult:
+    """Resultado de una escritura masiva"""
+
+    def __init__(self):
+        self.rowcount = 0
+        self.statements = 0
+        self.id_ranges: List[Tuple[int, int]] = []
+
+    def add(self, rowcount: int, first_id: Optional[int] = None, inserted: int = 0) -> None:
+        """Acumula el resultado de una sentencia del lote
+
+        Args:
+            rowcount (int): Filas afectadas por la sentencia
+            first_id (int, optional): Primer AUTO_INCREMENT generado (lastrowid)
+            inserted (int): Filas insertadas por la sentencia
+        """
+        self.statements += 1
+        self.rowcount += max(rowcount, 0)
+        if first_id and inserted > 0:
+            # InnoDB asigna valores consecutivos a un INSERT con número de filas conocido
+            self.id_ranges.append((first_id, first_id + inserted - 1))
+
+    @property
+    def ids(self) -> List[int]:
+        """Lista completa de IDs generados"""
+        return [id_ for first, last in self.id_ranges for id_ in range(first, last + 1)]
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return f"BulkResult(rowcount={self.rowcount}, statements={self.statements}, id_ranges={self.id_ranges})"
+
+def build_multi_insert(table: str, columns: Sequence[str], row_count: int,
+                       placeholder: str = '%s') -> str:
+    """Construye un INSERT ... VALUES (...),(...) para ``row_count`` filas
+
+    Args:
+        table (str): Nombre de la tabla
+        columns (Sequence[str]): Columnas a insertar
+        row_count (int): Número de filas del lote
+        placeholder (str): Marcador de parámetro del driver
+
+    Returns:
+        str: Sentencia INSERT parametrizada
+    """
+    column_list = ', '.join(f"`{column}`" for column in columns)
+    row = '(' + ', '.join([placeholder] * len(columns)) + ')'
+    values = ', '.join([row] * row_count)
+    return f"INSERT INTO {table} ({column_list}) VALUES {values}"
+
+def estimate_row_size(row: Sequence[Any]) -> int:
+    """Estima en bytes el tamaño de una fila dentro de la sentencia SQL
+
+    Se cuenta el doble de cada valor para cubrir el peor caso de escapado.
+    """
+    size = 2
+    for value in row:
+        if value is None:
+            size += 6
+        elif isinstance(value, (bytes, bytearray)):
+            size += 2 * len(value) + 4
+        else:
+            size += 2 * len(str(value).encode('utf-8')) + 4
+    return size
+
+def chunk_rows(rows: Iterable[Sequence[Any]], max_rows: int,
+               max_bytes: Optional[int] = None) -> Iterator[List[Sequence[Any]]]:
+    """Divide las filas en lotes de como máximo ``max_rows`` filas y ``max_bytes`` bytes
+
+    Args:
+        rows (Iterable): Filas a dividir
+        max_rows (int): Número máximo de filas por lote
+        max_bytes (int, optional): Tamaño máximo estimado del lote
+
+    Yields:
+        List: Lote de filas
+    """
+    if max_rows < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    budget = int(max_bytes * PACKET_MARGIN) if max_bytes else None
+    chunk: List[Sequence[Any]] = []
+    chunk_bytes = 0
+    for row in rows:
+        row_bytes = estimate_row_size(row) if budget else 0
+        if chunk and (len(chunk) >= max_rows or (budget and chunk_bytes + row_bytes > budget)):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(row)
+        chunk_bytes += row_bytes
+    if chunk:
+        yield chunk
@@ -1,17 +1,39 @@
 import os
-from typing import Any, List, Dict, Optional
+import json
+import atexit
+import time
+from contextlib import contextmanager
+from typing import Any, List, Dict, Optional, Sequence, Iterable, Iterator
 import mysql.connector
 from mysql.connector import Error
 from dotenv import load_dotenv
-from threading import Lock
+from threading import Lock, local
 from .base_connection import BaseConnection
-from .db_exceptions import ConnectionError, QueryError, TransactionError
+from .db_exceptions import ConnectionError, TransactionError, ER_DUP_ENTRY, query_error
+from .pool import ConnectionPool, PooledConnection
+from .bulk import BulkResult, build_multi_insert, chunk_rows
+from .sql_text import normalize_sql, is_select
+from .statement_cache import StatementCache, StatementCacheStats
+from .row_formats import RowFormat, format_rows
+from .retry import RetryPolicy, call_with_retry
+from .query_stats import QueryStats, format_report
+from .explain import analyze_plan
+from .query_result import QueryResult
+
+# Código de error de MySQL para sentencias que no admiten el protocolo preparado
+ER_UNSUPPORTED_PS = 1295
 
 # Cargar variables de entorno
 load_dotenv()
 
 class MySQLConnection(BaseConnection):
-    """Implementación de conexión MySQL con patrón Singleton thread-safe"""
+    """Implementación de conexión MySQL con patrón Singleton thread-safe
+
+    El singleton administra un pool acotado de conexiones físicas. Cada
+    consulta toma una conexión del pool, abre su propio cursor y la devuelve
+    al terminar, de modo que varios hilos pueden consultar a la vez. Durante
+    una transacción la conexión queda fijada al hilo que la inició.
+    """
     
     _instance = None
     _lock = Lock()
@@ -30,96 +52,682 @@ class MySQLConnection(BaseConnection):
             self.database = os.getenv('DB_NAME')
             self.user = os.getenv('DB_USER')
             self.password = os.getenv('DB_PASSWORD')
+            self.pool_size = int(os.getenv('DB_POOL_SIZE', '5'))
+            self.pool_timeout = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+            self.pool_idle_timeout = float(os.getenv('DB_POOL_IDLE_TIMEOUT', '300'))
+            self.pool_max_lifetime = float(os.getenv('DB_POOL_MAX_LIFETIME', '3600'))
+            self.pool_ping_after = float(os.getenv('DB_POOL_PING_AFTER', '30'))
+            # Réplica de lectura opcional; los valores no definidos se toman del primario
+            self.replica_host = os.getenv('DB_REPLICA_HOST')
+            self.replica_port = os.getenv('DB_REPLICA_PORT', self.port)
+            self.replica_database = os.getenv('DB_REPLICA_NAME', self.database)
+            self.replica_user = os.getenv('DB_REPLICA_USER', self.user)
+            self.replica_password = os.getenv('DB_REPLICA_PASSWORD', self.password)
+            self.read_your_writes = float(os.getenv('DB_READ_YOUR_WRITES_SECONDS', '0'))
+            # Filas máximas (estimadas) de una tabla para versionarla con CHECKSUM TABLE
+            self.checksum_max_rows = int(os.getenv('DB_REF_CHECKSUM_MAX_ROWS', '10000'))
+            self._replica_pool: Optional[ConnectionPool] = None
+            self.replica_reads = 0
+            self.replica_fallbacks = 0
+            self.retry_policy = RetryPolicy(
+                max_attempts=int(os.getenv('DB_RETRY_ATTEMPTS', '3')),
+                base_delay=float(os.getenv('DB_RETRY_BASE_DELAY', '0.1')),
+                max_delay=float(os.getenv('DB_RETRY_MAX_DELAY', '2'))
+            )
+            self._pool: Optional[ConnectionPool] = None
+            self._max_allowed_packet: Optional[int] = None
+            self.statement_cache_size = int(os.getenv('DB_STMT_CACHE_SIZE', '64'))
+            self.statement_stats = StatementCacheStats()
+            self._unpreparable = set()
+            self.query_stats = QueryStats(
+                slow_threshold_ms=float(os.getenv('DB_SLOW_QUERY_MS', '200')),
+                enabled=os.getenv('DB_QUERY_STATS', '1') != '0'
+            )
+            self.explain_slow = os.getenv('DB_EXPLAIN_SLOW', '0') == '1'
+            stats_file = os.getenv('DB_QUERY_STATS_FILE')
+            if stats_file:
+                # Persistir las estadísticas al salir para consultarlas con show_query_stats.py
+                atexit.register(self.query_stats.save, stats_file)
+            self._local = local()
             self._initialized = True
 
-    def connect(self) -> Any:
-        """Establece la conexión con MySQL"""
-        try:
-            if not self.is_connected:
-                self._connection = mysql.connector.connect(
-                    host=self.host,
-                    port=self.port,
-                    user=self.user,
-                    password=self.password,
-                    database=self.database
-                )
-                self._cursor = self._connection.cursor(dictionary=True)
-                self.logger.info("Conexión exitosa a la base de datos MySQL")
-            return self._connection
-        except Error as e:
-            error_msg = f"Error al conectar a MySQL: {str(e)}"
-            self.logger.error(error_msg)
-            raise ConnectionError(error_msg)
+    @property
+    def is_connected(self) -> bool:
+        """Verifica si el pool de conexiones está activo"""
+        return self._pool is not None
+
+    @property
+    def has_replica(self) -> bool:
+        """Indica si hay una réplica de lectura configurada"""
+        return bool(self.replica_host)
+
+    def _open_connection(self) -> Any:
+        """Abre una conexión física nueva para el pool"""
+        connection = mysql.connector.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            autocommit=True
+        )
+        self.logger.info("Conexión exitosa a la base de datos MySQL")
+        return connection
+
+    def _open_replica_connection(self) -> Any:
+        """Abre una conexión física nueva a la réplica de lectura"""
+        connection = mysql.connector.connect(
+            host=self.replica_host,
+            port=self.replica_port,
+            user=self.replica_user,
+            password=self.replica_password,
+            database=self.replica_database,
+            autocommit=True
+        )
+        self.logger.info("Conexión exitosa a la réplica de lectura")
+        return connection
+
+    def connect(self) -> ConnectionPool:
+        """Crea el pool de conexiones con MySQL si aún no existe"""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self._open_connection,
+                        size=self.pool_size,
+                        timeout=self.pool_timeout,
+                        idle_timeout=self.pool_idle_timeout,
+                        max_lifetime=self.pool_max_lifetime,
+                        name='primary',
+                        validator=self._ping,
+                        ping_after=self.pool_ping_after
+                    )
+        return self._pool
+
+    def connect_replica(self) -> Optional[ConnectionPool]:
+        """Crea el pool de la réplica de lectura si está configurada"""
+        if not self.has_replica:
+            return None
+        if self._replica_pool is None:
+            with self._lock:
+                if self._replica_pool is None:
+                    self._replica_pool = ConnectionPool(
+                        self._open_replica_connection,
+                        size=self.pool_size,
+                        timeout=self.pool_timeout,
+                        idle_timeout=self.pool_idle_timeout,
+                        max_lifetime=self.pool_max_lifetime,
+                        name='replica',
+                        validator=self._ping,
+                        ping_after=self.pool_ping_after
+                    )
+        return self._replica_pool
 
     def disconnect(self) -> None:
-        """Cierra la conexión con MySQL"""
-        try:
-            if self._cursor:
-                self._cursor.close()
-            if self.is_connected:
-                self._connection.close()
-                self._connection = None
-                self.logger.info("Conexión cerrada")
+        """Cierra todas las conexiones del pool"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            replica, self._replica_pool = self._replica_pool, None
+        if replica is not None:
+            replica.close()
+        if pool is not None:
+            pool.close()
+            self.logger.info("Conexión cerrada")
+
+    def _pinned(self) -> Optional[PooledConnection]:
+        """Conexión fijada al hilo actual por una transacción abierta"""
+        return getattr(self._local, 'connection', None)
+
+    def _mark_write(self) -> None:
+        """Registra una escritura del hilo para la ventana read-your-writes"""
+        if self.read_your_writes > 0:
+            self._local.last_write = time.monotonic()
+
+    def _route_to_replica(self) -> bool:
+        """Decide si una lectura del hilo actual puede ir a la réplica
+
+        Las lecturas dentro de una transacción y las que siguen a una
+        escritura del mismo hilo (durante ``DB_READ_YOUR_WRITES_SECONDS``)
+        se quedan en el primario para ver sus propios cambios.
+        """
+        if not self.has_replica or self.in_transaction:
+            return False
+        last_write = getattr(self._local, 'last_write', None)
+        return last_write is None or time.monotonic() - last_write >= self.read_your_writes
+
+    def _acquire(self, replica: bool = False):
+        """Obtiene una conexión del pool primario o de la réplica
+
+        Si la réplica no está disponible la lectura se atiende en el primario.
+
+        Returns:
+            Tuple[ConnectionPool, PooledConnection]: Pool de origen y conexión
+        """
+        if replica:
+            try:
+                pool = self.connect_replica()
+                conn = pool.acquire()
+                self.replica_reads += 1
+                return pool, conn
+            except (Error, ConnectionError) as e:
+                self.replica_fallbacks += 1
+                self.logger.warning(f"Réplica no disponible, se lee del primario: {str(e)}")
+        try:
+            pool = self.connect()
+            return pool, pool.acquire()
         except Error as e:
-            error_msg = f"Error al cerrar la conexión: {str(e)}"
+            error_msg = f"Error al conectar a MySQL: {str(e)}"
             self.logger.error(error_msg)
-            raise ConnectionError(error_msg)
+            raise ConnectionError(error_msg, e.errno)
+
+    @contextmanager
+    def _checkout(self, replica: bool = False):
+        """Presta una conexión del pool (o la de la transacción del hilo)
+
+        Args:
+            replica (bool): Tomar la conexión de la réplica de lectura
+        """
+        pinned = self._pinned()
+        if pinned is not None:
+            yield pinned
+            return
+        pool, conn = self._acquire(replica)
+        broken = False
+        try:
+            yield conn
+        except Error:
+            # Una conexión rota no debe volver al pool
+            broken = not self._is_alive(conn)
+            raise
+        finally:
+            pool.release(conn, broken=broken)
 
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> Any:
-        """Ejecuta una consulta SQL"""
+    @contextmanager
+    def cursor(self, **kwargs):
+        """Presta un cursor propio sobre una conexión del pool
+
+        La conexión vuelve al pool (o sigue fijada a la transacción) al
+        salir del bloque.
+
+        Args:
+            **kwargs: Opciones del cursor de mysql.connector (dictionary, buffered...)
+        """
+        kwargs.setdefault('dictionary', True)
+        with self._checkout() as conn:
+            cursor = conn.raw.cursor(**kwargs)
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    @property
+    def in_transaction(self) -> bool:
+        """Indica si el hilo actual tiene una transacción abierta"""
+        return self._pinned() is not None
+
+    @staticmethod
+    def _ping(raw: Any) -> bool:
+        """Valida una conexión ociosa con un ping al servidor"""
+        raw.ping(reconnect=False)
+        return True
+
+    def _is_alive(self, conn: PooledConnection) -> bool:
+        try:
+            return conn.raw.is_connected()
+        except Exception:
+            return False
+
+    def execute_query(self, query: str, params: Optional[tuple] = None) -> QueryResult:
+        """Ejecuta una consulta SQL
+
+        Las sentencias DML se ejecutan como sentencias preparadas del
+        servidor, reutilizadas desde la caché de la conexión.
+
+        Returns:
+            QueryResult: Filas devueltas (si las hay), rowcount y lastrowid
+        """
+        return self._execute(query, params, RowFormat.DICT)
+
+    def _execute(self, query: str, params: Optional[tuple], row_format: str,
+                 replica: bool = False) -> QueryResult:
+        """Ejecuta una sentencia devolviendo las filas en el formato indicado"""
+        start = time.perf_counter()
+        result = self._execute_statement(query, params, row_format, replica)
+        if not is_select(query):
+            self._mark_write()
+        self._record(query, params, start, result.row_count)
+        return result
+
+    def _record(self, query: str, params: Optional[tuple], start: float, rows: int) -> None:
+        """Registra el tiempo de una sentencia y, si fue lenta, captura su plan"""
+        slow = self.query_stats.record(query, params, (time.perf_counter() - start) * 1000, rows)
+        if slow and self.explain_slow and is_select(query) and self.query_stats.claim_plan(query):
+            self._capture_plan(query, params)
+
+    def _capture_plan(self, query: str, params: Optional[tuple]) -> None:
+        """Obtiene el plan con EXPLAIN FORMAT=JSON y lo guarda en las estadísticas
+
+        Se ejecuta directamente sobre un cursor para no volver a medirse ni
+        a registrarse como consulta; un fallo solo se registra en el log.
+        """
         try:
-            self.connect()
-            self._cursor.execute(query, params or ())
-            if not query.strip().upper().startswith('SELECT'):
-                self._connection.commit()
-            return self._cursor
+            with self.cursor(dictionary=False) as cursor:
+                cursor.execute(f"EXPLAIN FORMAT=JSON {query}", params or ())
+                row = cursor.fetchone()
+            plan = json.loads(row[0])
+            self.query_stats.store_plan(query, plan, analyze_plan(plan))
+        except Exception as e:
+            self.logger.warning(f"No se pudo obtener el plan de la consulta: {str(e)}")
+
+    def _execute_statement(self, query: str, params: Optional[tuple], row_format: str,
+                           replica: bool = False) -> QueryResult:
+        try:
+            with self._checkout(replica) as conn:
+                if self._use_prepared(query):
+                    try:
+                        return self._execute_prepared(conn, query, params, row_format)
+                    except Error as e:
+                        if e.errno != ER_UNSUPPORTED_PS:
+                            raise
+                        self._unpreparable.add(normalize_sql(query))
+                cursor = conn.raw.cursor(dictionary=row_format == RowFormat.DICT)
+                try:
+                    cursor.execute(query, params or ())
+                    rows = None
+                    if cursor.with_rows:
+                        rows = cursor.fetchall()
+                        if row_format != RowFormat.DICT:
+                            rows = format_rows(cursor.column_names, rows, row_format)
+                    return QueryResult(rows, cursor.rowcount, cursor.lastrowid, cursor.description)
+                finally:
+                    cursor.close()
         except Error as e:
-            if self.is_connected:
-                self._connection.rollback()
             error_msg = f"Error al ejecutar la consulta: {str(e)}"
-            self.logger.error(error_msg)
-            raise QueryError(error_msg)
+            if e.errno == ER_DUP_ENTRY:
+                # Resultado esperado de una escritura que confía en el índice único
+                self.logger.info(error_msg)
+            else:
+                self.logger.error(error_msg)
+            raise query_error(error_msg, e.errno)
+
+    def _use_prepared(self, query: str) -> bool:
+        return (self.statement_cache_size > 0
+                and StatementCache.is_preparable(query)
+                and normalize_sql(query) not in self._unpreparable)
+
+    def _statement_cache(self, conn: PooledConnection) -> StatementCache:
+        """Caché de sentencias preparadas de una conexión física"""
+        if conn.statement_cache is None:
+            conn.statement_cache = StatementCache(
+                lambda: conn.raw.cursor(prepared=True),
+                self.statement_cache_size,
+                self.statement_stats
+            )
+        return conn.statement_cache
+
+    def _execute_prepared(self, conn: PooledConnection, query: str,
+                          params: Optional[tuple], row_format: str) -> QueryResult:
+        """Ejecuta una sentencia preparada y convierte las filas al formato pedido"""
+        cache = self._statement_cache(conn)
+        key = normalize_sql(query)
+        cursor, operation, _ = cache.get(key, query)
+        try:
+            cursor.execute(operation, params or ())
+            rows = None
+            if cursor.with_rows:
+                rows = format_rows(cursor.column_names, cursor.fetchall(), row_format)
+            return QueryResult(rows, cursor.rowcount, cursor.lastrowid, cursor.description)
+        except Error:
+            # Una sentencia que falló (p. ej. por cambios de esquema) se vuelve a preparar
+            cache.discard(key)
+            raise
+
+    def statement_cache_stats(self) -> Dict:
+        """Devuelve los contadores de la caché de sentencias preparadas"""
+        stats = self.statement_stats.as_dict()
+        stats['capacity_per_connection'] = self.statement_cache_size
+        return stats
 
-    def fetch_all(self, query: str, params: Optional[tuple] = None) -> List[Dict]:
-        """Ejecuta una consulta y devuelve todos los resultados"""
-        cursor = self.execute_query(query, params)
-        return cursor.fetchall()
+    def fetch_all(self, query: str, params: Optional[tuple] = None,
+                  row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Ejecuta una consulta y devuelve todos los resultados
+
+        Args:
+            query (str): Consulta SELECT
+            params (tuple, optional): Parámetros de la consulta
+            row_format (str): Formato de fila (ver RowFormat); por defecto diccionarios
+        """
+        return self._execute_read(query, params, row_format).fetchall()
 
     def fetch_one(self, query: str, params: Optional[tuple] = None) -> Optional[Dict]:
         """Ejecuta una consulta y devuelve un solo resultado"""
-        cursor = self.execute_query(query, params)
-        return cursor.fetchone()
+        return self._execute_read(query, params, RowFormat.DICT).fetchone()
+
+    def _execute_read(self, query: str, params: Optional[tuple], row_format: str) -> QueryResult:
+        """Ejecuta una lectura reintentando los errores transitorios
+
+        Las lecturas son idempotentes, así que tras perder la conexión se
+        repiten sobre una conexión nueva del pool. Dentro de una transacción
+        no se reintenta: la transacción completa debe repetirse. Fuera de
+        ella los SELECT se envían a la réplica si está configurada.
+        """
+        if self.in_transaction:
+            return self._execute(query, params, row_format)
+        replica = is_select(query) and self._route_to_replica()
+        return call_with_retry(lambda: self._execute(query, params, row_format, replica),
+                               self.retry_policy, on_retry=self._on_retry)
+
+    def _get_max_allowed_packet(self) -> int:
+        """Obtiene (una sola vez) el max_allowed_packet del servidor"""
+        if self._max_allowed_packet is None:
+            row = self.fetch_one("SELECT @@max_allowed_packet AS max_allowed_packet")
+            self._max_allowed_packet = int(row['max_allowed_packet'])
+        return self._max_allowed_packet
+
+    def execute_many(self, query: str, rows: Iterable[Sequence[Any]],
+                     chunk_size: int = 1000) -> BulkResult:
+        """Ejecuta la misma sentencia para muchas filas en lotes de ``chunk_size``
+
+        Args:
+            query (str): Sentencia parametrizada
+            rows (Iterable): Parámetros de cada ejecución
+            chunk_size (int): Filas enviadas por llamada a executemany
+
+        Returns:
+            BulkResult: Filas afectadas y número de sentencias enviadas
+        """
+        result = BulkResult()
+        try:
+            with self.transaction():
+                with self.cursor(dictionary=False) as cursor:
+                    for chunk in chunk_rows(rows, chunk_size):
+                        start = time.perf_counter()
+                        cursor.executemany(query, chunk)
+                        self.query_stats.record(query, None, (time.perf_counter() - start) * 1000,
+                                                max(cursor.rowcount, 0))
+                        result.add(cursor.rowcount)
+            self._mark_write()
+        except Error as e:
+            error_msg = f"Error al ejecutar la consulta por lotes: {str(e)}"
+            self.logger.error(error_msg)
+            raise query_error(error_msg, e.errno)
+        return result
+
+    def insert_many(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                    chunk_size: int = 1000) -> BulkResult:
+        """Inserta muchas filas con sentencias INSERT multi-fila
+
+        Args:
+            table (str): Tabla destino
+            columns (Sequence[str]): Columnas a insertar
+            rows (Iterable): Valores de cada fila en el orden de ``columns``
+            chunk_size (int): Máximo de filas por sentencia
+
+        Returns:
+            BulkResult: Filas insertadas y rangos de IDs generados
+        """
+        result = BulkResult()
+        try:
+            max_bytes = self._get_max_allowed_packet()
+            with self.transaction():
+                with self.cursor(dictionary=False) as cursor:
+                    for chunk in chunk_rows(rows, chunk_size, max_bytes):
+                        query = build_multi_insert(table, columns, len(chunk))
+                        start = time.perf_counter()
+                        cursor.execute(query, [value for row in chunk for value in row])
+                        self.query_stats.record(query, None, (time.perf_counter() - start) * 1000,
+                                                max(cursor.rowcount, 0))
+                        result.add(cursor.rowcount, cursor.lastrowid, len(chunk))
+            self._mark_write()
+        except Error as e:
+            error_msg = f"Error al insertar filas en {table}: {str(e)}"
+            self.logger.error(error_msg)
+            raise query_error(error_msg, e.errno)
+        return result
+
+    def fetch_iter(self, query: str, params: Optional[tuple] = None,
+                   batch_size: int = 500, row_format: str = RowFormat.DICT) -> Iterator[Dict]:
+        """Ejecuta una consulta y devuelve sus filas de forma incremental
+
+        Usa un cursor sin buffer y lee el resultado en bloques de
+        ``batch_size`` filas, de modo que la memoria no crece con el tamaño
+        de la tabla. La conexión queda ocupada mientras se consume el
+        generador; si el consumidor se detiene antes del final, la conexión
+        se descarta en lugar de leer el resto del resultado.
+
+        Args:
+            query (str): Consulta SELECT
+            params (tuple, optional): Parámetros de la consulta
+            batch_size (int): Filas leídas por cada fetchmany
+            row_format (str): Formato de fila (ver RowFormat). Con COLUMNAR se
+                produce un diccionario de columnas por cada bloque leído
+
+        Yields:
+            Dict: Cada fila del resultado
+        """
+        pinned = self._pinned()
+        pool = None
+        if pinned is not None:
+            conn = pinned
+        else:
+            pool, conn = self._acquire(is_select(query) and self._route_to_replica())
+        cursor = None
+        exhausted = False
+        start = time.perf_counter()
+        row_count = 0
+        try:
+            cursor = conn.raw.cursor(dictionary=row_format == RowFormat.DICT, buffered=False)
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    exhausted = True
+                    break
+                row_count += len(rows)
+                if row_format == RowFormat.DICT:
+                    yield from rows
+                elif row_format == RowFormat.COLUMNAR:
+                    yield format_rows(cursor.column_names, rows, row_format)
+                else:
+                    yield from format_rows(cursor.column_names, rows, row_format)
+        except Error as e:
+            error_msg = f"Error al ejecutar la consulta: {str(e)}"
+            self.logger.error(error_msg)
+            raise query_error(error_msg, e.errno)
+        finally:
+            self._finish_stream(conn, cursor, pool, exhausted)
+            # Incluye el tiempo del consumidor: refleja cuánto se ocupó la conexión
+            self._record(query, params, start, row_count)
+
+    def _finish_stream(self, conn: PooledConnection, cursor: Any,
+                       pool: Optional[ConnectionPool], exhausted: bool) -> None:
+        """Libera el cursor y la conexión de un fetch_iter"""
+        if exhausted:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+            if pool is not None:
+                pool.release(conn)
+            return
+        if pool is not None:
+            # Leer el resto de un resultado grande cuesta más que reabrir la conexión
+            pool.release(conn, discard=True)
+            return
+        # Dentro de una transacción la conexión debe seguir utilizable
+        try:
+            conn.raw.consume_results()
+            if cursor is not None:
+                cursor.close()
+        except Exception:
+            pass
 
     def begin_transaction(self) -> None:
-        """Inicia una transacción"""
+        """Inicia una transacción fijando una conexión al hilo actual"""
+        if self._pinned() is not None:
+            raise TransactionError("Ya existe una transacción activa en este hilo")
         try:
-            self.connect()
-            self._connection.start_transaction()
-            self.logger.info("Transacción iniciada")
+            conn = self.connect().acquire()
         except Error as e:
             error_msg = f"Error al iniciar la transacción: {str(e)}"
             self.logger.error(error_msg)
-            raise TransactionError(error_msg)
+            raise TransactionError(error_msg, e.errno)
+        try:
+            conn.raw.start_transaction()
+        except Error as e:
+            self._pool.release(conn, broken=not self._is_alive(conn))
+            error_msg = f"Error al iniciar la transacción: {str(e)}"
+            self.logger.error(error_msg)
+            raise TransactionError(error_msg, e.errno)
+        self._local.connection = conn
+        self.logger.info("Transacción iniciada")
+
+    def _end_transaction(self, commit: bool) -> None:
+        conn = self._pinned()
+        if conn is None:
+            # Sin transacción abierta las sentencias ya se confirmaron (autocommit)
+            return
+        broken = False
+        try:
+            if commit:
+                conn.raw.commit()
+            else:
+                conn.raw.rollback()
+        except Error:
+            broken = not self._is_alive(conn)
+            raise
+        finally:
+            self._local.connection = None
+            # Lo escrito en la transacción tarda en llegar a la réplica
+            self._mark_write()
+            pool = self._pool
+            if pool is not None:
+                pool.release(conn, broken=broken)
+            else:
+                conn.close()
 
     def commit(self) -> None:
         """Confirma una transacción"""
         try:
-            self._connection.commit()
+            self._end_transaction(commit=True)
             self.logger.info("Transacción confirmada")
         except Error as e:
             error_msg = f"Error al confirmar la transacción: {str(e)}"
             self.logger.error(error_msg)
-            raise TransactionError(error_msg)
+            raise TransactionError(error_msg, e.errno)
 
     def rollback(self) -> None:
         """Revierte una transacción"""
         try:
-            self._connection.rollback()
+            self._end_transaction(commit=False)
             self.logger.info("Transacción revertida")
         except Error as e:
             error_msg = f"Error al revertir la transacción: {str(e)}"
             self.logger.error(error_msg)
-            raise TransactionError(error_msg)
+            raise TransactionError(error_msg, e.errno)
+
+    def pool_stats(self) -> Dict:
+        """Devuelve el estado del pool de conexiones"""
+        return self._pool.stats() if self._pool is not None else {}
+
+    def replica_stats(self) -> Dict:
+        """Devuelve el estado del pool de la réplica y del enrutamiento de lecturas"""
+        if not self.has_replica:
+            return {}
+        return {
+            'pool': self._replica_pool.stats() if self._replica_pool is not None else {},
+            'reads': self.replica_reads,
+            'fallbacks': self.replica_fallbacks,
+            'read_your_writes_seconds': self.read_your_writes,
+        }
+
+    def top_queries(self, n: int = 10, order_by: str = 'total_ms') -> List[Dict]:
+        """Devuelve las ``n`` consultas con mayor tiempo acumulado (u otra métrica)"""
+        return self.query_stats.top(n, order_by)
+
+    def dump_query_stats(self, n: int = 10, order_by: str = 'total_ms') -> str:
+        """Devuelve como texto la tabla de las ``n`` consultas más costosas"""
+        return format_report(self.top_queries(n, order_by))
+
+    def metrics(self) -> Dict:
+        """Devuelve las métricas de conexión: pool, reconexiones y reintentos
+
+        ``reconnects`` suma los pools principal y de réplica; ``replica.pool``
+        tiene las de la réplica por separado.
+        """
+        pool = self.pool_stats()
+        replica_pool = self._replica_pool.stats() if self._replica_pool is not None else {}
+        return {
+            'pool': pool,
+            'reconnects': pool.get('reconnects', 0) + replica_pool.get('reconnects', 0),
+            'retries': self.retries,
+            'statement_cache': self.statement_cache_stats(),
+            'query_plans': len(self.query_stats.plans()),
+            'replica': self.replica_stats(),
+        }
+
+    def estimate_row_count(self, table: str) -> int:
+        """Devuelve el número aproximado de filas de una tabla
+
+        Usa la estadística TABLE_ROWS de InnoDB, que no recorre la tabla
+        (puede desviarse alrededor de un 10-40 %). Útil para barras de
+        desplazamiento; para un total exacto usar COUNT(*).
+        """
+        row = self.fetch_one("""
+            SELECT TABLE_ROWS AS table_rows
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+        """, (self.database, table))
+        if row is None or row['table_rows'] is None:
+            return super().estimate_row_count(table)
+        return int(row['table_rows'])
+
+    def table_versions(self, tables: Sequence[str]) -> Optional[tuple]:
+        """Devuelve el CHECKSUM TABLE de cada tabla si todas son pequeñas
+
+        CHECKSUM TABLE lee todas las filas (en InnoDB no hay checksum
+        mantenido, la opción QUICK devuelve NULL). Antes se consulta la
+        estimación TABLE_ROWS, que no recorre la tabla: si alguna supera
+        ``checksum_max_rows`` no se calcula la versión y la caché recarga
+        la consulta al vencer el TTL.
+
+        Se ejecuta directamente sobre un cursor: no es una escritura y no
+        debe afectar la ventana read-your-writes ni las estadísticas.
+        """
+        if not tables:
+            return None
+        wanted = [table.lower() for table in tables]
+        placeholders = ', '.join(['%s'] * len(wanted))
+        with self.cursor(dictionary=False) as cursor:
+            cursor.execute(f"""
+                SELECT LOWER(TABLE_NAME), TABLE_ROWS
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_SCHEMA = %s AND LOWER(TABLE_NAME) IN ({placeholders})
+            """, (self.database, *wanted))
+            sizes = dict(cursor.fetchall())
+            # Una tabla inexistente o sin estadística no tiene versión fiable
+            if any(sizes.get(table) is None or sizes[table] > self.checksum_max_rows
+                   for table in wanted):
+                return None
+            table_list = ', '.join(f"`{table}`" for table in tables)
+            cursor.execute(f"CHECKSUM TABLE {table_list}")
+            rows = cursor.fetchall()
+        checksums = tuple(row[1] for row in rows)
+        return None if any(checksum is None for checksum in checksums) else checksums
+
+    def has_unique_index(self, table: str, column: str) -> Optional[bool]:
+        """Indica si la columna tiene un índice único de una sola columna"""
+        row = self.fetch_one("""
+            SELECT COUNT(*) AS found
+            FROM (
+                SELECT INDEX_NAME
+                FROM INFORMATION_SCHEMA.STATISTICS
+                WHERE TABLE_SCHEMA = %s AND LOWER(TABLE_NAME) = LOWER(%s) AND NON_UNIQUE = 0
+                GROUP BY INDEX_NAME
+                HAVING COUNT(*) = 1 AND LOWER(MAX(COLUMN_NAME)) = LOWER(%s)
+            ) unique_indexes
+        """, (self.database, table, column))
+        return bool(row and row['found'])
 
     def get_table_schema(self, table_name: str) -> List[Dict]:
         """Obtiene la estructura de una tabla específica"""
@@ -139,7 +747,7 @@ class MySQLConnection(BaseConnection):
         except Error as e:
             error_msg = f"Error al obtener el esquema de la tabla {table_name}: {str(e)}"
             self.logger.error(error_msg)
-            raise QueryError(error_msg)
+            raise query_error(error_msg, e.errno)
 
     def get_table_relationships(self, table_name: str) -> List[Dict]:
         """Obtiene las relaciones de una tabla específica"""
@@ -158,7 +766,7 @@ class MySQLConnection(BaseConnection):
         except Error as e:
             error_msg = f"Error al obtener las relaciones de la tabla {table_name}: {str(e)}"
             self.logger.error(error_msg)
-            raise QueryError(error_msg)
+            raise query_error(error_msg, e.errno)
 
     def get_all_tables(self) -> List[str]:
         """Obtiene la lista de todas las tablas en la base de datos"""
@@ -172,7 +780,7 @@ class MySQLConnection(BaseConnection):
         except Error as e:
             error_msg = f"Error al obtener la lista de tablas: {str(e)}"
             self.logger.error(error_msg)
-            raise QueryError(error_msg)
+            raise query_error(error_msg, e.errno)
 
 # Función de utilidad para probar la conexión
 def test_connection():
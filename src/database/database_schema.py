@@ -22,6 +22,7 @@ class Tables:
     EXPLANATION = 'Explanetion'
     DR_STATUS = 'DR_Status'
     DAMAGE_REPORT = 'Damage_Report'
+    SERIAL_DAMAGE_SUMMARY = 'Serial_Damage_Summary'
 
 # Columnas principales por tabla
 class Columns:
@@ -52,6 +53,22 @@ class Columns:
         ROLE_ID = 'id_rol'
         USER_ID = 'id_user'
 
+    class Inches:
+        ID = 'id_inch'
+        INCH = 'Inch'
+
+    class Parts:
+        ID = 'id_part'
+        PART = 'Part'
+
+    class Description:
+        ID = 'id_description'
+        DESCRIPTION = 'Description'
+
+    class StatusSerial:
+        ID = 'id_status'
+        STATUS = 'Status'
+
     class DieDescription:
         ID = 'id_die_description'
         INCH_ID = 'id_inch'
@@ -105,6 +122,13 @@ class Columns:
         ID = 'id_line'
         LINE = 'Line'
 
+    class SerialDamageSummary:
+        SERIAL_ID = 'id_serial'
+        REPORT_COUNT = 'report_count'
+        OPEN_COUNT = 'open_count'
+        LAST_DAMAGE = 'last_damage_time'
+        UPDATE_TIME = 'updat_time'
+
 # Relaciones entre tablas
 class Relations:
     WORKER_POSITION = {
@@ -176,10 +200,15 @@ def get_table_columns(table_name: str) -> list:
         Tables.USER: vars(Columns.Users),
         Tables.ROLES: vars(Columns.Roles),
         Tables.ROLES_USER: vars(Columns.RolesUser),
+        Tables.INCHES: vars(Columns.Inches),
+        Tables.PARTS: vars(Columns.Parts),
+        Tables.DESCRIPTION: vars(Columns.Description),
+        Tables.STATUS_SERIAL: vars(Columns.StatusSerial),
         Tables.DIE_DESCRIPTION: vars(Columns.DieDescription),
         Tables.SERIALS: vars(Columns.Serials),
         Tables.DAMAGE_REPORT: vars(Columns.DamageReport),
         Tables.LINE: vars(Columns.Lines),
+        Tables.SERIAL_DAMAGE_SUMMARY: vars(Columns.SerialDamageSummary),
     }
     
     return [col for col in columns_map.get(table_name, {}).values() 
@@ -1,6 +1,22 @@
+import re
+from typing import Optional
+
+# Código de MySQL para clave duplicada (violación de un índice UNIQUE)
+ER_DUP_ENTRY = 1062
+
+# Código de MySQL para tabla inexistente
+ER_NO_SUCH_TABLE = 1146
+
+_MYSQL_DUP_KEY = re.compile(r"for key '([^']+)'")
+_SQLITE_DUP_KEY = re.compile(r"UNIQUE constraint failed: (.+)$")
+
 class DatabaseError(Exception):
     """Clase base para excepciones de base de datos"""
-    pass
+
+    def __init__(self, message: str = '', errno: Optional[int] = None):
+        super().__init__(message)
+        # Código de error del servidor/driver, si se conoce
+        self.errno = errno
 
 class ConnectionError(DatabaseError):
     """Excepción lanzada por errores de conexión"""
@@ -10,6 +26,22 @@ class QueryError(DatabaseError):
     """Excepción lanzada por errores en consultas"""
     pass
 
+class DuplicateKeyError(QueryError):
+    """Excepción lanzada cuando una escritura viola un índice único"""
+
+    @property
+    def key(self) -> Optional[str]:
+        """Nombre del índice (MySQL) o columnas (SQLite) que causaron el duplicado"""
+        message = str(self)
+        match = _MYSQL_DUP_KEY.search(message) or _SQLITE_DUP_KEY.search(message)
+        return match.group(1) if match else None
+
+def query_error(message: str, errno: Optional[int] = None) -> QueryError:
+    """Crea la excepción de consulta adecuada para el código de error"""
+    if errno == ER_DUP_ENTRY:
+        return DuplicateKeyError(message, errno)
+    return QueryError(message, errno)
+
 class TransactionError(DatabaseError):
     """Excepción lanzada por errores en transacciones"""
-    pass 
\ No newline at end of file
+    pass
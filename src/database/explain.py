@@ -0,0 +1,56 @@
+"""
+Análisis de los planes de ejecución obtenidos con ``EXPLAIN FORMAT=JSON``.
+"""
+import json
+from typing import Any, Dict, List, Union
+
+def _walk(node: Any, flags: Dict[str, Any]) -> None:
+    if isinstance(node, list):
+        for item in node:
+            _walk(item, flags)
+        return
+    if not isinstance(node, dict):
+        return
+    if node.get('access_type') == 'ALL' and 'table_name' in node:
+        flags['full_scans'].append(node['table_name'])
+    if node.get('using_filesort'):
+        flags['filesort'] = True
+    if node.get('using_temporary_table'):
+        flags['temporary_table'] = True
+    if node.get('dependent'):
+        flags['dependent_subquery'] = True
+    for value in node.values():
+        if isinstance(value, (dict, list)):
+            _walk(value, flags)
+
+def analyze_plan(plan: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Extrae los problemas habituales de un plan en formato JSON
+
+    Args:
+        plan (str | dict): Salida de ``EXPLAIN FORMAT=JSON``
+
+    Returns:
+        Dict: ``full_scans`` (tablas con access_type ALL), ``filesort``,
+        ``temporary_table`` y ``dependent_subquery``
+    """
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    flags = {
+        'full_scans': [],
+        'filesort': False,
+        'temporary_table': False,
+        'dependent_subquery': False,
+    }
+    _walk(plan, flags)
+    return flags
+
+def describe_flags(flags: Dict[str, Any]) -> List[str]:
+    """Convierte los indicadores de analyze_plan en avisos legibles"""
+    warnings = [f"full scan: {table}" for table in flags.get('full_scans', [])]
+    if flags.get('filesort'):
+        warnings.append('filesort')
+    if flags.get('temporary_table'):
+        warnings.append('temporary table')
+    if flags.get('dependent_subquery'):
+        warnings.append('dependent subquery')
+    return warnings
@@ -0,0 +1,211 @@
+"""
+Inserciones agrupadas en segundo plano.
+
+Las terminales de línea registran ráfagas de filas pequeñas; escribir cada
+una con su propio INSERT y COMMIT deja al operador esperando el viaje a la
+base. ``InsertBatcher`` encola la fila y regresa de inmediato; un hilo la
+escribe junto con las demás filas pendientes en un INSERT multi-fila cuando
+el lote se llena o vence ``max_delay``.
+"""
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('InsertBatcher')
+
+class _Flush:
+    """Marca en la cola: escribir lo pendiente y avisar"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+_STOP = object()
+
+class InsertBatcher:
+    """Agrupa inserciones de una tabla y las escribe con ``insert_many``"""
+
+    def __init__(self, db: Any, table: str, columns: Sequence[str],
+                 max_batch: Optional[int] = None, max_delay: Optional[float] = None,
+                 max_pending: int = 10000,
+                 on_written: Optional[Callable[[List[tuple]], None]] = None,
+                 before_commit: Optional[Callable[[List[tuple]], None]] = None):
+        """Inicializa el agrupador y arranca su hilo
+
+        Args:
+            db (BaseConnection): Conexión a usar
+            table (str): Tabla destino
+            columns (Sequence[str]): Columnas de cada fila
+            max_batch (int, optional): Filas por lote (por defecto DB_BATCH_SIZE o 200)
+            max_delay (float, optional): Segundos máximos que una fila espera en la cola
+                (por defecto DB_BATCH_DELAY_MS o 50 ms)
+            max_pending (int): Filas en cola a partir de las cuales submit() espera
+            on_written (Callable, optional): Se llama desde el hilo del agrupador con
+                las filas de cada lote escrito
+            before_commit (Callable, optional): Se llama con las filas del lote dentro
+                de su transacción, para escrituras derivadas que deben confirmarse
+                junto con él
+        """
+        self.db = db
+        self.table = table
+        self.columns = tuple(columns)
+        self.max_batch = max(1, max_batch or int(os.getenv('DB_BATCH_SIZE', '200')))
+        if max_delay is None:
+            max_delay = int(os.getenv('DB_BATCH_DELAY_MS', '50')) / 1000.0
+        self.max_delay = max(0.0, max_delay)
+        self.on_written = on_written
+        self.before_commit = before_commit
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_batch_ms = 0.0
+        self._thread = threading.Thread(target=self._run, name=f"InsertBatcher-{table}", daemon=True)
+        self._thread.start()
+        _batchers.append(self)
+
+    def submit(self, row: Sequence[Any]) -> Future:
+        """Encola una fila para insertarla en el siguiente lote
+
+        Args:
+            row (Sequence): Valores en el orden de ``columns``
+
+        Returns:
+            Future: Se resuelve con el ID generado (o None si el backend no lo
+            informa) o con la excepción del INSERT
+
+        Raises:
+            RuntimeError: Si el agrupador ya se cerró
+            ValueError: Si la fila no tiene un valor por columna
+        """
+        if len(row) != len(self.columns):
+            raise ValueError(f"Se esperaban {len(self.columns)} valores, se recibieron {len(row)}")
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"El agrupador de {self.table} está cerrado")
+            self.submitted += 1
+        self._queue.put((tuple(row), future))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Escribe de inmediato las filas encoladas hasta ahora
+
+        Returns:
+            bool: True si se escribieron antes de ``timeout``
+        """
+        if not self._thread.is_alive():
+            return self._queue.empty()
+        marker = _Flush()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Escribe lo pendiente y detiene el hilo"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        """Filas encoladas aún no escritas (aproximado)"""
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Any]:
+        """Devuelve los contadores del agrupador"""
+        with self._lock:
+            return {
+                'table': self.table,
+                'submitted': self.submitted,
+                'written': self.written,
+                'failed': self.failed,
+                'batches': self.batches,
+                'pending': self.pending,
+                'last_batch_ms': round(self.last_batch_ms, 2),
+            }
+
+    def _run(self) -> None:
+        batch: List[Tuple[tuple, Future]] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, tuple):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.max_delay
+                if len(batch) < self.max_batch and time.monotonic() < deadline:
+                    continue
+            # Lote lleno, plazo vencido, flush o cierre
+            if batch:
+                self._write(batch)
+                batch, deadline = [], None
+            if isinstance(item, _Flush):
+                item.done.set()
+            elif item is _STOP:
+                return
+
+    def _write(self, batch: List[Tuple[tuple, Future]]) -> None:
+        started = time.perf_counter()
+        rows = [row for row, _ in batch]
+        def insert():
+            result = self.db.insert_many(self.table, self.columns, rows, chunk_size=self.max_batch)
+            if self.before_commit is not None:
+                self.before_commit(rows)
+            return result
+
+        try:
+            result = self.db.run_transaction(insert)
+        except Exception as e:
+            if len(batch) == 1:
+                self._fail(batch, e)
+            else:
+                # Una fila inválida no debe descartar el lote: se reintenta fila por fila
+                logger.warning(f"Lote de {len(batch)} filas en {self.table} rechazado, "
+                               f"reintentando por fila: {str(e)}")
+                for item in batch:
+                    self._write([item])
+            return
+        if self.on_written is not None:
+            # Antes de resolver los futures: quien espera uno ya ve los efectos
+            try:
+                self.on_written(rows)
+            except Exception as e:
+                logger.error(f"Error en on_written de {self.table}: {str(e)}")
+        ids = result.ids
+        if len(ids) != len(batch):
+            ids = [None] * len(batch)
+        for (_, future), row_id in zip(batch, ids):
+            future.set_result(row_id)
+        with self._lock:
+            self.written += len(batch)
+            self.batches += 1
+            self.last_batch_ms = (time.perf_counter() - started) * 1000
+
+    def _fail(self, batch: List[Tuple[tuple, Future]], error: Exception) -> None:
+        logger.error(f"No se pudo insertar en {self.table}: {str(error)}")
+        for _, future in batch:
+            future.set_exception(error)
+        with self._lock:
+            self.failed += len(batch)
+
+_batchers: List[InsertBatcher] = []
+
+@atexit.register
+def _close_all() -> None:
+    # Las filas encoladas se escriben antes de que termine el proceso
+    for batcher in list(_batchers):
+        batcher.close()
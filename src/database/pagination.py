@@ -0,0 +1,276 @@
+"""
+Paginación por clave (keyset / seek) para los listados.
+
+En lugar de ``LIMIT n OFFSET m``, que obliga al servidor a leer y
+descartar las ``m`` filas previas, cada página continúa después de la
+última clave de ordenamiento de la anterior, por lo que el costo no
+depende de la profundidad de la página.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from database.row_formats import RowFormat
+
+# Máximo de filas por página aceptado por page()
+MAX_PAGE_SIZE = 1000
+
+# Máximo de términos de una búsqueda (cada uno agrega un LIKE por columna)
+MAX_SEARCH_TERMS = 5
+
+class SortKey:
+    """Columna de ordenamiento de un listado paginado"""
+
+    def __init__(self, expression: str, field: str, nullable: bool = False):
+        """Inicializa la columna
+
+        Args:
+            expression (str): Expresión SQL a ordenar y comparar (p. ej. ``s.Serial``);
+                debe ser una columna indexada, no una expresión (COALESCE impide el índice)
+            field (str): Nombre de la columna en las filas del resultado
+            nullable (bool): La columna admite NULL; MySQL y SQLite ordenan los NULL
+                primero en ASC y al final en DESC, y la condición de página los respeta
+        """
+        self.expression = expression
+        self.field = field
+        self.nullable = nullable
+
+    def key_value(self, row: Any) -> Any:
+        """Valor de la clave de ordenamiento en una fila del resultado"""
+        return row[self.field]
+
+    def order_value(self, row: Any) -> Any:
+        """Valor comparable en Python con el mismo orden que el servidor (NULL primero)"""
+        value = row[self.field]
+        return (value is not None, value) if self.nullable else value
+
+    def __repr__(self) -> str:
+        return f"SortKey({self.expression!r}, {self.field!r})"
+
+class Page:
+    """Página de resultados de un listado"""
+
+    def __init__(self, rows: List[Any], next_key: Optional[Tuple], limit: int,
+                 keys: Sequence[SortKey] = (), descending: bool = False):
+        self.rows = rows
+        self.next_key = next_key
+        self.limit = limit
+        # Orden de las filas; permite ubicar una fila nueva sin volver a consultar
+        self.keys = tuple(keys)
+        self.descending = descending
+
+    @property
+    def has_more(self) -> bool:
+        """Indica si existe una página siguiente"""
+        return self.next_key is not None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        return f"Page(rows={len(self.rows)}, next_key={self.next_key!r})"
+
+def keyset_condition(keys: Sequence[SortKey], after_key: Sequence[Any],
+                     descending: bool = False) -> Tuple[str, tuple]:
+    """Construye la condición "después de ``after_key``" en forma expandida
+
+    ``(a, b) > (x, y)`` se escribe como ``a > x OR (a = x AND b > y)``,
+    forma que MySQL y SQLite resuelven con un rango sobre el índice. Un
+    valor NULL se compara con ``IS NULL`` / ``IS NOT NULL``: en ASC los NULL
+    van primero y en DESC al final.
+
+    Returns:
+        Tuple[str, tuple]: Condición SQL y sus parámetros
+    """
+    if len(after_key) != len(keys):
+        raise ValueError(f"La clave debe tener {len(keys)} valores, se recibieron {len(after_key)}")
+    operator = '<' if descending else '>'
+    terms = []
+    params: List[Any] = []
+    for i, key in enumerate(keys):
+        value = after_key[i]
+        if value is None:
+            if descending:
+                # Nada sigue a un NULL en esta columna
+                continue
+            after = f"{key.expression} IS NOT NULL"
+        elif descending and key.nullable:
+            after = f"({key.expression} {operator} %s OR {key.expression} IS NULL)"
+        else:
+            after = f"{key.expression} {operator} %s"
+        parts = []
+        for previous, previous_value in zip(keys[:i], after_key[:i]):
+            if previous_value is None:
+                parts.append(f"{previous.expression} IS NULL")
+            else:
+                parts.append(f"{previous.expression} = %s")
+                params.append(previous_value)
+        parts.append(after)
+        if value is not None:
+            params.append(value)
+        terms.append('(' + ' AND '.join(parts) + ')')
+    if not terms:
+        return '1 = 0', ()
+    return '(' + ' OR '.join(terms) + ')', tuple(params)
+
+def build_page_query(select: str, keys: Sequence[SortKey], after_key: Optional[Sequence[Any]],
+                     limit: int, descending: bool = False,
+                     has_where: bool = False) -> Tuple[str, tuple]:
+    """Completa una consulta SELECT con la condición de página, ORDER BY y LIMIT
+
+    Args:
+        select (str): Consulta sin ORDER BY ni LIMIT
+        keys (Sequence[SortKey]): Columnas de ordenamiento; la última debe ser única
+        after_key (Sequence, optional): Clave de la última fila de la página anterior
+        limit (int): Filas de la página (se pide una más para saber si hay otra)
+        descending (bool): Orden descendente
+        has_where (bool): La consulta ya contiene una cláusula WHERE
+
+    Returns:
+        Tuple[str, tuple]: Consulta y parámetros
+    """
+    query = select.rstrip()
+    params: tuple = ()
+    if after_key is not None:
+        condition, params = keyset_condition(keys, after_key, descending)
+        query += f"\n            {'AND' if has_where else 'WHERE'} {condition}"
+    direction = 'DESC' if descending else 'ASC'
+    order = ', '.join(f"{key.expression} {direction}" for key in keys)
+    query += f"\n            ORDER BY {order}\n            LIMIT {int(limit) + 1}"
+    return query, params
+
+def escape_like(text: str) -> str:
+    """Escapa los comodines de LIKE con '!' (usar con ``ESCAPE '!'``)
+
+    MySQL y SQLite aceptan igual '!' como escape (la barra invertida no).
+    """
+    return text.replace('!', '!!').replace('%', '!%').replace('_', '!_')
+
+def search_condition(columns: Sequence[str], search: str) -> Tuple[str, tuple]:
+    """Construye la condición de búsqueda de texto de un listado
+
+    Cada término (separado por espacios) debe aparecer como subcadena en
+    alguna de las columnas: ``(a LIKE %x% OR b LIKE %x%) AND (...)``. La
+    comparación sigue la intercalación de la columna (sin distinguir
+    mayúsculas en las tablas del sistema).
+
+    Args:
+        columns (Sequence[str]): Expresiones SQL en las que se busca
+        search (str): Texto de búsqueda
+
+    Returns:
+        Tuple[str, tuple]: Condición SQL y sus parámetros; condición vacía si no
+        hay términos
+    """
+    terms = search.split()[:MAX_SEARCH_TERMS]
+    if not terms or not columns:
+        return '', ()
+    clauses = []
+    params: List[Any] = []
+    for term in terms:
+        pattern = '%' + escape_like(term) + '%'
+        clauses.append('(' + ' OR '.join(f"{column} LIKE %s ESCAPE '!'" for column in columns) + ')')
+        params.extend([pattern] * len(columns))
+    return '(' + ' AND '.join(clauses) + ')', tuple(params)
+
+def filter_condition(columns: Dict[str, str], filters: Dict[str, Any]) -> Tuple[str, tuple]:
+    """Construye la condición de los filtros por columna de un listado
+
+    Un valor None no filtra; una lista o tupla acepta cualquiera de sus
+    valores (``IN``).
+
+    Args:
+        columns (Dict[str, str]): Filtros permitidos: nombre → expresión SQL
+        filters (Dict[str, Any]): Valor pedido por filtro
+
+    Returns:
+        Tuple[str, tuple]: Condición SQL y sus parámetros; condición vacía si no
+        hay filtros
+
+    Raises:
+        ValueError: Si un filtro no está permitido
+    """
+    clauses = []
+    params: List[Any] = []
+    for name, value in filters.items():
+        if name not in columns:
+            raise ValueError(f"Filtro no permitido: {name} (opciones: {', '.join(columns)})")
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set, frozenset)):
+            if not value:
+                clauses.append('1 = 0')
+                continue
+            clauses.append(f"{columns[name]} IN ({', '.join(['%s'] * len(value))})")
+            params.extend(value)
+        else:
+            clauses.append(f"{columns[name]} = %s")
+            params.append(value)
+    return ' AND '.join(clauses), tuple(params)
+
+def parse_sort(sort: Optional[str], sorts: Dict[str, Sequence[SortKey]],
+               default: str) -> Tuple[Sequence[SortKey], bool]:
+    """Resuelve el nombre de ordenamiento pedido contra los permitidos
+
+    Args:
+        sort (str, optional): Nombre del ordenamiento; con prefijo ``-`` es descendente
+        sorts (Dict): Ordenamientos permitidos por el modelo
+        default (str): Ordenamiento a usar si ``sort`` es None
+
+    Raises:
+        ValueError: Si el ordenamiento no está permitido
+    """
+    sort = sort or default
+    descending = sort.startswith('-')
+    name = sort.lstrip('-')
+    if name not in sorts:
+        raise ValueError(f"Ordenamiento no permitido: {name} (opciones: {', '.join(sorts)})")
+    return sorts[name], descending
+
+def fetch_page(db, select: str, sorts: Dict[str, Sequence[SortKey]], default: str,
+               after_key: Optional[Sequence[Any]] = None, limit: int = 100,
+               sort: Optional[str] = None, params: tuple = (), has_where: bool = False,
+               row_format: str = RowFormat.DICT, search: Optional[str] = None,
+               search_columns: Sequence[str] = (), filters: Optional[Dict[str, Any]] = None,
+               filter_columns: Optional[Dict[str, str]] = None) -> Page:
+    """Ejecuta una consulta paginada por clave y devuelve la página
+
+    Args:
+        db (BaseConnection): Conexión a usar
+        select (str): Consulta sin ORDER BY ni LIMIT
+        sorts (Dict): Ordenamientos permitidos por el modelo
+        default (str): Ordenamiento por defecto
+        after_key (Sequence, optional): ``Page.next_key`` de la página anterior
+        limit (int): Filas por página (entre 1 y MAX_PAGE_SIZE)
+        sort (str, optional): Nombre del ordenamiento; prefijo ``-`` para descendente
+        params (tuple): Parámetros de la consulta base
+        has_where (bool): La consulta base ya contiene WHERE
+        row_format (str): Formato de fila (DICT o RECORD: la clave se lee por nombre)
+        search (str, optional): Texto a buscar en ``search_columns`` (ver search_condition)
+        search_columns (Sequence[str]): Expresiones SQL en las que se busca
+        filters (Dict[str, Any], optional): Valor por filtro (ver filter_condition)
+        filter_columns (Dict[str, str], optional): Filtros permitidos: nombre → expresión SQL
+
+    Returns:
+        Page: Filas de la página y clave para pedir la siguiente
+    """
+    keys, descending = parse_sort(sort, sorts, default)
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    conditions = []
+    if filters:
+        conditions.append(filter_condition(filter_columns or {}, filters))
+    if search:
+        conditions.append(search_condition(search_columns, search))
+    for condition, condition_params in conditions:
+        if condition:
+            select = f"{select.rstrip()}\n            {'AND' if has_where else 'WHERE'} {condition}"
+            params = tuple(params) + condition_params
+            has_where = True
+    query, key_params = build_page_query(select, keys, after_key, limit, descending, has_where)
+    rows = db.fetch_all(query, tuple(params) + key_params, row_format=row_format)
+    next_key = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_key = tuple(key.key_value(last) for key in keys)
+    return Page(rows, next_key, limit, keys, descending)
@@ -0,0 +1,206 @@
+import time
+import logging
+from threading import Condition
+from typing import Any, Callable, List, Optional
+from .db_exceptions import ConnectionError
+
+class PooledConnection:
+    """Envoltura de una conexión física administrada por el pool"""
+
+    def __init__(self, raw: Any):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        # Caché de sentencias preparadas ligada a esta conexión física
+        self.statement_cache = None
+
+    @property
+    def age(self) -> float:
+        """Segundos desde que se abrió la conexión física"""
+        return time.monotonic() - self.created_at
+
+    @property
+    def idle_time(self) -> float:
+        """Segundos desde la última vez que se devolvió al pool"""
+        return time.monotonic() - self.last_used
+
+    def close(self) -> None:
+        """Cierra la conexión física ignorando errores de red"""
+        if self.statement_cache is not None:
+            # Los handles se liberan en el servidor al cerrar la conexión
+            self.statement_cache.clear(close=False)
+        try:
+            self.raw.close()
+        except Exception:
+            pass
+
+class ConnectionPool:
+    """Pool acotado de conexiones con checkout/devolución thread-safe
+
+    Las conexiones ociosas más allá de ``idle_timeout`` y las que superan
+    ``max_lifetime`` se cierran y se reemplazan en el siguiente checkout.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 5, timeout: float = 30.0,
+                 idle_timeout: float = 300.0, max_lifetime: float = 3600.0,
+                 name: str = 'pool', validator: Optional[Callable[[Any], bool]] = None,
+                 ping_after: float = 30.0):
+        """Inicializa el pool
+
+        Args:
+            factory (Callable): Función que abre una nueva conexión física
+            size (int): Número máximo de conexiones abiertas simultáneamente
+            timeout (float): Segundos a esperar por una conexión libre
+            idle_timeout (float): Segundos de inactividad antes de desalojar una conexión
+            max_lifetime (float): Segundos de vida máxima de una conexión física
+            name (str): Nombre del pool para los logs
+            validator (Callable, optional): Comprueba (p. ej. con un ping) que una
+                conexión sigue viva antes de prestarla
+            ping_after (float): Segundos de inactividad a partir de los cuales se valida
+        """
+        if size < 1:
+            raise ValueError("El tamaño del pool debe ser al menos 1")
+        self.logger = logging.getLogger(f"{self.__class__.__name__}[{name}]")
+        self._factory = factory
+        self._validator = validator
+        self.ping_after = ping_after
+        self.size = size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self._idle: List[PooledConnection] = []
+        self._in_use = 0
+        self._closed = False
+        self._condition = Condition()
+        self.created = 0
+        self.recycled = 0
+        self.evicted = 0
+        self.failed_pings = 0
+        self.broken = 0
+
+    def _is_expired(self, conn: PooledConnection) -> bool:
+        if self.max_lifetime and conn.age >= self.max_lifetime:
+            self.recycled += 1
+            return True
+        if self.idle_timeout and conn.idle_time >= self.idle_timeout:
+            self.evicted += 1
+            return True
+        return False
+
+    def _open(self) -> PooledConnection:
+        conn = PooledConnection(self._factory())
+        self.created += 1
+        return conn
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Obtiene una conexión del pool, abriendo una nueva si hay cupo
+
+        Raises:
+            ConnectionError: Si el pool está cerrado o no hay conexión libre a tiempo
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        conn = None
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ConnectionError("El pool de conexiones está cerrado")
+                # Reutilizar la conexión ociosa más reciente (LIFO) descartando las caducadas
+                while self._idle:
+                    candidate = self._idle.pop()
+                    if self._is_expired(candidate):
+                        candidate.close()
+                        continue
+                    conn = candidate
+                    break
+                if conn is not None or self._in_use < self.size:
+                    # Reservar el cupo antes de abrir para no exceder el tamaño
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionError(
+                        f"Tiempo de espera agotado: las {self.size} conexiones del pool están en uso")
+                self._condition.wait(remaining)
+        if conn is not None and not self._validate(conn):
+            conn = None
+        if conn is not None:
+            return conn
+        try:
+            return self._open()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def _validate(self, conn: PooledConnection) -> bool:
+        """Comprueba una conexión que estuvo ociosa más de ``ping_after`` segundos"""
+        if self._validator is None or conn.idle_time < self.ping_after:
+            return True
+        try:
+            alive = self._validator(conn.raw)
+        except Exception:
+            alive = False
+        if not alive:
+            self.failed_pings += 1
+            self.logger.warning("Conexión ociosa caída; se abrirá una nueva")
+            conn.close()
+        return alive
+
+    def release(self, conn: PooledConnection, discard: bool = False, broken: bool = False) -> None:
+        """Devuelve una conexión al pool
+
+        Args:
+            conn (PooledConnection): Conexión obtenida con acquire()
+            discard (bool): Cerrar la conexión en lugar de reutilizarla
+            broken (bool): La conexión se perdió (implica ``discard``)
+        """
+        conn.last_used = time.monotonic()
+        discard = discard or broken
+        with self._condition:
+            self._in_use -= 1
+            if broken:
+                self.broken += 1
+            if discard or self._closed or self._is_expired(conn):
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._condition.notify()
+
+    def evict_idle(self) -> int:
+        """Cierra las conexiones ociosas caducadas
+
+        Returns:
+            int: Número de conexiones cerradas
+        """
+        with self._condition:
+            expired = [conn for conn in self._idle if self._is_expired(conn)]
+            self._idle = [conn for conn in self._idle if conn not in expired]
+        for conn in expired:
+            conn.close()
+        return len(expired)
+
+    def close(self) -> None:
+        """Cierra todas las conexiones ociosas y rechaza nuevos checkouts"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for conn in idle:
+            conn.close()
+        self.logger.info("Pool cerrado")
+
+    def stats(self) -> dict:
+        """Devuelve el estado actual del pool"""
+        with self._condition:
+            return {
+                'size': self.size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'created': self.created,
+                'recycled': self.recycled,
+                'evicted': self.evicted,
+                'failed_pings': self.failed_pings,
+                'broken': self.broken,
+                'reconnects': self.failed_pings + self.broken,
+            }
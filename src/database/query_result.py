@@ -0,0 +1,59 @@
+from typing import Any, List, Optional
+
+class QueryResult:
+    """Resultado desacoplado del cursor devuelto por ``execute_query``
+
+    Se comporta como la lista de filas para las consultas que devuelven
+    datos (iterable, indexable, ``len``) y conserva ``rowcount`` y
+    ``lastrowid`` de las sentencias de escritura, de modo que el cursor y
+    la conexión pueden volver al pool inmediatamente.
+    """
+
+    def __init__(self, rows: Optional[List[Any]] = None, rowcount: int = -1,
+                 lastrowid: Optional[int] = None, description: Optional[tuple] = None):
+        self.rows = rows
+        self.rowcount = rowcount
+        self.lastrowid = lastrowid
+        self.description = description
+
+    @property
+    def row_count(self) -> int:
+        """Filas devueltas por una consulta o afectadas por una escritura"""
+        if self.rows is None:
+            return max(self.rowcount, 0)
+        if isinstance(self.rows, dict):
+            # Formato columnar: todas las columnas tienen la misma longitud
+            return len(next(iter(self.rows.values()), []))
+        return len(self.rows)
+
+    @property
+    def with_rows(self) -> bool:
+        """Indica si la sentencia produjo un conjunto de resultados"""
+        return self.rows is not None
+
+    def fetchall(self) -> List[Any]:
+        """Devuelve todas las filas (compatibilidad con la API de cursor)"""
+        return self.rows or []
+
+    def fetchone(self) -> Optional[Any]:
+        """Devuelve la primera fila o None (compatibilidad con la API de cursor)"""
+        return self.rows[0] if self.rows else None
+
+    def __iter__(self):
+        return iter(self.rows or [])
+
+    def __len__(self) -> int:
+        return len(self.rows) if self.rows is not None else max(self.rowcount, 0)
+
+    def __getitem__(self, index):
+        return (self.rows or [])[index]
+
+    def __bool__(self) -> bool:
+        # Una escritura que no lanzó error es exitosa aunque no cambie filas;
+        # una consulta es verdadera solo si devolvió filas
+        return bool(self.rows) if self.rows is not None else True
+
+    def __repr__(self) -> str:
+        if self.rows is not None:
+            return f"QueryResult(rows={len(self.rows)})"
+        return f"QueryResult(rowcount={self.rowcount}, lastrowid={self.lastrowid})"
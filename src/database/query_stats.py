@@ -0,0 +1,197 @@
+"""
+Estadísticas de tiempo de ejecución por consulta y registro de consultas lentas.
+"""
+import json
+import logging
+import re
+from collections import deque
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence
+from .sql_text import normalize_sql
+from .explain import describe_flags
+
+# Muestras recientes que se conservan por consulta para calcular percentiles
+SAMPLE_SIZE = 512
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_NUMBER_LITERAL = re.compile(r"(?<![\w`.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s)\s*,)*\s*(?:\?|%s)\s*\)", re.IGNORECASE)
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)(?:\s*,\s*\((?:\s*%s\s*,)*\s*%s\s*\))+")
+
+slow_query_logger = logging.getLogger('SlowQuery')
+
+@lru_cache(maxsize=2048)
+def fingerprint(query: str) -> str:
+    """Normaliza una consulta para agrupar sus ejecuciones
+
+    Colapsa espacios, reemplaza literales por ``?``, reduce las listas IN y
+    los VALUES multi-fila, de modo que consultas que solo difieren en sus
+    valores comparten estadísticas.
+    """
+    text = normalize_sql(query)
+    text = _STRING_LITERAL.sub('?', text)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _IN_LIST.sub('IN (...)', text)
+    text = _PLACEHOLDER_LIST.sub('(...)', text)
+    return text
+
+def redact_params(params: Optional[Sequence[Any]]) -> str:
+    """Describe los parámetros sin revelar sus valores (tipo y longitud)"""
+    if not params:
+        return '[]'
+    described = []
+    for value in params:
+        if value is None:
+            described.append('NULL')
+        elif isinstance(value, (str, bytes, bytearray)):
+            described.append(f"<{type(value).__name__}:{len(value)}>")
+        else:
+            described.append(f"<{type(value).__name__}>")
+    return '[' + ', '.join(described) + ']'
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+class QueryHistogram:
+    """Acumulado de tiempos de una consulta normalizada"""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.slow_count = 0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+    def add(self, elapsed_ms: float, rows: int, slow: bool) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows
+        if slow:
+            self.slow_count += 1
+        self.samples.append(elapsed_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            'query': self.query,
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(_percentile(ordered, 0.50), 3),
+            'p95_ms': round(_percentile(ordered, 0.95), 3),
+            'max_ms': round(self.max_ms, 3),
+            'rows': self.rows,
+            'slow_count': self.slow_count,
+        }
+
+class QueryStats:
+    """Registro thread-safe de tiempos por consulta normalizada"""
+
+    def __init__(self, slow_threshold_ms: float = 200.0, enabled: bool = True):
+        """Inicializa el registro
+
+        Args:
+            slow_threshold_ms (float): Duración a partir de la cual se registra como lenta
+            enabled (bool): Permite desactivar la instrumentación
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.enabled = enabled
+        self._lock = Lock()
+        self._histograms: Dict[str, QueryHistogram] = {}
+        # Planes capturados por consulta normalizada (None mientras se obtienen)
+        self._plans: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def record(self, query: str, params: Optional[Sequence[Any]], elapsed_ms: float,
+               rows: int = 0) -> bool:
+        """Registra una ejecución
+
+        Returns:
+            bool: True si la ejecución superó el umbral de consulta lenta
+        """
+        if not self.enabled:
+            return False
+        key = fingerprint(query)
+        slow = elapsed_ms >= self.slow_threshold_ms
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = QueryHistogram(key)
+            histogram.add(elapsed_ms, rows, slow)
+        if slow:
+            slow_query_logger.warning(
+                f"Consulta lenta ({elapsed_ms:.1f} ms, {rows} filas): {key} params={redact_params(params)}")
+        return slow
+
+    def claim_plan(self, query: str) -> bool:
+        """Reserva la captura del plan de una consulta
+
+        Returns:
+            bool: True solo la primera vez para cada consulta normalizada
+        """
+        key = fingerprint(query)
+        with self._lock:
+            if key in self._plans:
+                return False
+            self._plans[key] = None
+            return True
+
+    def store_plan(self, query: str, plan: Dict[str, Any], flags: Dict[str, Any]) -> None:
+        """Guarda el plan de ejecución y sus indicadores para una consulta"""
+        key = fingerprint(query)
+        with self._lock:
+            self._plans[key] = {'plan': plan, 'flags': flags}
+        warnings = describe_flags(flags)
+        if warnings:
+            slow_query_logger.warning(f"Plan de consulta lenta ({', '.join(warnings)}): {key}")
+
+    def plans(self) -> Dict[str, Dict[str, Any]]:
+        """Devuelve los planes capturados por consulta normalizada"""
+        with self._lock:
+            return {key: entry for key, entry in self._plans.items() if entry is not None}
+
+    def top(self, n: int = 10, order_by: str = 'total_ms') -> List[Dict[str, Any]]:
+        """Devuelve las ``n`` consultas con mayor ``order_by`` (total_ms, p95_ms, count...)"""
+        with self._lock:
+            entries = []
+            for key, histogram in self._histograms.items():
+                entry = histogram.as_dict()
+                plan = self._plans.get(key)
+                if plan is not None:
+                    entry['plan_flags'] = plan['flags']
+                entries.append(entry)
+        entries.sort(key=lambda entry: entry[order_by], reverse=True)
+        return entries[:n]
+
+    def reset(self) -> None:
+        """Descarta todas las estadísticas acumuladas"""
+        with self._lock:
+            self._histograms.clear()
+            self._plans.clear()
+
+    def save(self, path: str) -> None:
+        """Guarda las estadísticas en un archivo JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'slow_threshold_ms': self.slow_threshold_ms,
+                       'queries': self.top(len(self._histograms)),
+                       'plans': self.plans()}, f, indent=2, default=str)
+
+def format_report(entries: List[Dict[str, Any]]) -> str:
+    """Da formato de tabla a las entradas devueltas por QueryStats.top()"""
+    lines = [f"{'Total ms':>10} {'Count':>7} {'p50 ms':>9} {'p95 ms':>9} {'Max ms':>9} {'Rows':>9}  Query",
+             '-' * 100]
+    for entry in entries:
+        lines.append(
+            f"{entry['total_ms']:>10.1f} {entry['count']:>7} {entry['p50_ms']:>9.2f} "
+            f"{entry['p95_ms']:>9.2f} {entry['max_ms']:>9.2f} {entry['rows']:>9}  {entry['query']}"
+        )
+        warnings = describe_flags(entry.get('plan_flags') or {})
+        if warnings:
+            lines.append(f"{'':>58}^ plan: {', '.join(warnings)}")
+    return '\n'.join(lines)
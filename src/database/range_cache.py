@@ -0,0 +1,115 @@
+"""
+Caché de resultados calculados sobre un rango de fechas.
+
+Los reportes nuevos siempre llevan la fecha actual, así que una inserción
+solo invalida los resultados cuyo rango llega hasta ese momento; los rangos
+cerrados en el pasado siguen sirviendo. Las actualizaciones y eliminaciones
+invalidan todo. Los cambios hechos desde otra terminal se ven al vencer
+``DB_REPORT_CACHE_TTL``.
+"""
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class _Entry:
+    __slots__ = ('value', 'end', 'loaded_at')
+
+    def __init__(self, value: Any, end: Optional[datetime]):
+        self.value = value
+        self.end = end
+        self.loaded_at = time.monotonic()
+
+class RangeCache:
+    """Caché LRU thread-safe con TTL e invalidación por fecha"""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 64):
+        """Inicializa la caché
+
+        Args:
+            ttl (float): Segundos que una entrada es válida; 0 desactiva la caché
+            max_entries (int): Entradas conservadas; se descartan las menos usadas
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Aumenta con cada invalidación: una carga iniciada antes no se guarda
+        self._generation = 0
+
+    def get(self, key: Hashable, end: Optional[datetime], loader: Callable[[], Any]) -> Any:
+        """Devuelve el valor en caché o lo calcula con ``loader``
+
+        Los valores se comparten entre llamadas y no deben modificarse.
+
+        Args:
+            key (Hashable): Identificador del cálculo (incluye el rango)
+            end (datetime, optional): Fin del rango; None si no tiene límite
+            loader (Callable): Función que calcula el valor
+        """
+        if self.ttl <= 0:
+            return loader()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.loaded_at < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            generation = self._generation
+        value = loader()
+        with self._lock:
+            self.misses += 1
+            if generation == self._generation:
+                self._entries[key] = _Entry(value, end)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, since: Optional[datetime] = None) -> int:
+        """Descarta las entradas afectadas por un cambio
+
+        Args:
+            since (datetime, optional): Fecha más antigua de las filas nuevas; solo
+                se descartan los rangos que terminan después. None descarta todo.
+
+        Returns:
+            int: Número de entradas descartadas
+        """
+        with self._lock:
+            if since is None:
+                keys = list(self._entries)
+            else:
+                keys = [key for key, entry in self._entries.items()
+                        if entry.end is None or entry.end > since]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            self._generation += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        """Descarta todas las entradas"""
+        self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        """Devuelve los contadores de la caché"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'ttl': self.ttl,
+            }
+
+# Caché de los análisis de damage reports
+report_cache = RangeCache(
+    ttl=float(os.getenv('DB_REPORT_CACHE_TTL', '300')),
+    max_entries=int(os.getenv('DB_REPORT_CACHE_ENTRIES', '64'))
+)
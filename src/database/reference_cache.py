@@ -0,0 +1,172 @@
+"""
+Caché de datos de referencia (tablas pequeñas que casi no cambian).
+
+Las consultas de catálogos como inches, parts o status se guardan en
+memoria durante ``DB_REF_CACHE_TTL`` segundos. Las escrituras de los
+modelos invalidan las entradas de su tabla. Al vencer el TTL, si el
+backend permite obtener una versión barata de las tablas, la entrada se
+revalida sin recargarla cuando las tablas no cambiaron; solo los cambios
+hechos desde otra terminal provocan una recarga.
+"""
+import os
+import copy
+import time
+import logging
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger('ReferenceCache')
+
+def _normalize(table: str) -> str:
+    # Los modelos usan el nombre de tabla con distintas mayúsculas
+    return table.lower()
+
+class _Entry:
+    __slots__ = ('value', 'tables', 'loaded_at', 'version')
+
+    def __init__(self, value: Any, tables: Tuple[str, ...], version: Optional[Tuple]):
+        self.value = value
+        self.tables = tables
+        self.loaded_at = time.monotonic()
+        self.version = version
+
+class ReferenceCache:
+    """Caché thread-safe de consultas de referencia con TTL e invalidación por tabla"""
+
+    def __init__(self, ttl: float = 300.0, version_check: bool = True):
+        """Inicializa la caché
+
+        Args:
+            ttl (float): Segundos que una entrada se usa sin comprobarla; 0 desactiva la caché
+            version_check (bool): Al vencer el TTL, comparar la versión de las tablas
+                antes de recargar
+        """
+        self.ttl = ttl
+        self.version_check = version_check
+        self._lock = Lock()
+        self._entries: Dict[Hashable, _Entry] = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+        # Aumenta con cada invalidación: una carga iniciada antes no se guarda
+        self._generation = 0
+
+    def get(self, key: Hashable, loader: Callable[[], Any], tables: Iterable[str],
+            db: Any = None) -> Any:
+        """Devuelve el valor en caché o lo carga con ``loader``
+
+        Args:
+            key (Hashable): Identificador de la consulta (incluye sus argumentos)
+            loader (Callable): Función que ejecuta la consulta
+            tables (Iterable[str]): Tablas de las que depende el resultado
+            db (BaseConnection, optional): Conexión para la comprobación de versión
+
+        Returns:
+            Una copia profunda del valor en caché: modificar las filas devueltas
+            no altera la caché ni lo que reciben otros llamadores
+        """
+        if self.ttl <= 0:
+            return loader()
+        tables = tuple(_normalize(table) for table in tables)
+        with self._lock:
+            entry = self._entries.get(key)
+            fresh = entry is not None and time.monotonic() - entry.loaded_at < self.ttl
+            if fresh:
+                self.hits += 1
+            generation = self._generation
+        if fresh:
+            # La copia se hace fuera del candado: las entradas no se modifican en su lugar
+            return copy.deepcopy(entry.value)
+        version = self._version(db, tables)
+        if entry is not None and version is not None and version == entry.version:
+            # Las tablas no cambiaron: se extiende la vigencia sin recargar
+            with self._lock:
+                entry.loaded_at = time.monotonic()
+                self.revalidations += 1
+            return copy.deepcopy(entry.value)
+        value = loader()
+        with self._lock:
+            self.misses += 1
+            if generation == self._generation:
+                self._entries[key] = _Entry(value, tables, version)
+        return copy.deepcopy(value)
+
+    def _version(self, db: Any, tables: Tuple[str, ...]) -> Optional[Tuple]:
+        if not self.version_check or db is None:
+            return None
+        try:
+            return db.table_versions(tables)
+        except Exception as e:
+            logger.warning(f"No se pudo obtener la versión de {', '.join(tables)}: {str(e)}")
+            return None
+
+    def invalidate(self, *tables: str) -> int:
+        """Descarta las entradas que dependen de alguna de las tablas
+
+        Returns:
+            int: Número de entradas descartadas
+        """
+        targets = {_normalize(table) for table in tables}
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if targets.intersection(entry.tables)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            self._generation += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        """Descarta todas las entradas"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Devuelve los contadores de la caché"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'invalidations': self.invalidations,
+                'ttl': self.ttl,
+            }
+
+# Caché compartida por todo el proceso
+reference_cache = ReferenceCache(
+    ttl=float(os.getenv('DB_REF_CACHE_TTL', '300')),
+    version_check=os.getenv('DB_REF_CACHE_VERSION_CHECK', '1') != '0'
+)
+
+def cached_reference(*tables: str):
+    """Decorador para métodos de modelo que leen tablas de referencia
+
+    El resultado se guarda por método y argumentos; el modelo debe tener
+    el atributo ``db`` con su conexión.
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__qualname__, args, tuple(sorted(kwargs.items())))
+            return reference_cache.get(key, lambda: method(self, *args, **kwargs),
+                                       tables, getattr(self, 'db', None))
+        return wrapper
+    return decorator
+
+def invalidates_reference(*tables: str):
+    """Decorador para métodos de modelo que escriben en tablas de referencia
+
+    Invalida las entradas de esas tablas al terminar, aunque la escritura falle.
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                reference_cache.invalidate(*tables)
+        return wrapper
+    return decorator
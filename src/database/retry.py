@@ -0,0 +1,82 @@
+"""
+Clasificación de errores transitorios y reintentos con espera exponencial.
+"""
+import random
+import time
+import logging
+from typing import Callable, Iterator, Optional, TypeVar
+from .db_exceptions import DatabaseError
+
+T = TypeVar('T')
+
+# Conexión perdida: el servidor se reinició o cerró la sesión por wait_timeout
+CR_CONN_HOST_ERROR = 2003
+CR_SERVER_GONE_ERROR = 2006
+CR_SERVER_LOST = 2013
+CR_SERVER_LOST_EXTENDED = 2055
+# Conflictos de bloqueo: la transacción puede repetirse completa
+ER_LOCK_DEADLOCK = 1213
+ER_LOCK_WAIT_TIMEOUT = 1205
+
+CONNECTION_LOST_ERRORS = frozenset({CR_CONN_HOST_ERROR, CR_SERVER_GONE_ERROR,
+                                    CR_SERVER_LOST, CR_SERVER_LOST_EXTENDED})
+LOCK_CONFLICT_ERRORS = frozenset({ER_LOCK_DEADLOCK, ER_LOCK_WAIT_TIMEOUT})
+TRANSIENT_ERRORS = CONNECTION_LOST_ERRORS | LOCK_CONFLICT_ERRORS
+
+logger = logging.getLogger('DatabaseRetry')
+
+def is_transient(error: BaseException) -> bool:
+    """Indica si un error de base de datos puede resolverse reintentando"""
+    return getattr(error, 'errno', None) in TRANSIENT_ERRORS
+
+class RetryPolicy:
+    """Política de reintentos acotados con espera exponencial y jitter"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.1, max_delay: float = 2.0):
+        """Inicializa la política
+
+        Args:
+            max_attempts (int): Intentos totales, incluido el primero
+            base_delay (float): Espera antes del primer reintento, en segundos
+            max_delay (float): Tope de la espera entre intentos, en segundos
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delays(self) -> Iterator[float]:
+        """Esperas a aplicar antes de cada reintento"""
+        for attempt in range(self.max_attempts - 1):
+            delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+            # Jitter para que varias terminales no reintenten a la vez
+            yield delay * random.uniform(0.5, 1.0)
+
+def call_with_retry(func: Callable[[], T], policy: RetryPolicy,
+                    retryable: Callable[[BaseException], bool] = is_transient,
+                    on_retry: Optional[Callable[[int, BaseException, float], None]] = None) -> T:
+    """Ejecuta ``func`` reintentando los errores transitorios
+
+    Args:
+        func (Callable): Operación idempotente a ejecutar
+        policy (RetryPolicy): Número de intentos y esperas
+        retryable (Callable): Decide si una excepción admite reintento
+        on_retry (Callable, optional): Se llama con (intento, error, espera) antes de esperar
+
+    Returns:
+        El valor devuelto por ``func``
+    """
+    delays = policy.delays()
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except DatabaseError as e:
+            delay = next(delays, None)
+            if delay is None or not retryable(e):
+                raise
+            if on_retry is not None:
+                on_retry(attempt, e, delay)
+            else:
+                logger.warning(f"Reintento {attempt} tras error transitorio: {str(e)}")
+            time.sleep(delay)
+            attempt += 1
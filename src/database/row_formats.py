@@ -0,0 +1,90 @@
+"""
+Formatos de fila para los resultados de las consultas.
+
+Por defecto cada fila es un diccionario. Para listados grandes se puede
+pedir un formato compacto: tuplas, registros con ``__slots__`` (que siguen
+admitiendo acceso por nombre de columna) o listas por columna.
+"""
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+class RowFormat:
+    DICT = 'dict'          # Un diccionario por fila (formato histórico)
+    TUPLE = 'tuple'        # Una tupla por fila, en el orden de las columnas
+    RECORD = 'record'      # Registro compacto con acceso por atributo o por clave
+    COLUMNAR = 'columnar'  # Diccionario columna -> lista de valores
+
+    ALL = (DICT, TUPLE, RECORD, COLUMNAR)
+
+class _RecordMixin:
+    """Acceso tipo diccionario para los registros generados"""
+
+    __slots__ = ()
+    _columns: Tuple[str, ...] = ()
+    _column_index: Dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._column_index[key])
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._column_index
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._column_index.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._columns
+
+    def values(self) -> Tuple[Any, ...]:
+        return tuple(self)
+
+    def items(self):
+        return zip(self._columns, self)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._columns, self))
+
+@lru_cache(maxsize=256)
+def record_class(columns: Tuple[str, ...]) -> type:
+    """Genera (una vez por conjunto de columnas) la clase de registro
+
+    Los registros son tuplas con ``__slots__`` vacíos: no tienen diccionario
+    propio y las claves de columna se comparten en la clase.
+
+    Args:
+        columns (Tuple[str, ...]): Nombres de columna del cursor
+    """
+    base = namedtuple('Record', columns, rename=True)
+    return type('Record', (_RecordMixin, base), {
+        '__slots__': (),
+        '_columns': columns,
+        '_column_index': {name: index for index, name in enumerate(columns)},
+    })
+
+def format_rows(columns: Sequence[str], rows: List[tuple], row_format: str):
+    """Convierte filas en tupla al formato solicitado
+
+    Args:
+        columns (Sequence[str]): Nombres de columna en orden
+        rows (List[tuple]): Filas tal como las devuelve un cursor sin diccionario
+        row_format (str): Uno de los valores de RowFormat
+
+    Returns:
+        Las filas en el formato pedido (lista o, para COLUMNAR, diccionario)
+    """
+    if row_format == RowFormat.TUPLE:
+        return rows if isinstance(rows, list) else list(rows)
+    if row_format == RowFormat.DICT:
+        return [dict(zip(columns, row)) for row in rows]
+    if row_format == RowFormat.RECORD:
+        make = record_class(tuple(columns))._make
+        return [make(row) for row in rows]
+    if row_format == RowFormat.COLUMNAR:
+        if not rows:
+            return {column: [] for column in columns}
+        return {column: list(values) for column, values in zip(columns, zip(*rows))}
+    raise ValueError(f"Formato de fila no soportado: {row_format}")
@@ -0,0 +1,36 @@
+"""
+Utilidades para analizar el texto de las sentencias SQL.
+"""
+import re
+
+# Literales entre comillas simples, dobles o backticks (respetando escapes)
+_QUOTED = re.compile(r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*"|`[^`]*`)""")
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_sql(query: str) -> str:
+    """Colapsa los espacios en blanco fuera de los literales de una sentencia
+
+    Dos sentencias que solo difieren en indentación o saltos de línea
+    producen el mismo texto normalizado.
+    """
+    parts = _QUOTED.split(query.strip())
+    # Las posiciones impares son los literales capturados por el split
+    return ''.join(part if i % 2 else _WHITESPACE.sub(' ', part) for i, part in enumerate(parts))
+
+def split_quoted(query: str) -> list:
+    """Separa una sentencia en fragmentos de código y literales entrecomillados
+
+    Las posiciones impares de la lista son los literales (incluidas sus
+    comillas o backticks); las pares, el texto SQL entre ellos.
+    """
+    return _QUOTED.split(query)
+
+def statement_type(query: str) -> str:
+    """Devuelve la primera palabra clave de la sentencia en mayúsculas"""
+    stripped = query.lstrip().lstrip('(')
+    keyword = stripped.split(None, 1)[0] if stripped else ''
+    return keyword.upper()
+
+def is_select(query: str) -> bool:
+    """Indica si la sentencia es una consulta de lectura"""
+    return statement_type(query) in ('SELECT', 'WITH')
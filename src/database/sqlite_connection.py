@@ -0,0 +1,335 @@
+import os
+import re
+import sqlite3
+from functools import lru_cache
+from threading import Lock, local
+from typing import Any, List, Dict, Optional, Sequence, Iterable, Iterator
+from .base_connection import BaseConnection
+from .db_exceptions import ConnectionError, QueryError, TransactionError, ER_DUP_ENTRY, ER_NO_SUCH_TABLE, query_error
+from .bulk import BulkResult, build_multi_insert, chunk_rows
+from .query_result import QueryResult
+from .row_formats import RowFormat, format_rows
+from .sql_text import split_quoted
+from .retry import ER_LOCK_WAIT_TIMEOUT
+
+# Códigos extendidos de SQLite
+SQLITE_BUSY = 5
+SQLITE_LOCKED = 6
+SQLITE_CONSTRAINT_PRIMARYKEY = 1555
+SQLITE_CONSTRAINT_UNIQUE = 2067
+
+# Límite de parámetros por sentencia (SQLITE_MAX_VARIABLE_NUMBER)
+MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+_PLACEHOLDER = re.compile(r'%s')
+
+@lru_cache(maxsize=1024)
+def translate_sql(query: str) -> str:
+    """Adapta una sentencia escrita para MySQL al dialecto de SQLite
+
+    Reemplaza los marcadores ``%s`` por ``?`` y los identificadores entre
+    backticks por identificadores entre comillas dobles, sin tocar el
+    contenido de los literales de texto.
+    """
+    parts = split_quoted(query)
+    translated = []
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            translated.append(_PLACEHOLDER.sub('?', part))
+        elif part.startswith('`'):
+            translated.append('"' + part[1:-1].replace('"', '""') + '"')
+        else:
+            translated.append(part)
+    return ''.join(translated)
+
+def _errno(error: sqlite3.Error) -> Optional[int]:
+    """Traduce el código de SQLite al código de MySQL equivalente, si existe"""
+    code = getattr(error, 'sqlite_errorcode', None)
+    if code in (SQLITE_CONSTRAINT_UNIQUE, SQLITE_CONSTRAINT_PRIMARYKEY):
+        return ER_DUP_ENTRY
+    if code is not None and code & 0xFF in (SQLITE_BUSY, SQLITE_LOCKED):
+        # Igual que una espera de bloqueo en InnoDB: la transacción puede repetirse
+        return ER_LOCK_WAIT_TIMEOUT
+    if code is None and isinstance(error, sqlite3.IntegrityError) and 'UNIQUE' in str(error):
+        return ER_DUP_ENTRY
+    if isinstance(error, sqlite3.OperationalError) and 'no such table' in str(error):
+        # SQLITE_ERROR es genérico; solo el mensaje distingue la tabla inexistente
+        return ER_NO_SUCH_TABLE
+    return code
+
+class SQLiteConnection(BaseConnection):
+    """Implementación de conexión SQLite embebida con patrón Singleton
+
+    Pensada para terminales sin red y pruebas locales. Cada hilo usa su
+    propia conexión al mismo archivo; el modo WAL permite lecturas
+    concurrentes mientras otro hilo escribe. Las sentencias escritas para
+    MySQL (``%s`` y backticks) se traducen automáticamente.
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            super().__init__()
+            self.path = os.getenv('DB_SQLITE_PATH', 'diecontrol.db')
+            self.mmap_size = int(os.getenv('DB_SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+            self.busy_timeout = float(os.getenv('DB_SQLITE_BUSY_TIMEOUT', '5'))
+            self.init_script = os.getenv('DB_SQLITE_INIT_SCRIPT')
+            self._local = local()
+            self._connections: List[sqlite3.Connection] = []
+            self._initialized = True
+
+    @property
+    def is_connected(self) -> bool:
+        """Verifica si el hilo actual tiene una conexión abierta"""
+        return getattr(self._local, 'connection', None) is not None
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Abre una conexión al archivo con WAL y memory-mapped I/O"""
+        is_new = self.path == ':memory:' or not os.path.exists(self.path)
+        # isolation_level=None: autocommit, las transacciones se abren con BEGIN explícito
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        connection.execute("PRAGMA foreign_keys=ON")
+        if is_new and self.init_script:
+            with open(self.init_script, encoding='utf-8') as f:
+                connection.executescript(translate_sql(f.read()))
+            self.logger.info(f"Esquema inicial creado desde {self.init_script}")
+        self.logger.info(f"Conexión exitosa a la base de datos SQLite {self.path}")
+        return connection
+
+    def connect(self) -> sqlite3.Connection:
+        """Obtiene (o abre) la conexión del hilo actual"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            try:
+                connection = self._open_connection()
+            except (sqlite3.Error, OSError) as e:
+                error_msg = f"Error al conectar a SQLite: {str(e)}"
+                self.logger.error(error_msg)
+                raise ConnectionError(error_msg, getattr(e, 'sqlite_errorcode', None))
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def disconnect(self) -> None:
+        """Cierra las conexiones abiertas por todos los hilos"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = local()
+        self.logger.info("Conexión cerrada")
+
+    @property
+    def in_transaction(self) -> bool:
+        """Indica si el hilo actual tiene una transacción abierta"""
+        connection = getattr(self._local, 'connection', None)
+        return connection is not None and connection.in_transaction
+
+    def _query_error(self, message: str, error: sqlite3.Error) -> QueryError:
+        # Los códigos de SQLite se traducen a los de MySQL para que los modelos
+        # traten igual, por ejemplo, una violación de UNIQUE en ambos backends
+        errno = _errno(error)
+        error_msg = f"{message}: {str(error)}"
+        if errno == ER_DUP_ENTRY:
+            self.logger.info(error_msg)
+        else:
+            self.logger.error(error_msg)
+        return query_error(error_msg, errno)
+
+    def execute_query(self, query: str, params: Optional[tuple] = None) -> QueryResult:
+        """Ejecuta una consulta SQL
+
+        Returns:
+            QueryResult: Filas devueltas (si las hay), rowcount y lastrowid
+        """
+        return self._execute(query, params, RowFormat.DICT)
+
+    def _execute(self, query: str, params: Optional[tuple], row_format: str) -> QueryResult:
+        """Ejecuta una sentencia devolviendo las filas en el formato indicado"""
+        cursor = None
+        try:
+            cursor = self.connect().cursor()
+            cursor.execute(translate_sql(query), params or ())
+            rows = None
+            if cursor.description is not None:
+                columns = [column[0] for column in cursor.description]
+                rows = format_rows(columns, cursor.fetchall(), row_format)
+            return QueryResult(rows, cursor.rowcount, cursor.lastrowid, cursor.description)
+        except sqlite3.Error as e:
+            raise self._query_error("Error al ejecutar la consulta", e)
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def fetch_all(self, query: str, params: Optional[tuple] = None,
+                  row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Ejecuta una consulta y devuelve todos los resultados
+
+        Args:
+            query (str): Consulta SELECT
+            params (tuple, optional): Parámetros de la consulta
+            row_format (str): Formato de fila (ver RowFormat); por defecto diccionarios
+        """
+        return self._execute(query, params, row_format).fetchall()
+
+    def fetch_one(self, query: str, params: Optional[tuple] = None) -> Optional[Dict]:
+        """Ejecuta una consulta y devuelve un solo resultado"""
+        return self._execute(query, params, RowFormat.DICT).fetchone()
+
+    def fetch_iter(self, query: str, params: Optional[tuple] = None,
+                   batch_size: int = 500, row_format: str = RowFormat.DICT) -> Iterator[Dict]:
+        """Ejecuta una consulta y devuelve sus filas de forma incremental
+
+        SQLite produce las filas a medida que se leen, así que la memoria
+        no crece con el tamaño del resultado.
+        """
+        cursor = None
+        try:
+            cursor = self.connect().cursor()
+            cursor.execute(translate_sql(query), params or ())
+            columns = [column[0] for column in cursor.description or ()]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if row_format == RowFormat.COLUMNAR:
+                    yield format_rows(columns, rows, row_format)
+                else:
+                    yield from format_rows(columns, rows, row_format)
+        except sqlite3.Error as e:
+            raise self._query_error("Error al ejecutar la consulta", e)
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def execute_many(self, query: str, rows: Iterable[Sequence[Any]],
+                     chunk_size: int = 1000) -> BulkResult:
+        """Ejecuta la misma sentencia para muchas filas en lotes de ``chunk_size``
+
+        Returns:
+            BulkResult: Filas afectadas y número de sentencias enviadas
+        """
+        result = BulkResult()
+        statement = translate_sql(query)
+        try:
+            with self.transaction():
+                cursor = self.connect().cursor()
+                try:
+                    for chunk in chunk_rows(rows, chunk_size):
+                        cursor.executemany(statement, chunk)
+                        result.add(cursor.rowcount)
+                finally:
+                    cursor.close()
+        except sqlite3.Error as e:
+            raise self._query_error("Error al ejecutar la consulta por lotes", e)
+        return result
+
+    def insert_many(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                    chunk_size: int = 1000) -> BulkResult:
+        """Inserta muchas filas con sentencias INSERT multi-fila
+
+        El tamaño del lote se limita además al número máximo de parámetros
+        que SQLite admite por sentencia.
+
+        Returns:
+            BulkResult: Filas insertadas y rangos de IDs generados
+        """
+        result = BulkResult()
+        max_rows = max(1, min(chunk_size, MAX_VARIABLES // max(len(columns), 1)))
+        try:
+            with self.transaction():
+                cursor = self.connect().cursor()
+                try:
+                    for chunk in chunk_rows(rows, max_rows):
+                        query = translate_sql(build_multi_insert(table, columns, len(chunk)))
+                        cursor.execute(query, [value for row in chunk for value in row])
+                        # lastrowid es el ROWID de la última fila del lote
+                        first_id = cursor.lastrowid - len(chunk) + 1 if cursor.lastrowid else None
+                        result.add(cursor.rowcount, first_id, len(chunk))
+                finally:
+                    cursor.close()
+        except sqlite3.Error as e:
+            raise self._query_error(f"Error al insertar filas en {table}", e)
+        return result
+
+    def begin_transaction(self) -> None:
+        """Inicia una transacción en la conexión del hilo actual"""
+        if self.in_transaction:
+            raise TransactionError("Ya existe una transacción activa en este hilo")
+        try:
+            # IMMEDIATE toma el bloqueo de escritura al inicio y evita deadlocks de promoción
+            self.connect().execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            error_msg = f"Error al iniciar la transacción: {str(e)}"
+            self.logger.error(error_msg)
+            raise TransactionError(error_msg, _errno(e))
+        self.logger.info("Transacción iniciada")
+
+    def commit(self) -> None:
+        """Confirma una transacción"""
+        if not self.in_transaction:
+            # Sin transacción abierta las sentencias ya se confirmaron (autocommit)
+            return
+        try:
+            self.connect().commit()
+            self.logger.info("Transacción confirmada")
+        except sqlite3.Error as e:
+            error_msg = f"Error al confirmar la transacción: {str(e)}"
+            self.logger.error(error_msg)
+            raise TransactionError(error_msg, _errno(e))
+
+    def rollback(self) -> None:
+        """Revierte una transacción"""
+        if not self.in_transaction:
+            return
+        try:
+            self.connect().rollback()
+            self.logger.info("Transacción revertida")
+        except sqlite3.Error as e:
+            error_msg = f"Error al revertir la transacción: {str(e)}"
+            self.logger.error(error_msg)
+            raise TransactionError(error_msg, _errno(e))
+
+    def estimate_row_count(self, table: str) -> int:
+        """Devuelve el número aproximado de filas de una tabla
+
+        El mayor ROWID se obtiene del extremo del árbol sin recorrer la
+        tabla; sobreestima si se borraron filas.
+        """
+        try:
+            row = self.fetch_one(f"SELECT MAX(rowid) AS row_count FROM {table}")
+        except QueryError:
+            # Tablas WITHOUT ROWID
+            return super().estimate_row_count(table)
+        return int(row['row_count'] or 0) if row else 0
+
+    def has_unique_index(self, table: str, column: str) -> Optional[bool]:
+        """Indica si la columna tiene un índice único de una sola columna"""
+        for index in self.fetch_all(f'PRAGMA index_list("{table}")'):
+            if not index['unique']:
+                continue
+            columns = self.fetch_all(f'PRAGMA index_info("{index["name"]}")')
+            if len(columns) == 1 and (columns[0]['name'] or '').lower() == column.lower():
+                return True
+        return False
+
+    def get_all_tables(self) -> List[str]:
+        """Obtiene la lista de todas las tablas en la base de datos"""
+        tables = self.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+        return [table['name'] for table in tables]
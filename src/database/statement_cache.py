@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Tuple
+from .sql_text import statement_type
+
+# Sentencias que el protocolo binario de MySQL puede preparar
+PREPARABLE_STATEMENTS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH')
+
+class StatementCacheStats:
+    """Contadores compartidos por las cachés de todas las conexiones"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.open_handles = 0
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self.open_handles += 1
+
+    def record_closed(self, count: int = 1, evicted: bool = False) -> None:
+        with self._lock:
+            self.open_handles -= count
+            if evicted:
+                self.evictions += count
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'open_handles': self.open_handles,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+class StatementCache:
+    """Caché LRU de sentencias preparadas de una conexión física
+
+    Cada entrada es un cursor preparado (``cursor(prepared=True)``) que
+    conserva el handle de la sentencia en el servidor. Al superar
+    ``capacity`` se cierra el cursor menos usado, liberando su handle.
+    """
+
+    def __init__(self, cursor_factory: Callable[[], Any], capacity: int,
+                 stats: StatementCacheStats):
+        """Inicializa la caché
+
+        Args:
+            cursor_factory (Callable): Crea un cursor preparado sobre la conexión
+            capacity (int): Máximo de sentencias preparadas abiertas
+            stats (StatementCacheStats): Contadores compartidos
+        """
+        self._cursor_factory = cursor_factory
+        self.capacity = capacity
+        self.stats = stats
+        self._cursors: 'OrderedDict[str, Any]' = OrderedDict()
+
+    @staticmethod
+    def is_preparable(query: str) -> bool:
+        """Indica si la sentencia puede ejecutarse como sentencia preparada"""
+        return statement_type(query) in PREPARABLE_STATEMENTS
+
+    def get(self, key: str, query: str) -> Tuple[Any, str, bool]:
+        """Obtiene el cursor preparado para una sentencia normalizada
+
+        El driver solo reutiliza la sentencia preparada si recibe el mismo
+        texto, por eso se devuelve también el texto con el que se preparó.
+
+        Args:
+            key (str): Texto normalizado de la sentencia
+            query (str): Texto original a preparar si no está en caché
+
+        Returns:
+            Tuple[Any, str, bool]: Cursor, texto a ejecutar y si fue un acierto
+        """
+        entry = self._cursors.get(key)
+        if entry is not None:
+            self._cursors.move_to_end(key)
+            self.stats.record(hit=True)
+            return entry[0], entry[1], True
+        cursor = self._cursor_factory()
+        self._cursors[key] = (cursor, query)
+        self.stats.record(hit=False)
+        while len(self._cursors) > self.capacity:
+            _, (oldest, _) = self._cursors.popitem(last=False)
+            self._close_cursor(oldest)
+            self.stats.record_closed(evicted=True)
+        return cursor, query, False
+
+    def discard(self, key: str) -> None:
+        """Elimina una sentencia de la caché (por ejemplo tras un error)"""
+        entry = self._cursors.pop(key, None)
+        if entry is not None:
+            self._close_cursor(entry[0])
+            self.stats.record_closed()
+
+    def clear(self, close: bool = True) -> None:
+        """Vacía la caché
+
+        Args:
+            close (bool): Liberar los handles en el servidor; usar False cuando
+                la conexión se va a cerrar de todos modos
+        """
+        cursors, self._cursors = [entry[0] for entry in self._cursors.values()], OrderedDict()
+        if close:
+            for cursor in cursors:
+                self._close_cursor(cursor)
+        self.stats.record_closed(len(cursors))
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    @staticmethod
+    def _close_cursor(cursor: Any) -> None:
+        try:
+            cursor.close()
+        except Exception:
+            pass
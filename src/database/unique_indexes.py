@@ -0,0 +1,105 @@
+"""
+Índices únicos en los que confían los modelos.
+
+Los modelos escriben directamente y dejan que el índice único rechace los
+duplicados (ver ``execute_write``). Los índices se crean con
+``scripts/create_unique_indexes.py``, que omite las tablas que ya tienen
+valores repetidos. Mientras falte alguno, ``check_unique_indexes`` lo
+informa al iniciar la aplicación y ``execute_unique_write`` vuelve a
+consultar si el valor existe antes de escribir, como se hacía antes de
+los índices.
+"""
+import os
+import time
+import logging
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+from .backend import get_connection
+from .write_result import WriteResult, execute_write
+
+logger = logging.getLogger('UniqueIndexes')
+
+# (tabla, nombre del índice, columna) que deben rechazar los duplicados
+UNIQUE_INDEXES = [
+    ('serials', 'uq_serials_serial', 'Serial'),
+    ('line', 'uq_line_line', 'Line'),
+    ('die_description', 'uq_die_description_die_description', 'Die_Description'),
+    ('status_seril', 'uq_status_seril_status', 'Status'),
+    ('dr_status', 'uq_dr_status_status', 'Status'),
+    ('dr_description', 'uq_dr_description_description', 'description'),
+]
+
+# Segundos antes de volver a comprobar un índice que faltaba
+UNIQUE_RECHECK_SECONDS = float(os.getenv('DB_UNIQUE_RECHECK', '300'))
+
+_lock = Lock()
+# (tabla, columna) → (falta el índice, momento de la comprobación)
+_missing: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+
+def unique_index_missing(db, table: str, column: str) -> bool:
+    """Indica si falta el índice único de ``table.column``
+
+    Un índice presente no se vuelve a comprobar; uno ausente se comprueba
+    de nuevo cada UNIQUE_RECHECK_SECONDS. Si el backend no puede
+    informarlo, se supone ausente (la consulta previa es segura).
+    """
+    key = (table.lower(), column.lower())
+    with _lock:
+        entry = _missing.get(key)
+    if entry is not None and (not entry[0] or time.monotonic() - entry[1] < UNIQUE_RECHECK_SECONDS):
+        return entry[0]
+    try:
+        missing = db.has_unique_index(table, column) is not True
+    except Exception as e:
+        logger.warning(f"No se pudo comprobar el índice único de {table}.{column}: {str(e)}")
+        return True
+    with _lock:
+        _missing[key] = (missing, time.monotonic())
+    return missing
+
+def check_unique_indexes(db=None) -> List[str]:
+    """Comprueba al iniciar que existan todos los índices únicos
+
+    Returns:
+        List[str]: ``tabla.columna`` de los índices que faltan (cada uno se registra
+        como error; sus modelos consultan antes de escribir)
+    """
+    db = db or get_connection()
+    missing = []
+    for table, index_name, column in UNIQUE_INDEXES:
+        if unique_index_missing(db, table, column):
+            missing.append(f"{table}.{column}")
+            logger.error(f"Falta el índice único {index_name} en {table}.{column}; se consultará "
+                         "antes de cada escritura. Ejecute scripts/create_unique_indexes.py")
+    return missing
+
+def execute_unique_write(db, query: str, params: tuple, table: str, column: str, value: Any,
+                         id_column: Optional[str] = None,
+                         exclude_id: Optional[int] = None) -> WriteResult:
+    """Ejecuta una escritura que no debe repetir ``value`` en ``table.column``
+
+    Con el índice único presente equivale a ``execute_write``; si falta,
+    primero consulta si otro registro ya tiene el valor.
+
+    Args:
+        db (BaseConnection): Conexión a usar
+        query (str): INSERT o UPDATE parametrizado
+        params (tuple): Parámetros de la sentencia
+        table (str): Tabla con el valor único
+        column (str): Columna con el valor único
+        value: Valor que se escribe en ``column``
+        id_column (str, optional): Columna ID de la tabla (para excluir el registro editado)
+        exclude_id (int, optional): ID del registro que se actualiza
+
+    Returns:
+        WriteResult: ``duplicate=True`` si el valor ya existía
+    """
+    if unique_index_missing(db, table, column):
+        check = f"SELECT 1 AS found FROM {table} WHERE {column} = %s"
+        check_params: tuple = (value,)
+        if id_column is not None and exclude_id is not None:
+            check += f" AND {id_column} != %s"
+            check_params += (exclude_id,)
+        if db.fetch_one(check, check_params):
+            return WriteResult(False, duplicate=True, key=column)
+    return execute_write(db, query, params)
@@ -0,0 +1,61 @@
+from typing import Optional
+from .db_exceptions import DuplicateKeyError
+
+class WriteResult:
+    """Resultado estructurado de una escritura de un modelo
+
+    Es verdadero solo si la escritura se realizó, de modo que el código que
+    hace ``if model.createX(...):`` sigue funcionando, y además indica si
+    falló por un valor duplicado (violación de un índice único).
+    """
+
+    def __init__(self, ok: bool, duplicate: bool = False, id: Optional[int] = None,
+                 rowcount: int = 0, key: Optional[str] = None):
+        """Inicializa el resultado
+
+        Args:
+            ok (bool): La escritura se realizó
+            duplicate (bool): Falló porque el valor ya existe
+            id (int, optional): ID generado por un INSERT
+            rowcount (int): Filas afectadas
+            key (str, optional): Índice único que detectó el duplicado
+        """
+        self.ok = ok
+        self.duplicate = duplicate
+        self.id = id
+        self.rowcount = rowcount
+        self.key = key
+
+    @classmethod
+    def failed(cls) -> 'WriteResult':
+        """Escritura rechazada antes de llegar a la base de datos (p. ej. validación)"""
+        return cls(False)
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self) -> str:
+        if self.duplicate:
+            return f"WriteResult(duplicate=True, key={self.key!r})"
+        return f"WriteResult(ok={self.ok}, id={self.id}, rowcount={self.rowcount})"
+
+def execute_write(db, query: str, params: Optional[tuple] = None) -> WriteResult:
+    """Ejecuta una escritura y traduce la violación de un índice único
+
+    En lugar de consultar antes si el valor existe, la escritura se envía
+    directamente y el índice único decide; así se ahorra un viaje a la base
+    y dos terminales no pueden crear el mismo valor a la vez.
+
+    Args:
+        db (BaseConnection): Conexión a usar
+        query (str): INSERT o UPDATE parametrizado
+        params (tuple, optional): Parámetros de la sentencia
+
+    Returns:
+        WriteResult: ``duplicate=True`` si el valor ya existía
+    """
+    try:
+        result = db.execute_query(query, params)
+    except DuplicateKeyError as e:
+        return WriteResult(False, duplicate=True, key=e.key)
+    return WriteResult(True, id=result.lastrowid or None, rowcount=max(result.rowcount, 0))
@@ -3,9 +3,13 @@ from PyQt5.QtWidgets import QApplication
 from views.login_window import LoginWindow
 from views.main_window import MainWindow
 from models.user_model import UserModel
+from database.unique_indexes import check_unique_indexes
 
 def main():
     app = QApplication(sys.argv)
+
+    # Los modelos confían en los índices únicos; los que falten se informan
+    check_unique_indexes()
     
     # Mostrar ventana de login
     login = LoginWindow()
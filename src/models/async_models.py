@@ -0,0 +1,109 @@
+"""
+Variantes asíncronas de los modelos.
+
+Cada clase envuelve al modelo síncrono correspondiente y expone los mismos
+métodos como corrutinas que se ejecutan en el pool de hilos del
+AsyncConnection, por ejemplo:
+
+    serials = await AsyncSerialModel().getAllSerials()
+
+Los atributos que no son métodos (``table``, ``db``...) se devuelven tal cual.
+"""
+import functools
+from typing import Any, Optional
+from database.async_connection import AsyncConnection, get_async_connection
+from models.damage_report_model import DamageReportModel
+from models.description_model import DescriptionModel
+from models.die_description_model import DieDescriptionModel
+from models.dr_description_model import DRDescriptionModel
+from models.dr_status_model import DRStatusModel
+from models.explanation_model import ExplanationModel
+from models.inch_model import InchModel
+from models.line_model import LineModel
+from models.part_model import PartModel
+from models.position_model import PositionModel
+from models.product_model import ProductModel
+from models.role_model import RoleModel
+from models.serial_model import SerialModel
+from models.status_model import StatusModel
+from models.user_model import UserModel
+from models.worker_model import WorkerModel
+
+class AsyncModel:
+    """Envoltura asíncrona de un modelo síncrono"""
+
+    model_class: Optional[type] = None
+
+    def __init__(self, model: Any = None, connection: Optional[AsyncConnection] = None):
+        """Inicializa la envoltura
+
+        Args:
+            model (optional): Instancia del modelo síncrono; por defecto ``model_class()``
+            connection (AsyncConnection, optional): Adaptador a usar; por defecto el compartido
+        """
+        self._model = model if model is not None else self.model_class()
+        self._connection = connection or get_async_connection()
+
+    @property
+    def sync(self) -> Any:
+        """Modelo síncrono envuelto"""
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._model, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+            return await self._connection.run(attribute, *args, **kwargs)
+
+        return call
+
+class AsyncDamageReportModel(AsyncModel):
+    model_class = DamageReportModel
+
+class AsyncDescriptionModel(AsyncModel):
+    model_class = DescriptionModel
+
+class AsyncDieDescriptionModel(AsyncModel):
+    model_class = DieDescriptionModel
+
+class AsyncDRDescriptionModel(AsyncModel):
+    model_class = DRDescriptionModel
+
+class AsyncDRStatusModel(AsyncModel):
+    model_class = DRStatusModel
+
+class AsyncExplanationModel(AsyncModel):
+    model_class = ExplanationModel
+
+class AsyncInchModel(AsyncModel):
+    model_class = InchModel
+
+class AsyncLineModel(AsyncModel):
+    model_class = LineModel
+
+class AsyncPartModel(AsyncModel):
+    model_class = PartModel
+
+class AsyncPositionModel(AsyncModel):
+    model_class = PositionModel
+
+class AsyncProductModel(AsyncModel):
+    model_class = ProductModel
+
+class AsyncRoleModel(AsyncModel):
+    model_class = RoleModel
+
+class AsyncSerialModel(AsyncModel):
+    model_class = SerialModel
+
+class AsyncStatusModel(AsyncModel):
+    model_class = StatusModel
+
+class AsyncUserModel(AsyncModel):
+    model_class = UserModel
+
+class AsyncWorkerModel(AsyncModel):
+    model_class = WorkerModel
@@ -0,0 +1,242 @@
+"""
+Base declarativa para los modelos de catálogo.
+
+Los modelos de tablas de referencia (inches, parts, status...) solo
+difieren en el nombre de la tabla y de sus columnas. Cada subclase declara
+esos datos y la base genera sus sentencias SQL una sola vez, al definirse
+la clase; todas las instancias reutilizan el mismo texto, lo que además
+aprovecha la caché de sentencias preparadas de la conexión.
+
+    class InchModel(BaseRepository):
+        table = Tables.INCHES
+        id_column = Columns.Inches.ID
+        columns = (Columns.Inches.INCH,)
+        max_lengths = {Columns.Inches.INCH: 5}
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from database.backend import get_connection
+from database.bulk import BulkResult
+from database.reference_cache import reference_cache
+from database.row_formats import RowFormat
+from database.pagination import Page, SortKey, fetch_page
+from database.write_result import WriteResult, execute_write
+from database.unique_indexes import execute_unique_write
+
+class BaseRepository:
+    """Operaciones CRUD, masivas, paginadas y en caché de una tabla de catálogo"""
+
+    # Declaración de la subclase
+    table: str = ''
+    id_column: str = ''
+    columns: Tuple[str, ...] = ()
+    order_by: Optional[str] = None  # Por defecto la primera columna de ``columns``
+    max_lengths: Dict[str, int] = {}
+    cache_tables: Tuple[str, ...] = ()  # Por defecto ``(table,)``
+    unique_column: Optional[str] = None  # Columna de ``columns`` con índice único
+
+    # Generados por __init_subclass__
+    PAGE_SORTS: Dict[str, Tuple[SortKey, ...]] = {}
+    DEFAULT_SORT: str = 'id'
+    SEARCH_COLUMNS: Tuple[str, ...] = ()  # Por defecto ``(order_by,)``
+    PAGE_FILTERS: Dict[str, str] = {}
+    _sql: Dict[str, str] = {}
+
+    # Máximo de IDs por consulta en get_many()
+    MAX_IDS_PER_QUERY = 500
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.table:
+            return
+        cls.order_by = cls.order_by or cls.columns[0]
+        cls.cache_tables = cls.cache_tables or (cls.table,)
+        cls._sql = cls._build_sql()
+        if 'PAGE_SORTS' not in cls.__dict__:
+            cls.PAGE_SORTS = {
+                cls.order_by.lower(): (SortKey(cls.order_by, cls.order_by),
+                                       SortKey(cls.id_column, cls.id_column)),
+                'id': (SortKey(cls.id_column, cls.id_column),),
+            }
+            cls.DEFAULT_SORT = cls.order_by.lower()
+        if 'SEARCH_COLUMNS' not in cls.__dict__:
+            cls.SEARCH_COLUMNS = (cls.order_by,)
+
+    @classmethod
+    def _build_sql(cls) -> Dict[str, str]:
+        """Genera las sentencias de la entidad"""
+        fields = ', '.join((cls.id_column,) + tuple(cls.columns))
+        placeholders = ', '.join(['%s'] * len(cls.columns))
+        assignments = ', '.join(f"{column} = %s" for column in cls.columns)
+        select = f"SELECT {fields} FROM {cls.table}"
+        return {
+            'select': select,
+            'all': f"{select} ORDER BY {cls.order_by}",
+            'by_id': f"{select} WHERE {cls.id_column} = %s",
+            'insert': f"INSERT INTO {cls.table} ({', '.join(cls.columns)}) VALUES ({placeholders})",
+            'update': f"UPDATE {cls.table} SET {assignments} WHERE {cls.id_column} = %s",
+            'delete': f"DELETE FROM {cls.table} WHERE {cls.id_column} = %s",
+        }
+
+    def __init__(self):
+        """Inicializa el modelo con la conexión del backend configurado"""
+        self.db = get_connection()
+
+    def _values(self, values: Sequence[Any]) -> Optional[tuple]:
+        """Valida los valores de ``columns``; devuelve None si alguno no es válido"""
+        if len(values) != len(self.columns):
+            raise TypeError(f"{type(self).__name__} espera {len(self.columns)} valores, "
+                            f"se recibieron {len(values)}")
+        for column, value in zip(self.columns, values):
+            limit = self.max_lengths.get(column)
+            if limit is not None and value is not None and len(value) > limit:
+                return None
+        return tuple(values)
+
+    def _write(self, query: str, params: tuple, values: tuple,
+               record_id: Optional[int] = None) -> WriteResult:
+        if self.unique_column is None:
+            return execute_write(self.db, query, params)
+        value = values[self.columns.index(self.unique_column)]
+        return execute_unique_write(self.db, query, params, self.table, self.unique_column, value,
+                                    self.id_column, record_id)
+
+    def _invalidate(self) -> None:
+        reference_cache.invalidate(*self.cache_tables)
+
+    def all(self) -> List[Dict]:
+        """Obtiene todos los registros ordenados por ``order_by`` (en caché)
+
+        Returns:
+            List[Dict]: Lista de diccionarios con los datos de los registros
+        """
+        return reference_cache.get((type(self).__qualname__, 'all'),
+                                   lambda: self.db.fetch_all(self._sql['all']),
+                                   self.cache_tables, self.db)
+
+    def get(self, record_id: int) -> Optional[Dict]:
+        """Obtiene un registro por su ID
+
+        Args:
+            record_id (int): ID del registro a buscar
+
+        Returns:
+            Optional[Dict]: Diccionario con los datos del registro o None si no existe
+        """
+        return self.db.fetch_one(self._sql['by_id'], (record_id,))
+
+    def get_many(self, record_ids: Iterable[int]) -> Dict[int, Dict]:
+        """Obtiene varios registros por ID en pocas consultas
+
+        Args:
+            record_ids (Iterable[int]): IDs a buscar
+
+        Returns:
+            Dict[int, Dict]: Registros encontrados indexados por ID
+        """
+        ids = list(dict.fromkeys(record_ids))
+        found: Dict[int, Dict] = {}
+        for start in range(0, len(ids), self.MAX_IDS_PER_QUERY):
+            chunk = ids[start:start + self.MAX_IDS_PER_QUERY]
+            query = f"{self._sql['select']} WHERE {self.id_column} IN ({', '.join(['%s'] * len(chunk))})"
+            for row in self.db.fetch_all(query, tuple(chunk)):
+                found[row[self.id_column]] = row
+        return found
+
+    def create(self, *values: Any) -> WriteResult:
+        """Crea un registro
+
+        Args:
+            *values: Un valor por cada columna de ``columns``
+
+        Returns:
+            WriteResult: Verdadero si se creó; ``duplicate`` si ``unique_column`` ya tiene el valor
+        """
+        params = self._values(values)
+        if params is None:
+            return WriteResult.failed()
+        try:
+            return self._write(self._sql['insert'], params, params)
+        finally:
+            self._invalidate()
+
+    def update(self, record_id: int, *values: Any) -> WriteResult:
+        """Actualiza un registro existente
+
+        Args:
+            record_id (int): ID del registro a actualizar
+            *values: Nuevo valor de cada columna de ``columns``
+
+        Returns:
+            WriteResult: Verdadero si se actualizó; ``duplicate`` si ``unique_column`` ya tiene el valor
+        """
+        params = self._values(values)
+        if params is None:
+            return WriteResult.failed()
+        try:
+            return self._write(self._sql['update'], params + (record_id,), params, record_id)
+        finally:
+            self._invalidate()
+
+    def delete(self, record_id: int) -> bool:
+        """Elimina un registro
+
+        Args:
+            record_id (int): ID del registro a eliminar
+
+        Returns:
+            bool: True si se eliminó correctamente, False en caso contrario
+        """
+        try:
+            return bool(self.db.execute_query(self._sql['delete'], (record_id,)))
+        finally:
+            self._invalidate()
+
+    def create_many(self, rows: Iterable[Sequence[Any]], chunk_size: int = 1000) -> BulkResult:
+        """Inserta muchos registros con INSERT multi-fila en una transacción
+
+        Args:
+            rows (Iterable[Sequence]): Valores de ``columns`` por registro
+            chunk_size (int): Filas por sentencia
+
+        Returns:
+            BulkResult: Filas insertadas e IDs generados
+
+        Raises:
+            ValueError: Si algún registro no pasa la validación de longitud
+        """
+        checked = []
+        for values in rows:
+            params = self._values(tuple(values))
+            if params is None:
+                raise ValueError(f"Valor demasiado largo para {self.table}: {values!r}")
+            checked.append(params)
+        try:
+            return self.db.insert_many(self.table, self.columns, checked, chunk_size)
+        finally:
+            self._invalidate()
+
+    def page(self, after_key: Optional[tuple] = None, limit: int = 100,
+             sort: Optional[str] = None,
+             row_format: str = RowFormat.DICT, search: Optional[str] = None,
+             filters: Optional[Dict[str, Any]] = None) -> Page:
+        """Obtiene una página de registros con paginación por clave
+
+        Args:
+            after_key (tuple, optional): ``next_key`` de la página anterior; None para la primera
+            limit (int): Registros por página
+            sort (str, optional): Uno de PAGE_SORTS; con prefijo ``-`` en orden descendente
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+            search (str, optional): Texto a buscar en SEARCH_COLUMNS (subcadena por término)
+            filters (Dict[str, Any], optional): Valor por filtro de PAGE_FILTERS (None no filtra)
+
+        Returns:
+            Page: Registros de la página y clave de la siguiente
+        """
+        return fetch_page(self.db, self._sql['select'], self.PAGE_SORTS, self.DEFAULT_SORT,
+                          after_key, limit, sort, row_format=row_format,
+                          search=search, search_columns=self.SEARCH_COLUMNS,
+                          filters=filters, filter_columns=self.PAGE_FILTERS)
+
+    def estimate_count(self) -> int:
+        """Número aproximado de registros (para barras de desplazamiento)"""
+        return self.db.estimate_row_count(self.table)
@@ -0,0 +1,422 @@
+"""
+Análisis de damage reports (Pareto, conteos agrupados, tasas y tendencias).
+
+Los reportes de un rango de fechas se leen con un cursor incremental en
+formato columnar y se guardan como arreglos de NumPy (``ReportFrame``);
+todos los cálculos son operaciones vectorizadas sobre esos arreglos. El
+rango leído y cada resultado se guardan en ``report_cache``, de modo que
+los tableros no vuelven a recorrer la tabla en cada vista.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from database.backend import get_connection
+from database.reference_cache import cached_reference, reference_cache
+from database.range_cache import RangeCache, report_cache
+from database.database_schema import Tables, Columns
+from database.row_formats import RowFormat
+from models.damage_report_model import DamageReportModel
+
+DR = Columns.DamageReport
+
+# ID usado para las referencias NULL
+MISSING = -1
+
+# Etiqueta de las referencias NULL o inexistentes
+MISSING_LABEL = '(none)'
+
+# Unidades de tiempo de trend(): (unidad de datetime64, paso)
+BUCKETS = {
+    'hour': ('h', 1),
+    'day': ('D', 1),
+    'week': ('D', 7),
+    'month': ('M', 1),
+}
+
+class ReportFrame:
+    """Reportes de un rango en arreglos de NumPy, una columna por arreglo"""
+
+    # Columnas leídas; todas son IDs enteros salvo create_time
+    COLUMNS = ('report_id', 'create_time', 'serial_id', 'line_id', 'product_id',
+               'die_description_id', 'explanation_id', 'operator_id', 'supervisor_id',
+               'dr_description_id', 'dr_status_id')
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Dict[str, List[Any]]]) -> 'ReportFrame':
+        """Construye el frame con los bloques columnares de ``fetch_iter``
+
+        Args:
+            chunks (Iterable[Dict]): Diccionarios columna → lista de valores
+        """
+        parts: Dict[str, List[np.ndarray]] = {column: [] for column in cls.COLUMNS}
+        for chunk in chunks:
+            for column in cls.COLUMNS:
+                parts[column].append(_to_array(column, chunk[column]))
+        return cls({column: np.concatenate(arrays) if arrays else _to_array(column, [])
+                    for column, arrays in parts.items()})
+
+    def __len__(self) -> int:
+        return len(self.arrays['report_id'])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.arrays[column]
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por los arreglos"""
+        return sum(array.nbytes for array in self.arrays.values())
+
+def _to_array(column: str, values: List[Any]) -> np.ndarray:
+    """Convierte una columna del cursor en un arreglo tipado"""
+    if column == 'create_time':
+        # Acepta datetime (MySQL) y texto ISO (SQLite); NULL queda como NaT
+        return np.array(values, dtype='datetime64[s]')
+    array = np.array(values, dtype=object)
+    return np.where(array == None, MISSING, array).astype(np.int64)  # noqa: E711
+
+def group_counts(ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Cuenta las filas por ID, de mayor a menor (empates por ID)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: IDs y conteos
+    """
+    keys, counts = np.unique(ids, return_counts=True)
+    order = np.lexsort((keys, -counts))
+    return keys[order], counts[order]
+
+def distinct_pairs_per_group(groups: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Cuenta los valores distintos de ``values`` dentro de cada grupo
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: IDs de grupo (ordenados) y número de valores distintos
+    """
+    if len(groups) == 0:
+        return groups[:0], np.zeros(0, dtype=np.int64)
+    pairs = np.unique(np.stack((groups, values), axis=1), axis=0)
+    return np.unique(pairs[:, 0], return_counts=True)
+
+def bucket_times(times: np.ndarray, bucket: str) -> Tuple[np.ndarray, int]:
+    """Redondea las fechas hacia abajo a la unidad pedida
+
+    Las semanas empiezan en lunes.
+
+    Returns:
+        Tuple[np.ndarray, int]: Fechas redondeadas y paso entre grupos consecutivos
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unidad no permitida: {bucket} (opciones: {', '.join(BUCKETS)})")
+    unit, step = BUCKETS[bucket]
+    rounded = times.astype(f'datetime64[{unit}]')
+    if bucket == 'week':
+        # El 1970-01-01 fue jueves: se restan los días transcurridos desde el lunes
+        days = rounded.astype(np.int64)
+        rounded = (days - (days + 3) % 7).astype('datetime64[D]')
+    return rounded, step
+
+class DamageReportAnalytics:
+    """Vistas de Pareto, conteos y tendencias de los damage reports"""
+
+    # Agrupaciones permitidas: nombre → columna del ReportFrame
+    GROUPINGS = {
+        'line': 'line_id',
+        'product': 'product_id',
+        'die_description': 'die_description_id',
+        'explanation': 'explanation_id',
+        'operator': 'operator_id',
+        'supervisor': 'supervisor_id',
+        'dr_description': 'dr_description_id',
+        'dr_status': 'dr_status_id',
+        'serial': 'serial_id',
+    }
+
+    # Filas leídas por bloque del cursor
+    BATCH_SIZE = 5000
+
+    def __init__(self, cache: Optional[RangeCache] = None):
+        """Inicializa el análisis
+
+        Args:
+            cache (RangeCache, optional): Caché a usar; por defecto la compartida
+        """
+        self.db = get_connection()
+        self.cache = cache or report_cache
+        self.reportModel = DamageReportModel()
+
+    # Lectura
+
+    def _frame_query(self, start: Optional[datetime], end: Optional[datetime]) -> Tuple[str, tuple]:
+        """Consulta de los reportes del rango [start, end)"""
+        conditions = []
+        params = []
+        if start is not None:
+            conditions.append(f"r.{DR.CREATE_TIME} >= %s")
+            params.append(start)
+        if end is not None:
+            conditions.append(f"r.{DR.CREATE_TIME} < %s")
+            params.append(end)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT r.{DR.ID} as report_id, r.{DR.CREATE_TIME} as create_time,
+                   r.{DR.SERIAL_ID} as serial_id, r.{DR.LINE_ID} as line_id,
+                   r.{DR.PRODUCT_ID} as product_id,
+                   s.{Columns.Serials.DIE_DESCRIPTION_ID} as die_description_id,
+                   r.{DR.EXPLANATION_ID} as explanation_id, r.{DR.OPERATOR_ID} as operator_id,
+                   r.{DR.SUPERVISOR_ID} as supervisor_id,
+                   r.{DR.DR_DESCRIPTION_ID} as dr_description_id,
+                   r.{DR.DR_STATUS_ID} as dr_status_id
+            FROM {Tables.DAMAGE_REPORT} r
+            LEFT JOIN {Tables.SERIALS} s ON r.{DR.SERIAL_ID} = s.{Columns.Serials.ID}
+            {where}
+        """
+        return query, tuple(params)
+
+    def load(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> ReportFrame:
+        """Lee (o toma de la caché) los reportes del rango [start, end)
+
+        Args:
+            start (datetime, optional): Inicio del rango; None sin límite
+            end (datetime, optional): Fin del rango (excluido); None sin límite
+
+        Returns:
+            ReportFrame: Reportes del rango
+        """
+        def read() -> ReportFrame:
+            query, params = self._frame_query(start, end)
+            chunks = self.db.fetch_iter(query, params, batch_size=self.BATCH_SIZE,
+                                        row_format=RowFormat.COLUMNAR)
+            return ReportFrame.from_chunks(chunks)
+
+        return self.cache.get(('frame', start, end), end, read)
+
+    def _column(self, grouping: str) -> str:
+        if grouping not in self.GROUPINGS:
+            raise ValueError(f"Agrupación no permitida: {grouping} "
+                             f"(opciones: {', '.join(self.GROUPINGS)})")
+        return self.GROUPINGS[grouping]
+
+    def _counts(self, start: Optional[datetime], end: Optional[datetime],
+                grouping: str) -> Tuple[np.ndarray, np.ndarray]:
+        column = self._column(grouping)
+        return self.cache.get(('counts', start, end, grouping), end,
+                              lambda: group_counts(self.load(start, end)[column]))
+
+    # Etiquetas
+
+    @cached_reference(Tables.DIE_DESCRIPTION)
+    def getDieDescriptionLabels(self) -> Dict[int, str]:
+        """Obtiene el mapa id_die_description → Die_Description, incluidos los obsoletos"""
+        query = f"""
+            SELECT {Columns.DieDescription.ID}, {Columns.DieDescription.DIE_DESCRIPTION}
+            FROM {Tables.DIE_DESCRIPTION}
+        """
+        return {row[Columns.DieDescription.ID]: row[Columns.DieDescription.DIE_DESCRIPTION]
+                for row in self.db.fetch_all(query)}
+
+    def _labelMap(self, grouping: str) -> Dict[int, str]:
+        """Mapa ID → texto de un catálogo, guardado en la caché de referencia por tabla"""
+        if grouping == 'die_description':
+            return self.getDieDescriptionLabels()
+        model = self.reportModel
+        sources = {
+            'line': (Tables.LINE, model.lineModel.getAllLines, Columns.Lines.ID, Columns.Lines.LINE),
+            'product': (Tables.PRODUCTS, model.getAllProducts, 'id_product', 'Product'),
+            'explanation': (Tables.EXPLANATION, model.explanationModel.getAllExplanations,
+                            Columns.Explanation.ID, Columns.Explanation.EXPLANATION),
+            'operator': (Tables.WORKERS, model.getAllWorkers, Columns.Workers.ID, Columns.Workers.NAME),
+            'supervisor': (Tables.WORKERS, model.getAllWorkers, Columns.Workers.ID, Columns.Workers.NAME),
+            'dr_description': (Tables.DR_DESCRIPTION, model.drDescriptionModel.getAllDescriptions,
+                               Columns.DRDescription.ID, Columns.DRDescription.DESCRIPTION),
+            'dr_status': (Tables.DR_STATUS, model.drStatusModel.getAllStatus,
+                          Columns.DRStatus.ID, Columns.DRStatus.STATUS),
+        }
+        table, loader, id_column, text_column = sources[grouping]
+        return reference_cache.get(
+            ('DamageReportAnalytics.labels', table),
+            lambda: {row[id_column]: row[text_column] for row in loader()},
+            (table,), self.db)
+
+    def labels(self, grouping: str, keys: Iterable[int]) -> Dict[int, str]:
+        """Devuelve el texto de los IDs de una agrupación
+
+        Los serials se consultan solo por ``keys`` y se guardan en ``cache``
+        (un cambio de número se ve al vencer su TTL); los demás catálogos se
+        leen completos de la caché de referencia.
+
+        Args:
+            grouping (str): Una de GROUPINGS
+            keys (Iterable[int]): IDs que se van a mostrar
+
+        Returns:
+            Dict[int, str]: ID → texto (los IDs inexistentes no aparecen)
+        """
+        self._column(grouping)
+        if grouping != 'serial':
+            return self._labelMap(grouping)
+        ids = tuple(int(key) for key in keys if key != MISSING)
+        if not ids:
+            return {}
+        return self.cache.get(('serial_labels', ids), None,
+                              lambda: self.reportModel.getSerialLabels(ids))
+
+    def _label(self, labels: Dict[int, str], key: int) -> str:
+        if key == MISSING:
+            return MISSING_LABEL
+        return str(labels.get(key, f"#{key}"))
+
+    # Resultados
+
+    def grouped_counts(self, grouping: str, start: Optional[datetime] = None,
+                       end: Optional[datetime] = None, top: Optional[int] = None) -> List[Dict]:
+        """Número de reportes por grupo, de mayor a menor
+
+        Args:
+            grouping (str): Una de GROUPINGS
+            start (datetime, optional): Inicio del rango
+            end (datetime, optional): Fin del rango (excluido)
+            top (int, optional): Máximo de grupos devueltos
+
+        Returns:
+            List[Dict]: id, label y count de cada grupo
+        """
+        keys, counts = self._counts(start, end, grouping)
+        if top is not None:
+            keys, counts = keys[:top], counts[:top]
+        labels = self.labels(grouping, keys)
+        return [{'id': int(key), 'label': self._label(labels, int(key)), 'count': int(count)}
+                for key, count in zip(keys, counts)]
+
+    def pareto(self, grouping: str, start: Optional[datetime] = None,
+               end: Optional[datetime] = None, top: Optional[int] = None,
+               threshold: float = 0.8) -> List[Dict]:
+        """Vista de Pareto: grupos de mayor a menor con su porcentaje acumulado
+
+        Args:
+            grouping (str): Una de GROUPINGS
+            start (datetime, optional): Inicio del rango
+            end (datetime, optional): Fin del rango (excluido)
+            top (int, optional): Máximo de grupos devueltos
+            threshold (float): Proporción acumulada que delimita los grupos "vitales"
+
+        Returns:
+            List[Dict]: id, label, count, share, cumulative y vital de cada grupo
+        """
+        keys, counts = self._counts(start, end, grouping)
+        total = counts.sum()
+        if total == 0:
+            return []
+        shares = counts / total
+        cumulative = np.cumsum(shares)
+        # Un grupo es vital si el acumulado anterior aún no alcanzaba el umbral
+        vital = (cumulative - shares) < threshold
+        limit = len(keys) if top is None else min(top, len(keys))
+        labels = self.labels(grouping, keys[:limit])
+        return [{
+            'id': int(keys[i]),
+            'label': self._label(labels, int(keys[i])),
+            'count': int(counts[i]),
+            'share': float(shares[i]),
+            'cumulative': float(cumulative[i]),
+            'vital': bool(vital[i]),
+        } for i in range(limit)]
+
+    def rates_per_serial(self, grouping: str, start: Optional[datetime] = None,
+                         end: Optional[datetime] = None, top: Optional[int] = None) -> List[Dict]:
+        """Reportes, serials afectados y reportes por serial de cada grupo
+
+        Args:
+            grouping (str): Una de GROUPINGS
+            start (datetime, optional): Inicio del rango
+            end (datetime, optional): Fin del rango (excluido)
+            top (int, optional): Máximo de grupos devueltos
+
+        Returns:
+            List[Dict]: id, label, reports, serials y per_serial, de mayor a menor tasa
+        """
+        column = self._column(grouping)
+
+        def compute() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            frame = self.load(start, end)
+            keys, reports = np.unique(frame[column], return_counts=True)
+            _, serials = distinct_pairs_per_group(frame[column], frame['serial_id'])
+            return keys, reports, serials
+
+        keys, reports, serials = self.cache.get(('rates', start, end, grouping), end, compute)
+        per_serial = reports / np.maximum(serials, 1)
+        order = np.lexsort((keys, -per_serial))
+        if top is not None:
+            order = order[:top]
+        labels = self.labels(grouping, keys[order])
+        return [{
+            'id': int(keys[i]),
+            'label': self._label(labels, int(keys[i])),
+            'reports': int(reports[i]),
+            'serials': int(serials[i]),
+            'per_serial': float(per_serial[i]),
+        } for i in order]
+
+    def trend(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+              bucket: str = 'day', grouping: Optional[str] = None,
+              top: Optional[int] = None) -> Dict[str, Any]:
+        """Número de reportes por unidad de tiempo
+
+        Los periodos sin reportes entre el primero y el último aparecen con 0.
+
+        Args:
+            start (datetime, optional): Inicio del rango
+            end (datetime, optional): Fin del rango (excluido)
+            bucket (str): Una de BUCKETS (hour, day, week, month)
+            grouping (str, optional): Una de GROUPINGS para obtener una serie por grupo
+            top (int, optional): Con ``grouping``, solo los grupos con más reportes
+
+        Returns:
+            Dict: ``buckets`` (lista de datetime) y ``counts`` (lista de enteros), o
+            con ``grouping``, ``series``: lista de {id, label, counts}
+        """
+        column = self._column(grouping) if grouping else None
+
+        def compute() -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+            frame = self.load(start, end)
+            times = frame['create_time']
+            valid = ~np.isnat(times)
+            rounded, step = bucket_times(times[valid], bucket)
+            if len(rounded) == 0:
+                return rounded, np.zeros(0, dtype=np.int64), None
+            first, last = rounded.min(), rounded.max()
+            buckets = np.arange(first, last + step, step)
+            index = ((rounded - first).astype(np.int64) // step)
+            if column is None:
+                return buckets, np.bincount(index, minlength=len(buckets)), None
+            keys, inverse = np.unique(frame[column][valid], return_inverse=True)
+            flat = inverse.reshape(-1) * len(buckets) + index
+            matrix = np.bincount(flat, minlength=len(keys) * len(buckets)).reshape(len(keys), len(buckets))
+            return buckets, matrix, keys
+
+        buckets, counts, keys = self.cache.get(('trend', start, end, bucket, grouping), end, compute)
+        result: Dict[str, Any] = {'buckets': buckets.astype('datetime64[s]').tolist()}
+        if keys is None:
+            result['counts'] = counts.tolist()
+            return result
+        totals = counts.sum(axis=1)
+        order = np.lexsort((keys, -totals))
+        if top is not None:
+            order = order[:top]
+        labels = self.labels(grouping, keys[order])
+        result['series'] = [{'id': int(keys[i]), 'label': self._label(labels, int(keys[i])),
+                             'counts': counts[i].tolist()} for i in order]
+        return result
+
+    def summary(self, start: Optional[datetime] = None,
+                end: Optional[datetime] = None) -> Dict[str, Any]:
+        """Totales del rango: reportes, serials afectados y primera/última fecha"""
+        frame = self.load(start, end)
+        times = frame['create_time']
+        times = times[~np.isnat(times)]
+        return {
+            'reports': len(frame),
+            'serials': int(len(np.unique(frame['serial_id']))),
+            'first': times.min().astype('datetime64[s]').tolist() if len(times) else None,
+            'last': times.max().astype('datetime64[s]').tolist() if len(times) else None,
+        }
@@ -0,0 +1,443 @@
+from datetime import datetime
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional
+from database.backend import get_connection
+from database.reference_cache import cached_reference
+from database.database_schema import Tables, Columns
+from database.row_formats import RowFormat
+from database.pagination import Page, SortKey, escape_like, fetch_page
+from database.write_result import WriteResult, execute_write
+from database.insert_batcher import InsertBatcher
+from database.range_cache import report_cache
+from models.line_model import LineModel
+from models.dr_description_model import DRDescriptionModel
+from models.dr_status_model import DRStatusModel
+from models.explanation_model import ExplanationModel
+from models.serial_damage_summary import SerialDamageSummary
+
+DR = Columns.DamageReport
+
+# Columnas escritas por createReport() y submitReport(), en este orden
+REPORT_COLUMNS = (
+    DR.CREATE_TIME, DR.SERIAL_ID, DR.SUPERVISOR_ID, DR.OPERATOR_ID, DR.LINE_ID,
+    DR.PRODUCT_ID, DR.DR_DESCRIPTION_ID, DR.EXPLANATION_ID, DR.SAMPLE, DR.NOTE,
+    DR.DR_STATUS_ID,
+)
+
+class DamageReportModel:
+    # Ordenamientos permitidos en page(); el último campo de cada uno es único.
+    # Solo columnas de damage_report, para que un índice compuesto resuelva cada
+    # página (scripts/create_sort_indexes.py): 'serial' agrupa por su ID
+    PAGE_SORTS = {
+        'date': (SortKey(f'r.{DR.CREATE_TIME}', DR.CREATE_TIME),
+                 SortKey(f'r.{DR.ID}', DR.ID)),
+        'serial': (SortKey(f'r.{DR.SERIAL_ID}', DR.SERIAL_ID, nullable=True),
+                   SortKey(f'r.{DR.ID}', DR.ID)),
+        'id': (SortKey(f'r.{DR.ID}', DR.ID),),
+    }
+
+    # Columnas donde busca page(search=...)
+    SEARCH_COLUMNS = ('s.Serial', 'p.Product', f'dd.{Columns.DRDescription.DESCRIPTION}',
+                      f'e.{Columns.Explanation.EXPLANATION}', f'sup.{Columns.Workers.NAME}',
+                      f'op.{Columns.Workers.NAME}')
+
+    # Filtros permitidos en page(filters=...): nombre → columna
+    PAGE_FILTERS = {'status': f'r.{DR.DR_STATUS_ID}', 'line': f'r.{DR.LINE_ID}',
+                    'serial': f'r.{DR.SERIAL_ID}', 'product': f'r.{DR.PRODUCT_ID}'}
+
+    # IDs por consulta en getReportsByIds() y getSerialLabels()
+    MAX_IDS_PER_QUERY = 500
+
+    # Agrupador compartido por todas las instancias del proceso
+    _batcher: Optional[InsertBatcher] = None
+    _batcher_lock = Lock()
+
+    def __init__(self):
+        """Inicializa el modelo de damage reports"""
+        self.db = get_connection()
+        self.table = Tables.DAMAGE_REPORT
+        self.lineModel = LineModel()
+        self.drDescriptionModel = DRDescriptionModel()
+        self.explanationModel = ExplanationModel()
+        self.drStatusModel = DRStatusModel()
+        self.summary = SerialDamageSummary()
+
+    def _reports_select(self) -> str:
+        """SELECT de reportes con los textos de sus referencias, sin ordenamiento"""
+        return f"""
+            SELECT r.{DR.ID}, r.{DR.CREATE_TIME}, r.{DR.UPDATE_TIME},
+                   r.{DR.SERIAL_ID}, s.Serial,
+                   r.{DR.SUPERVISOR_ID}, sup.{Columns.Workers.NAME} as SupervisorName,
+                   r.{DR.OPERATOR_ID}, op.{Columns.Workers.NAME} as OperatorName,
+                   r.{DR.LINE_ID}, l.{Columns.Lines.LINE},
+                   r.{DR.PRODUCT_ID}, p.Product,
+                   r.{DR.DR_DESCRIPTION_ID}, dd.{Columns.DRDescription.DESCRIPTION} as DRDescription,
+                   r.{DR.EXPLANATION_ID}, e.{Columns.Explanation.EXPLANATION} as Explanation,
+                   r.{DR.SAMPLE}, r.{DR.NOTE},
+                   r.{DR.DR_STATUS_ID}, ds.{Columns.DRStatus.STATUS} as DRStatus
+            FROM {self.table} r
+            LEFT JOIN {Tables.SERIALS} s ON r.{DR.SERIAL_ID} = s.{Columns.Serials.ID}
+            LEFT JOIN {Tables.WORKERS} sup ON r.{DR.SUPERVISOR_ID} = sup.{Columns.Workers.ID}
+            LEFT JOIN {Tables.WORKERS} op ON r.{DR.OPERATOR_ID} = op.{Columns.Workers.ID}
+            LEFT JOIN {Tables.LINE} l ON r.{DR.LINE_ID} = l.{Columns.Lines.ID}
+            LEFT JOIN {Tables.PRODUCTS} p ON r.{DR.PRODUCT_ID} = p.id_product
+            LEFT JOIN {Tables.DR_DESCRIPTION} dd ON r.{DR.DR_DESCRIPTION_ID} = dd.{Columns.DRDescription.ID}
+            LEFT JOIN {Tables.EXPLANATION} e ON r.{DR.EXPLANATION_ID} = e.{Columns.Explanation.ID}
+            LEFT JOIN {Tables.DR_STATUS} ds ON r.{DR.DR_STATUS_ID} = ds.{Columns.DRStatus.ID}
+        """
+
+    def getAllReports(self, row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Obtiene todos los reportes, del más reciente al más antiguo
+
+        Args:
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+
+        Returns:
+            List[Dict]: Lista de diccionarios con los datos de los reportes
+        """
+        query = self._reports_select() + f"""
+            ORDER BY r.{DR.CREATE_TIME} DESC, r.{DR.ID} DESC
+        """
+        return self.db.fetch_all(query, row_format=row_format)
+
+    def page(self, after_key: Optional[tuple] = None, limit: int = 100,
+             sort: str = '-date',
+             row_format: str = RowFormat.DICT, search: Optional[str] = None,
+             filters: Optional[Dict[str, Any]] = None) -> Page:
+        """Obtiene una página de reportes con paginación por clave
+
+        Args:
+            after_key (tuple, optional): ``next_key`` de la página anterior; None para la primera
+            limit (int): Reportes por página
+            sort (str): Uno de PAGE_SORTS; con prefijo ``-`` en orden descendente
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+            search (str, optional): Texto a buscar en SEARCH_COLUMNS (subcadena por término)
+            filters (Dict[str, Any], optional): Valor por filtro de PAGE_FILTERS (None no filtra)
+
+        Returns:
+            Page: Reportes de la página y clave de la siguiente
+        """
+        return fetch_page(self.db, self._reports_select(), self.PAGE_SORTS, '-date',
+                          after_key, limit, sort, row_format=row_format,
+                          search=search, search_columns=self.SEARCH_COLUMNS,
+                          filters=filters, filter_columns=self.PAGE_FILTERS)
+
+    def estimate_count(self) -> int:
+        """Número aproximado de reportes (para barras de desplazamiento)"""
+        return self.db.estimate_row_count(self.table)
+
+    def getReportById(self, report_id: int) -> Optional[Dict]:
+        """Obtiene un reporte por su ID
+
+        Args:
+            report_id (int): ID del reporte a buscar
+
+        Returns:
+            Optional[Dict]: Diccionario con los datos del reporte o None si no existe
+        """
+        query = self._reports_select() + f"""
+            WHERE r.{DR.ID} = %s
+        """
+        return self.db.fetch_one(query, (report_id,))
+
+    def getReportsByIds(self, report_ids: Iterable[int]) -> Dict[int, Dict]:
+        """Obtiene varios reportes por ID en pocas consultas
+
+        Args:
+            report_ids (Iterable[int]): IDs a buscar (consultados por bloques de MAX_IDS_PER_QUERY)
+
+        Returns:
+            Dict[int, Dict]: Reportes encontrados indexados por ID
+        """
+        ids = list(dict.fromkeys(report_ids))
+        found: Dict[int, Dict] = {}
+        for start in range(0, len(ids), self.MAX_IDS_PER_QUERY):
+            chunk = ids[start:start + self.MAX_IDS_PER_QUERY]
+            query = self._reports_select() + f"""
+                WHERE r.{DR.ID} IN ({', '.join(['%s'] * len(chunk))})
+            """
+            for row in self.db.fetch_all(query, tuple(chunk)):
+                found[row[DR.ID]] = row
+        return found
+
+    # Datos de referencia. Los catálogos vienen de la caché; los serials son
+    # demasiados para ella y se consultan por índice
+
+    @cached_reference(Tables.WORKERS)
+    def getAllWorkers(self) -> List[Dict]:
+        """Obtiene los trabajadores (supervisores y operadores) ordenados por nombre"""
+        query = f"""
+            SELECT {Columns.Workers.ID}, {Columns.Workers.NAME}
+            FROM {Tables.WORKERS}
+            ORDER BY {Columns.Workers.NAME}
+        """
+        return self.db.fetch_all(query)
+
+    @cached_reference(Tables.PRODUCTS)
+    def getAllProducts(self) -> List[Dict]:
+        """Obtiene los productos ordenados por nombre"""
+        query = f"""
+            SELECT id_product, Product
+            FROM {Tables.PRODUCTS}
+            ORDER BY Product
+        """
+        return self.db.fetch_all(query)
+
+    def getSerialLabels(self, serial_ids: Iterable[int]) -> Dict[int, str]:
+        """Obtiene el número de serial de los IDs indicados
+
+        Args:
+            serial_ids (Iterable[int]): IDs a buscar (consultados por bloques de MAX_IDS_PER_QUERY)
+
+        Returns:
+            Dict[int, str]: id_serial → Serial de los que existen
+        """
+        ids = list(dict.fromkeys(serial_ids))
+        labels: Dict[int, str] = {}
+        for start in range(0, len(ids), self.MAX_IDS_PER_QUERY):
+            chunk = ids[start:start + self.MAX_IDS_PER_QUERY]
+            query = f"""
+                SELECT {Columns.Serials.ID}, {Columns.Serials.SERIAL}
+                FROM {Tables.SERIALS}
+                WHERE {Columns.Serials.ID} IN ({', '.join(['%s'] * len(chunk))})
+            """
+            for row in self.db.fetch_all(query, tuple(chunk)):
+                labels[row[Columns.Serials.ID]] = row[Columns.Serials.SERIAL]
+        return labels
+
+    def getLookups(self) -> Dict[str, List[Dict]]:
+        """Obtiene todas las listas de referencia que usa el formulario de reportes
+
+        Returns:
+            Dict[str, List[Dict]]: workers, lines, products, dr_descriptions,
+            explanations y dr_status
+        """
+        return {
+            'workers': self.getAllWorkers(),
+            'lines': self.lineModel.getAllLines(),
+            'products': self.getAllProducts(),
+            'dr_descriptions': self.drDescriptionModel.getAllDescriptions(),
+            'explanations': self.explanationModel.getAllExplanations(),
+            'dr_status': self.drStatusModel.getAllStatus(),
+        }
+
+    def searchSerials(self, prefix: str, limit: int = 20) -> List[str]:
+        """Números de serial que empiezan por ``prefix`` (para el autocompletado)
+
+        El prefijo recorre solo un rango del índice único de Serial.
+
+        Args:
+            prefix (str): Inicio del número de serial
+            limit (int): Máximo de resultados
+
+        Returns:
+            List[str]: Números de serial en orden alfabético
+        """
+        query = f"""
+            SELECT {Columns.Serials.SERIAL}
+            FROM {Tables.SERIALS}
+            WHERE {Columns.Serials.SERIAL} LIKE %s ESCAPE '!'
+            ORDER BY {Columns.Serials.SERIAL}
+            LIMIT {int(limit)}
+        """
+        pattern = escape_like(prefix.strip().upper()) + '%'
+        return [row[Columns.Serials.SERIAL] for row in self.db.fetch_all(query, (pattern,))]
+
+    def resolveSerial(self, serial_number: str) -> Optional[int]:
+        """Devuelve el id_serial de un número de serial, o None si no existe"""
+        query = f"""
+            SELECT {Columns.Serials.ID}
+            FROM {Tables.SERIALS}
+            WHERE {Columns.Serials.SERIAL} = %s
+        """
+        row = self.db.fetch_one(query, (serial_number.strip().upper(),))
+        return row[Columns.Serials.ID] if row else None
+
+    def serialExists(self, serial_id: int) -> bool:
+        """Indica si existe el serial (búsqueda por clave primaria)"""
+        query = f"SELECT 1 AS found FROM {Tables.SERIALS} WHERE {Columns.Serials.ID} = %s"
+        return self.db.fetch_one(query, (serial_id,)) is not None
+
+    @cached_reference(Tables.WORKERS, Tables.LINE, Tables.PRODUCTS, Tables.DR_DESCRIPTION,
+                      Tables.EXPLANATION, Tables.DR_STATUS)
+    def getReferenceIds(self) -> Dict[str, frozenset]:
+        """Obtiene los IDs válidos de cada lista de referencia
+
+        Se arma una vez por versión de las tablas; copiar el resultado de la
+        caché solo copia el diccionario, no los conjuntos.
+        """
+        lookups = self.getLookups()
+        columns = {
+            'workers': Columns.Workers.ID,
+            'lines': Columns.Lines.ID,
+            'products': 'id_product',
+            'dr_descriptions': Columns.DRDescription.ID,
+            'explanations': Columns.Explanation.ID,
+            'dr_status': Columns.DRStatus.ID,
+        }
+        return {name: frozenset(row[column] for row in lookups[name])
+                for name, column in columns.items()}
+
+    def _validReferences(self, supervisor_id: int, operator_id: int, line_id: int,
+                         product_id: int, dr_description_id: int, explanation_id: int,
+                         dr_status_id: int) -> bool:
+        """Comprueba contra la caché que los IDs de referencia existen"""
+        ids = self.getReferenceIds()
+        return (supervisor_id in ids['workers'] and operator_id in ids['workers']
+                and line_id in ids['lines'] and product_id in ids['products']
+                and dr_description_id in ids['dr_descriptions']
+                and explanation_id in ids['explanations'] and dr_status_id in ids['dr_status'])
+
+    def _reportRow(self, serial_id: int, supervisor_id: int, operator_id: int, line_id: int,
+                   product_id: int, dr_description_id: int, explanation_id: int,
+                   sample: Any, note: str, dr_status_id: int) -> Optional[tuple]:
+        """Valida un reporte y devuelve la fila en el orden de REPORT_COLUMNS"""
+        if not self.serialExists(serial_id):
+            return None
+        if not self._validReferences(supervisor_id, operator_id, line_id, product_id,
+                                     dr_description_id, explanation_id, dr_status_id):
+            return None
+        # La fecha se toma al registrar, no al escribir el lote
+        return (datetime.now(), serial_id, supervisor_id, operator_id, line_id, product_id,
+                dr_description_id, explanation_id, sample, (note or '').strip(), dr_status_id)
+
+    # Escrituras
+
+    @classmethod
+    def batcher(cls) -> InsertBatcher:
+        """Agrupador de inserciones de reportes (se crea al primer uso)"""
+        with cls._batcher_lock:
+            if cls._batcher is None:
+                cls._batcher = InsertBatcher(get_connection(), Tables.DAMAGE_REPORT, REPORT_COLUMNS,
+                                             on_written=cls._reportsWritten,
+                                             before_commit=SerialDamageSummary().applyReports)
+            return cls._batcher
+
+    @staticmethod
+    def _reportsWritten(rows: List[tuple]) -> None:
+        """Invalida los análisis cuyo rango incluye los reportes recién escritos"""
+        report_cache.invalidate(since=min(row[0] for row in rows))
+
+    def submitReport(self, serial_id: int, supervisor_id: int, operator_id: int, line_id: int,
+                     product_id: int, dr_description_id: int, explanation_id: int,
+                     sample: Any, note: str, dr_status_id: int) -> Optional[Future]:
+        """Registra un reporte en el siguiente lote de inserciones
+
+        Regresa sin esperar a la base de datos; el reporte se escribe junto con
+        los demás pendientes en un INSERT multi-fila.
+
+        Returns:
+            Optional[Future]: Se resuelve con el ID del reporte; None si alguna
+            referencia no existe
+        """
+        row = self._reportRow(serial_id, supervisor_id, operator_id, line_id, product_id,
+                              dr_description_id, explanation_id, sample, note, dr_status_id)
+        if row is None:
+            return None
+        return self.batcher().submit(row)
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Espera a que se escriban los reportes registrados con submitReport()"""
+        return self._batcher.flush(timeout) if self._batcher is not None else True
+
+    def createReport(self, serial_id: int, supervisor_id: int, operator_id: int, line_id: int,
+                     product_id: int, dr_description_id: int, explanation_id: int,
+                     sample: Any, note: str, dr_status_id: int) -> WriteResult:
+        """Crea un reporte de inmediato (sin agrupar)
+
+        Returns:
+            WriteResult: Verdadero si se creó, con el ID generado
+        """
+        row = self._reportRow(serial_id, supervisor_id, operator_id, line_id, product_id,
+                              dr_description_id, explanation_id, sample, note, dr_status_id)
+        if row is None:
+            return WriteResult.failed()
+        query = f"""
+            INSERT INTO {self.table} ({', '.join(REPORT_COLUMNS)})
+            VALUES ({', '.join(['%s'] * len(REPORT_COLUMNS))})
+        """
+
+        def write() -> WriteResult:
+            result = execute_write(self.db, query, row)
+            if result:
+                self.summary.applyReports([row])
+            return result
+
+        result = self.db.run_transaction(write)
+        report_cache.invalidate(since=row[0])
+        return result
+
+    def _reportKeys(self, report_id: int) -> Optional[Dict]:
+        """Serial y estado actuales de un reporte (para ajustar el resumen)"""
+        query = f"""
+            SELECT {DR.SERIAL_ID}, {DR.DR_STATUS_ID}
+            FROM {self.table}
+            WHERE {DR.ID} = %s
+        """
+        return self.db.fetch_one(query, (report_id,))
+
+    def updateReport(self, report_id: int, serial_id: int, supervisor_id: int, operator_id: int,
+                     line_id: int, product_id: int, dr_description_id: int, explanation_id: int,
+                     sample: Any, note: str, dr_status_id: int) -> WriteResult:
+        """Actualiza un reporte existente
+
+        Returns:
+            WriteResult: Verdadero si se actualizó; falso si el reporte ya no existe
+        """
+        row = self._reportRow(serial_id, supervisor_id, operator_id, line_id, product_id,
+                              dr_description_id, explanation_id, sample, note, dr_status_id)
+        if row is None:
+            return WriteResult.failed()
+        # La fecha de creación no cambia
+        columns = REPORT_COLUMNS[1:] + (DR.UPDATE_TIME,)
+        query = f"""
+            UPDATE {self.table}
+            SET {', '.join(f'{column} = %s' for column in columns)}
+            WHERE {DR.ID} = %s
+        """
+
+        def write() -> WriteResult:
+            old = self._reportKeys(report_id)
+            if old is None:
+                return WriteResult.failed()
+            # UPDATE_TIME siempre cambia: rowcount 0 indica que otra terminal lo eliminó
+            result = execute_write(self.db, query, row[1:] + (datetime.now(), report_id))
+            if not result:
+                return result
+            if result.rowcount == 0:
+                return WriteResult.failed()
+            self.summary.reportChanged(old[DR.SERIAL_ID], old[DR.DR_STATUS_ID],
+                                       serial_id, dr_status_id)
+            return result
+
+        try:
+            return self.db.run_transaction(write)
+        finally:
+            report_cache.invalidate()
+
+    def deleteReport(self, report_id: int) -> bool:
+        """Elimina un reporte
+
+        Args:
+            report_id (int): ID del reporte a eliminar
+
+        Returns:
+            bool: True si se eliminó correctamente, False en caso contrario
+        """
+        query = f"""
+            DELETE FROM {self.table}
+            WHERE {DR.ID} = %s
+        """
+
+        def delete() -> bool:
+            old = self._reportKeys(report_id)
+            deleted = bool(self.db.execute_query(query, (report_id,)))
+            if deleted and old:
+                self.summary.refreshSerials([old[DR.SERIAL_ID]])
+            return deleted
+
+        try:
+            return self.db.run_transaction(delete)
+        finally:
+            report_cache.invalidate()
@@ -1,20 +1,39 @@
-from typing import List, Dict, Optional
-from database.connection import MySQLConnection
+from typing import Any, List, Dict, Optional, Iterator
+from database.backend import get_connection
+from database.reference_cache import cached_reference, invalidates_reference
 from database.database_schema import Tables, Columns
+from database.row_formats import RowFormat
+from database.pagination import Page, SortKey, fetch_page
+from database.write_result import WriteResult
+from database.unique_indexes import execute_unique_write
 
 class DieDescriptionModel:
+    # Ordenamientos permitidos en page(); el último campo de cada uno es único.
+    # Solo columnas de die_description, para que un índice compuesto resuelva cada
+    # página (scripts/create_sort_indexes.py): 'inch' agrupa por los IDs del catálogo
+    PAGE_SORTS = {
+        'inch': (SortKey('dd.id_inch', 'id_inch'), SortKey('dd.id_description', 'id_description'),
+                 SortKey('dd.id_part', 'id_part'), SortKey('dd.id_die_description', 'id_die_description')),
+        'die_description': (SortKey('dd.Die_Description', 'Die_Description'),
+                            SortKey('dd.id_die_description', 'id_die_description')),
+        'id': (SortKey('dd.id_die_description', 'id_die_description'),),
+    }
+
+    # Columnas donde busca page(search=...)
+    SEARCH_COLUMNS = ('dd.Die_Description', 'i.Inch', 'p.Part', 'd.Description')
+
+    # Filtros permitidos en page(filters=...): nombre → columna
+    PAGE_FILTERS = {'inch': 'dd.id_inch', 'part': 'dd.id_part',
+                    'description': 'dd.id_description', 'obsolete': 'dd.Obsolet'}
+
     def __init__(self):
         """Inicializa el modelo de die_description"""
-        self.db = MySQLConnection()
+        self.db = get_connection()
         self.table = Tables.DIE_DESCRIPTION
 
-    def get_all_die_descriptions(self) -> List[Dict]:
-        """Obtiene todas las die descriptions con sus relaciones
-
-        Returns:
-            List[Dict]: Lista de diccionarios con los datos de las die descriptions
-        """
-        query = f"""
+    def _die_descriptions_select(self) -> str:
+        """SELECT de die descriptions con sus relaciones, sin ordenamiento"""
+        return f"""
             SELECT 
                 dd.id_die_description,
                 dd.Die_Description,
@@ -33,9 +52,58 @@ class DieDescriptionModel:
             JOIN inches i ON dd.id_inch = i.id_inch
             JOIN parts p ON dd.id_part = p.id_part
             JOIN description d ON dd.id_description = d.id_description
+        """
+
+    def _all_die_descriptions_query(self) -> str:
+        """Consulta de todas las die descriptions con sus relaciones"""
+        return self._die_descriptions_select() + """
             ORDER BY i.Inch, d.Description, p.Part
         """
-        return self.db.fetch_all(query)
+
+    def page(self, after_key: Optional[tuple] = None, limit: int = 100,
+             sort: str = 'inch',
+             row_format: str = RowFormat.DICT, search: Optional[str] = None,
+             filters: Optional[Dict[str, Any]] = None) -> Page:
+        """Obtiene una página de die descriptions con paginación por clave
+
+        Args:
+            after_key (tuple, optional): ``next_key`` de la página anterior; None para la primera
+            limit (int): Die descriptions por página
+            sort (str): Uno de PAGE_SORTS; con prefijo ``-`` en orden descendente
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+            search (str, optional): Texto a buscar en SEARCH_COLUMNS (subcadena por término)
+            filters (Dict[str, Any], optional): Valor por filtro de PAGE_FILTERS (None no filtra)
+
+        Returns:
+            Page: Die descriptions de la página y clave de la siguiente
+        """
+        return fetch_page(self.db, self._die_descriptions_select(), self.PAGE_SORTS, 'inch',
+                          after_key, limit, sort, row_format=row_format,
+                          search=search, search_columns=self.SEARCH_COLUMNS,
+                          filters=filters, filter_columns=self.PAGE_FILTERS)
+
+    def estimate_count(self) -> int:
+        """Número aproximado de die descriptions (para barras de desplazamiento)"""
+        return self.db.estimate_row_count(self.table)
+
+    def get_all_die_descriptions(self) -> List[Dict]:
+        """Obtiene todas las die descriptions con sus relaciones
+
+        Returns:
+            List[Dict]: Lista de diccionarios con los datos de las die descriptions
+        """
+        return self.db.fetch_all(self._all_die_descriptions_query())
+
+    def iter_all_die_descriptions(self, batch_size: int = 500) -> Iterator[Dict]:
+        """Recorre todas las die descriptions sin cargarlas completas en memoria
+
+        Args:
+            batch_size (int): Filas leídas por bloque
+
+        Returns:
+            Iterator[Dict]: Generador con los datos de cada die description
+        """
+        return self.db.fetch_iter(self._all_die_descriptions_query(), batch_size=batch_size)
 
     def get_die_description_by_id(self, die_description_id: int) -> Optional[Dict]:
         """Obtiene una die description por su ID
@@ -69,41 +137,18 @@ class DieDescriptionModel:
         """
         return self.db.fetch_one(query, (die_description_id,))
 
-    def check_duplicate_die_description(self, die_description: str, exclude_id: int = None) -> bool:
-        """Verifica si ya existe una Die Description con el mismo valor
-
-        Args:
-            die_description (str): El valor de Die Description a verificar
-            exclude_id (int, optional): ID a excluir de la búsqueda (para actualizaciones)
-
-        Returns:
-            bool: True si existe un duplicado, False en caso contrario
-        """
-        query = f"SELECT id_die_description FROM {self.table} WHERE Die_Description = %s"
-        params = [die_description]
-        
-        if exclude_id is not None:
-            query += " AND id_die_description != %s"
-            params.append(exclude_id)
-            
-        result = self.db.fetch_one(query, tuple(params))
-        return result is not None
-
-    def create_die_description(self, data: Dict) -> bool:
+    @invalidates_reference(Tables.DIE_DESCRIPTION)
+    def create_die_description(self, data: Dict) -> WriteResult:
         """Crea una nueva die description
 
         Args:
             data (Dict): Diccionario con los datos de la die description
 
         Returns:
-            bool: True si se creó correctamente, False en caso contrario
+            WriteResult: Verdadero si se creó; ``duplicate`` si la Die Description ya existe
         """
         if len(data['Die_Description']) > 45:
-            return False
-            
-        # Verificar duplicados
-        if self.check_duplicate_die_description(data['Die_Description']):
-            return False
+            return WriteResult.failed()
             
         query = f"""
             INSERT INTO {self.table} (
@@ -125,9 +170,11 @@ class DieDescriptionModel:
             data['Circulation'],
             data['New']
         )
-        return bool(self.db.execute_query(query, values))
+        return execute_unique_write(self.db, query, values, self.table, 'Die_Description',
+                                    data['Die_Description'])
 
-    def update_die_description(self, die_description_id: int, data: Dict) -> bool:
+    @invalidates_reference(Tables.DIE_DESCRIPTION)
+    def update_die_description(self, die_description_id: int, data: Dict) -> WriteResult:
         """Actualiza una die description existente
 
         Args:
@@ -135,14 +182,10 @@ class DieDescriptionModel:
             data (Dict): Diccionario con los datos a actualizar
 
         Returns:
-            bool: True si se actualizó correctamente, False en caso contrario
+            WriteResult: Verdadero si se actualizó; ``duplicate`` si otra tiene el mismo valor
         """
         if len(data['Die_Description']) > 45:
-            return False
-            
-        # Verificar duplicados excluyendo el ID actual
-        if self.check_duplicate_die_description(data['Die_Description'], die_description_id):
-            return False
+            return WriteResult.failed()
             
         query = f"""
             UPDATE {self.table}
@@ -166,8 +209,10 @@ class DieDescriptionModel:
             data['New'],
             die_description_id
         )
-        return bool(self.db.execute_query(query, values))
+        return execute_unique_write(self.db, query, values, self.table, 'Die_Description',
+                                    data['Die_Description'], 'id_die_description', die_description_id)
 
+    @invalidates_reference(Tables.DIE_DESCRIPTION)
     def delete_die_description(self, die_description_id: int) -> bool:
         """Elimina una die description
 
@@ -183,6 +228,7 @@ class DieDescriptionModel:
         """
         return bool(self.db.execute_query(query, (die_description_id,)))
 
+    @cached_reference(Tables.INCHES, Tables.DESCRIPTION, Tables.PARTS)
     def get_related_data(self) -> Dict[str, List[Dict]]:
         """Obtiene los datos relacionados necesarios para el formulario
 
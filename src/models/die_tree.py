@@ -0,0 +1,54 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class DieTree:
+    """Jerarquía inch → part → die description en memoria
+
+    Se construye con el resultado de una sola consulta ordenada por Inch,
+    Part y Die_Description, y responde los tres niveles de los combos sin
+    volver a la base de datos. Las listas devueltas conservan el formato
+    de las consultas a las que reemplaza.
+    """
+
+    def __init__(self, rows: Iterable[Dict]):
+        """Construye el árbol
+
+        Args:
+            rows (Iterable[Dict]): Filas con id_inch, Inch, id_part, Part,
+                id_die_description y Die_Description, ya ordenadas
+        """
+        self._inches: List[Dict] = []
+        self._parts: Dict[int, List[Dict]] = {}
+        self._descriptions: Dict[Tuple[int, int], List[Dict]] = {}
+        self._locations: Dict[int, Tuple[int, int]] = {}
+        for row in rows:
+            inch_id, part_id = row['id_inch'], row['id_part']
+            if inch_id not in self._parts:
+                self._inches.append({'id_inch': inch_id, 'Inch': row['Inch']})
+                self._parts[inch_id] = []
+            if (inch_id, part_id) not in self._descriptions:
+                self._parts[inch_id].append({'id_part': part_id, 'Part': row['Part']})
+                self._descriptions[(inch_id, part_id)] = []
+            self._descriptions[(inch_id, part_id)].append({
+                'id_die_description': row['id_die_description'],
+                'Die_Description': row['Die_Description'],
+            })
+            self._locations[row['id_die_description']] = (inch_id, part_id)
+
+    def inches(self) -> List[Dict]:
+        """Inches que tienen al menos un die description vigente"""
+        return list(self._inches)
+
+    def parts(self, inch_id: int) -> List[Dict]:
+        """Parts disponibles para un inch"""
+        return list(self._parts.get(inch_id, ()))
+
+    def descriptions(self, inch_id: int, part_id: int) -> List[Dict]:
+        """Die descriptions disponibles para un inch y un part"""
+        return list(self._descriptions.get((inch_id, part_id), ()))
+
+    def locate(self, die_id: int) -> Optional[Tuple[int, int]]:
+        """Devuelve (id_inch, id_part) de un die description, o None si no está en el árbol"""
+        return self._locations.get(die_id)
+
+    def __len__(self) -> int:
+        return len(self._locations)
@@ -1,49 +1,16 @@
 from database.database_schema import Tables, Columns
-from database.connection import MySQLConnection
+from models.base_repository import BaseRepository
 
-class ExplanationModel:
-    def __init__(self):
-        self.db = MySQLConnection()
-        
-    def getAllExplanations(self):
-        """Obtiene todas las explicaciones ordenadas por explanation"""
-        query = f"""
-            SELECT * FROM {Tables.EXPLANATION}
-            ORDER BY {Columns.Explanation.EXPLANATION}
-        """
-        return self.db.execute_query(query)
-    
-    def getExplanationById(self, explanationId):
-        """Obtiene una explicación por su ID"""
-        query = f"""
-            SELECT * FROM {Tables.EXPLANATION}
-            WHERE {Columns.Explanation.ID} = %s
-        """
-        result = self.db.execute_query(query, (explanationId,))
-        return result[0] if result else None
-    
-    def createExplanation(self, explanation):
-        """Crea una nueva explicación"""
-        query = f"""
-            INSERT INTO {Tables.EXPLANATION}
-            ({Columns.Explanation.EXPLANATION})
-            VALUES (%s)
-        """
-        return self.db.execute_query(query, (explanation,))
-    
-    def updateExplanation(self, explanationId, explanation):
-        """Actualiza una explicación existente"""
-        query = f"""
-            UPDATE {Tables.EXPLANATION}
-            SET {Columns.Explanation.EXPLANATION} = %s
-            WHERE {Columns.Explanation.ID} = %s
-        """
-        return self.db.execute_query(query, (explanation, explanationId))
-    
-    def deleteExplanation(self, explanationId):
-        """Elimina una explicación"""
-        query = f"""
-            DELETE FROM {Tables.EXPLANATION}
-            WHERE {Columns.Explanation.ID} = %s
-        """
-        return self.db.execute_query(query, (explanationId,)) 
\ No newline at end of file
+class ExplanationModel(BaseRepository):
+    """Modelo de explicaciones"""
+
+    table = Tables.EXPLANATION
+    id_column = Columns.Explanation.ID
+    columns = (Columns.Explanation.EXPLANATION,)
+
+    # Nombres usados por las vistas
+    getAllExplanations = BaseRepository.all
+    getExplanationById = BaseRepository.get
+    createExplanation = BaseRepository.create
+    updateExplanation = BaseRepository.update
+    deleteExplanation = BaseRepository.delete
@@ -1,28 +1,80 @@
-from typing import List, Dict, Optional
-from database.connection import MySQLConnection
+from typing import Any, List, Dict, Optional
+from database.backend import get_connection
+from database.write_result import WriteResult, execute_write
+from database.reference_cache import cached_reference, invalidates_reference
 from database.database_schema import Tables, Columns
+from database.row_formats import RowFormat
+from database.pagination import Page, SortKey, fetch_page
 
 class ProductModel:
+    # Ordenamientos permitidos en page(); el último campo de cada uno es único.
+    # Solo columnas de products, para que un índice compuesto resuelva cada página
+    # (scripts/create_sort_indexes.py): 'die_description' agrupa por su ID
+    PAGE_SORTS = {
+        'die_description': (SortKey('p.id_die_description', 'id_die_description', nullable=True),
+                            SortKey('p.Product', 'Product'),
+                            SortKey('p.id_product', 'id_product')),
+        'product': (SortKey('p.Product', 'Product'), SortKey('p.id_product', 'id_product')),
+        'id': (SortKey('p.id_product', 'id_product'),),
+    }
+
+    # Columnas donde busca page(search=...)
+    SEARCH_COLUMNS = ('p.Product', 'd.Die_Description')
+
+    # Filtros permitidos en page(filters=...): nombre → columna
+    PAGE_FILTERS = {'die_description': 'p.id_die_description'}
+
     def __init__(self):
         """Inicializa el modelo de productos"""
-        self.db = MySQLConnection()
+        self.db = get_connection()
         self.table = "products"
 
+    def _products_select(self) -> str:
+        """SELECT de productos con su Die Description, sin ordenamiento"""
+        return f"""
+            SELECT p.id_product, p.Product, p.id_die_description,
+                   d.Die_Description as DieDescription
+            FROM {self.table} p
+            LEFT JOIN die_description d ON p.id_die_description = d.id_die_description
+        """
+
     def getAllProducts(self) -> List[Dict]:
         """Obtiene todos los productos ordenados primero por Die Description y luego por Product
 
         Returns:
             List[Dict]: Lista de diccionarios con los datos de los productos
         """
-        query = f"""
-            SELECT p.id_product, p.Product, p.id_die_description,
-                   d.Die_Description as DieDescription
-            FROM {self.table} p
-            LEFT JOIN die_description d ON p.id_die_description = d.id_die_description
+        query = self._products_select() + """
             ORDER BY d.Die_Description ASC, p.Product ASC
         """
         return self.db.fetch_all(query)
 
+    def page(self, after_key: Optional[tuple] = None, limit: int = 100,
+             sort: str = 'die_description',
+             row_format: str = RowFormat.DICT, search: Optional[str] = None,
+             filters: Optional[Dict[str, Any]] = None) -> Page:
+        """Obtiene una página de productos con paginación por clave
+
+        Args:
+            after_key (tuple, optional): ``next_key`` de la página anterior; None para la primera
+            limit (int): Productos por página
+            sort (str): Uno de PAGE_SORTS; con prefijo ``-`` en orden descendente
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+            search (str, optional): Texto a buscar en SEARCH_COLUMNS (subcadena por término)
+            filters (Dict[str, Any], optional): Valor por filtro de PAGE_FILTERS (None no filtra)
+
+        Returns:
+            Page: Productos de la página y clave de la siguiente
+        """
+        return fetch_page(self.db, self._products_select(), self.PAGE_SORTS, 'die_description',
+                          after_key, limit, sort, row_format=row_format,
+                          search=search, search_columns=self.SEARCH_COLUMNS,
+                          filters=filters, filter_columns=self.PAGE_FILTERS)
+
+    def estimate_count(self) -> int:
+        """Número aproximado de productos (para barras de desplazamiento)"""
+        return self.db.estimate_row_count(self.table)
+
     def getProductById(self, product_id: int) -> Optional[Dict]:
         """Obtiene un producto por su ID
 
@@ -41,7 +93,8 @@ class ProductModel:
         """
         return self.db.fetch_one(query, (product_id,))
 
-    def createProduct(self, product_name: str, die_description_id: int) -> bool:
+    @invalidates_reference(Tables.PRODUCTS)
+    def createProduct(self, product_name: str, die_description_id: int) -> WriteResult:
         """Crea un nuevo producto
 
         Args:
@@ -49,26 +102,27 @@ class ProductModel:
             die_description_id (int): ID de la descripción del die asociado
 
         Returns:
-            bool: True si se creó correctamente, False en caso contrario
+            WriteResult: Verdadero si se creó (con el ID nuevo); ``duplicate`` si el nombre ya existe
         """
         # Convertir a mayúsculas
         product_name = product_name.strip().upper()
         
         if len(product_name) > 100:  # Validar longitud máxima
-            return False
+            return WriteResult.failed()
             
         # Verificar si ya existe un producto con el mismo nombre
         check_query = f"SELECT id_product FROM {self.table} WHERE Product = %s"
         if self.db.fetch_one(check_query, (product_name,)):
-            return False
+            return WriteResult(False, duplicate=True)
             
         query = f"""
             INSERT INTO {self.table} (Product, id_die_description)
             VALUES (%s, %s)
         """
-        return bool(self.db.execute_query(query, (product_name, die_description_id)))
+        return execute_write(self.db, query, (product_name, die_description_id))
 
-    def updateProduct(self, product_id: int, product_name: str, die_description_id: int) -> bool:
+    @invalidates_reference(Tables.PRODUCTS)
+    def updateProduct(self, product_id: int, product_name: str, die_description_id: int) -> WriteResult:
         """Actualiza un producto existente
 
         Args:
@@ -77,13 +131,13 @@ class ProductModel:
             die_description_id (int): Nuevo ID de la descripción del die
 
         Returns:
-            bool: True si se actualizó correctamente, False en caso contrario
+            WriteResult: Verdadero si se actualizó; ``duplicate`` si otro producto tiene el nombre
         """
         # Convertir a mayúsculas
         product_name = product_name.strip().upper()
         
         if len(product_name) > 100:  # Validar longitud máxima
-            return False
+            return WriteResult.failed()
             
         # Verificar si ya existe otro producto con el mismo nombre
         check_query = f"""
@@ -92,15 +146,16 @@ class ProductModel:
             WHERE Product = %s AND id_product != %s
         """
         if self.db.fetch_one(check_query, (product_name, product_id)):
-            return False
+            return WriteResult(False, duplicate=True)
             
         query = f"""
             UPDATE {self.table}
             SET Product = %s, id_die_description = %s
             WHERE id_product = %s
         """
-        return bool(self.db.execute_query(query, (product_name, die_description_id, product_id)))
+        return execute_write(self.db, query, (product_name, die_description_id, product_id))
 
+    @invalidates_reference(Tables.PRODUCTS)
     def deleteProduct(self, product_id: int) -> bool:
         """Elimina un producto
 
@@ -116,6 +171,7 @@ class ProductModel:
         """
         return bool(self.db.execute_query(query, (product_id,)))
 
+    @cached_reference(Tables.DIE_DESCRIPTION)
     def getAllDieDescriptions(self) -> List[Dict]:
         """Obtiene todas las descripciones de dies disponibles
 
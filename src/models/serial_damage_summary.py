@@ -0,0 +1,258 @@
+"""
+Resumen de damage reports por serial, mantenido de forma incremental.
+
+La tabla ``Serial_Damage_Summary`` guarda por serial el número de reportes,
+los reportes abiertos y la fecha del último daño, para que el listado de
+serials los muestre con un JOIN por clave primaria en lugar de agrupar
+``Damage_Report`` en cada consulta.
+
+Cada escritura de DamageReportModel actualiza el resumen dentro de su
+misma transacción: las inserciones suman sus deltas por serial, un cambio
+de estado ajusta ``open_count`` y los cambios de serial o eliminaciones
+recalculan solo los serials afectados. ``scripts/rebuild_damage_summary.py``
+crea la tabla, la reconstruye completa y verifica que coincida con los
+reportes.
+"""
+import os
+import time
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from database.backend import get_connection
+from database.db_exceptions import DuplicateKeyError, QueryError, ER_NO_SUCH_TABLE
+from database.database_schema import Tables, Columns
+from models.dr_status_model import DRStatusModel
+
+DR = Columns.DamageReport
+SUM = Columns.SerialDamageSummary
+
+logger = logging.getLogger('SerialDamageSummary')
+
+# Segundos antes de volver a buscar la tabla de resumen si no existía
+SUMMARY_RECHECK_SECONDS = float(os.getenv('DB_SUMMARY_RECHECK', '60'))
+
+CREATE_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {Tables.SERIAL_DAMAGE_SUMMARY} (
+        {SUM.SERIAL_ID} INT NOT NULL PRIMARY KEY,
+        {SUM.REPORT_COUNT} INT NOT NULL DEFAULT 0,
+        {SUM.OPEN_COUNT} INT NOT NULL DEFAULT 0,
+        {SUM.LAST_DAMAGE} DATETIME NULL,
+        {SUM.UPDATE_TIME} DATETIME NULL
+    )
+"""
+
+class SerialDamageSummary:
+    # None hasta la primera comprobación; la tabla la crea el script de reconstrucción
+    _available: Optional[bool] = None
+    _checkedAt: float = 0.0
+
+    def __init__(self):
+        """Inicializa el resumen"""
+        self.db = get_connection()
+        self.table = Tables.SERIAL_DAMAGE_SUMMARY
+        self.statusModel = DRStatusModel()
+
+    @classmethod
+    def available(cls, db=None) -> bool:
+        """Indica si la tabla de resumen existe
+
+        Una vez encontrada no se vuelve a comprobar. Si no existe, se vuelve
+        a buscar cada SUMMARY_RECHECK_SECONDS para detectar la tabla creada
+        por el script de reconstrucción sin reiniciar la aplicación.
+
+        Raises:
+            QueryError: Si la comprobación falla por otro motivo (el
+                resultado no se guarda y la siguiente llamada reintenta)
+        """
+        if cls._available or (cls._available is False and
+                              time.monotonic() - cls._checkedAt < SUMMARY_RECHECK_SECONDS):
+            return cls._available
+
+        db = db or get_connection()
+        try:
+            db.fetch_one(f"SELECT {SUM.SERIAL_ID} FROM {Tables.SERIAL_DAMAGE_SUMMARY} LIMIT 1")
+            cls._available = True
+        except QueryError as e:
+            if e.errno != ER_NO_SUCH_TABLE:
+                raise
+            if cls._available is None:
+                logger.warning(f"{Tables.SERIAL_DAMAGE_SUMMARY} no existe; "
+                               "ejecute scripts/rebuild_damage_summary.py")
+            cls._available = False
+        cls._checkedAt = time.monotonic()
+        return cls._available
+
+    # Estados abiertos
+
+    def closedStatusIds(self) -> Set[int]:
+        """IDs de los DR Status que cierran un reporte
+
+        Los nombres se configuran en DB_DR_CLOSED_STATUS (separados por coma,
+        sin distinguir mayúsculas); por defecto "Closed".
+        """
+        names = {name.strip().lower()
+                 for name in os.getenv('DB_DR_CLOSED_STATUS', 'Closed').split(',') if name.strip()}
+        return {row[Columns.DRStatus.ID] for row in self.statusModel.getAllStatus()
+                if str(row[Columns.DRStatus.STATUS]).strip().lower() in names}
+
+    def _openExpression(self, alias: str = '') -> str:
+        """Expresión SQL que vale 1 si el reporte está abierto y 0 si no"""
+        column = f"{alias}{DR.DR_STATUS_ID}"
+        closed = sorted(self.closedStatusIds())
+        if not closed:
+            return "1"
+        # IDs enteros tomados de la base, no de la entrada del usuario
+        return f"CASE WHEN {column} IN ({', '.join(str(int(i)) for i in closed)}) THEN 0 ELSE 1 END"
+
+    # Mantenimiento incremental (llamar dentro de la transacción de la escritura)
+
+    def applyReports(self, rows: Sequence[Sequence]) -> None:
+        """Suma al resumen los reportes recién insertados
+
+        Args:
+            rows (Sequence): Filas en el orden de REPORT_COLUMNS de DamageReportModel
+                (create_time primero, id_serial segundo, id_dr_status último)
+        """
+        if not rows or not self.available(self.db):
+            return
+        closed = self.closedStatusIds()
+        deltas: Dict[int, List] = defaultdict(lambda: [0, 0, None])
+        for row in rows:
+            create_time, serial_id, status_id = row[0], row[1], row[-1]
+            if serial_id is None:
+                continue
+            delta = deltas[serial_id]
+            delta[0] += 1
+            delta[1] += 0 if status_id in closed else 1
+            if delta[2] is None or create_time > delta[2]:
+                delta[2] = create_time
+        now = datetime.now()
+        for serial_id in sorted(deltas):
+            reports, opened, last = deltas[serial_id]
+            self._addDelta(serial_id, reports, opened, last, now)
+
+    def _addDelta(self, serial_id: int, reports: int, opened: int,
+                  last: Optional[datetime], now: datetime) -> None:
+        """UPDATE del serial y, si aún no tiene fila, INSERT"""
+        update = f"""
+            UPDATE {self.table}
+            SET {SUM.REPORT_COUNT} = {SUM.REPORT_COUNT} + %s,
+                {SUM.OPEN_COUNT} = {SUM.OPEN_COUNT} + %s,
+                {SUM.LAST_DAMAGE} = CASE
+                    WHEN {SUM.LAST_DAMAGE} IS NULL OR {SUM.LAST_DAMAGE} < %s THEN %s
+                    ELSE {SUM.LAST_DAMAGE} END,
+                {SUM.UPDATE_TIME} = %s
+            WHERE {SUM.SERIAL_ID} = %s
+        """
+        params = (reports, opened, last, last, now, serial_id)
+        if self.db.execute_query(update, params).rowcount > 0:
+            return
+        insert = f"""
+            INSERT INTO {self.table}
+            ({SUM.SERIAL_ID}, {SUM.REPORT_COUNT}, {SUM.OPEN_COUNT}, {SUM.LAST_DAMAGE}, {SUM.UPDATE_TIME})
+            VALUES (%s, %s, %s, %s, %s)
+        """
+        try:
+            self.db.execute_query(insert, (serial_id, reports, opened, last, now))
+        except DuplicateKeyError:
+            # Otra terminal creó la fila entre el UPDATE y el INSERT
+            self.db.execute_query(update, params)
+
+    def reportChanged(self, old_serial_id: Optional[int], old_status_id: Optional[int],
+                      new_serial_id: Optional[int], new_status_id: Optional[int]) -> None:
+        """Ajusta el resumen tras actualizar un reporte
+
+        Un cambio de estado solo mueve ``open_count``; un cambio de serial
+        recalcula los dos serials.
+        """
+        if not self.available(self.db):
+            return
+        if old_serial_id != new_serial_id:
+            self.refreshSerials([old_serial_id, new_serial_id])
+            return
+        closed = self.closedStatusIds()
+        delta = (0 if new_status_id in closed else 1) - (0 if old_status_id in closed else 1)
+        if delta and new_serial_id is not None:
+            query = f"""
+                UPDATE {self.table}
+                SET {SUM.OPEN_COUNT} = {SUM.OPEN_COUNT} + %s, {SUM.UPDATE_TIME} = %s
+                WHERE {SUM.SERIAL_ID} = %s
+            """
+            self.db.execute_query(query, (delta, datetime.now(), new_serial_id))
+
+    def _aggregateSelect(self, where: str = '') -> str:
+        """SELECT que calcula el resumen desde Damage_Report"""
+        return f"""
+            SELECT r.{DR.SERIAL_ID} as {SUM.SERIAL_ID},
+                   COUNT(*) as {SUM.REPORT_COUNT},
+                   SUM({self._openExpression('r.')}) as {SUM.OPEN_COUNT},
+                   MAX(r.{DR.CREATE_TIME}) as {SUM.LAST_DAMAGE}
+            FROM {Tables.DAMAGE_REPORT} r
+            WHERE r.{DR.SERIAL_ID} IS NOT NULL {where}
+            GROUP BY r.{DR.SERIAL_ID}
+        """
+
+    def refreshSerials(self, serial_ids: Iterable[Optional[int]]) -> None:
+        """Recalcula desde Damage_Report las filas de los serials indicados"""
+        ids = sorted({serial_id for serial_id in serial_ids if serial_id is not None})
+        if not ids or not self.available(self.db):
+            return
+        placeholders = ', '.join(['%s'] * len(ids))
+        self.db.execute_query(f"DELETE FROM {self.table} WHERE {SUM.SERIAL_ID} IN ({placeholders})",
+                              tuple(ids))
+        self.db.execute_query(f"""
+            INSERT INTO {self.table}
+            ({SUM.SERIAL_ID}, {SUM.REPORT_COUNT}, {SUM.OPEN_COUNT}, {SUM.LAST_DAMAGE}, {SUM.UPDATE_TIME})
+            SELECT {SUM.SERIAL_ID}, {SUM.REPORT_COUNT}, {SUM.OPEN_COUNT}, {SUM.LAST_DAMAGE}, %s
+            FROM ({self._aggregateSelect(f"AND r.{DR.SERIAL_ID} IN ({placeholders})")}) agg
+        """, (datetime.now(),) + tuple(ids))
+
+    # Reconstrucción y verificación
+
+    def createTable(self) -> None:
+        """Crea la tabla de resumen si no existe"""
+        self.db.execute_query(CREATE_TABLE)
+        type(self)._available = True
+
+    def rebuild(self) -> int:
+        """Reconstruye el resumen completo en una transacción
+
+        Returns:
+            int: Número de serials con reportes
+        """
+        def replace() -> int:
+            self.db.execute_query(f"DELETE FROM {self.table}")
+            result = self.db.execute_query(f"""
+                INSERT INTO {self.table}
+                ({SUM.SERIAL_ID}, {SUM.REPORT_COUNT}, {SUM.OPEN_COUNT}, {SUM.LAST_DAMAGE}, {SUM.UPDATE_TIME})
+                SELECT {SUM.SERIAL_ID}, {SUM.REPORT_COUNT}, {SUM.OPEN_COUNT}, {SUM.LAST_DAMAGE}, %s
+                FROM ({self._aggregateSelect()}) agg
+            """, (datetime.now(),))
+            return max(result.rowcount, 0)
+        return self.db.run_transaction(replace)
+
+    def check(self) -> List[Tuple[int, Optional[Tuple], Optional[Tuple]]]:
+        """Compara el resumen guardado con el calculado desde Damage_Report
+
+        Returns:
+            List[Tuple]: (id_serial, guardado, calculado) de cada serial que no
+            coincide; cada valor es (report_count, open_count, last_damage_time)
+            o None si falta la fila
+        """
+        def values(row) -> Tuple:
+            last = row[SUM.LAST_DAMAGE]
+            # SQLite devuelve texto: se compara hasta el segundo
+            last = str(last)[:19] if last is not None else None
+            return (int(row[SUM.REPORT_COUNT]), int(row[SUM.OPEN_COUNT]), last)
+
+        stored = {row[SUM.SERIAL_ID]: values(row) for row in self.db.fetch_all(
+            f"SELECT {SUM.SERIAL_ID}, {SUM.REPORT_COUNT}, {SUM.OPEN_COUNT}, {SUM.LAST_DAMAGE} "
+            f"FROM {self.table}")}
+        computed = {row[SUM.SERIAL_ID]: values(row)
+                    for row in self.db.fetch_all(self._aggregateSelect())}
+        mismatches = []
+        for serial_id in sorted(set(stored) | set(computed)):
+            if stored.get(serial_id) != computed.get(serial_id):
+                mismatches.append((serial_id, stored.get(serial_id), computed.get(serial_id)))
+        return mismatches
@@ -1,29 +1,119 @@
-from typing import List, Dict, Optional
-from database.connection import MySQLConnection
+from typing import Any, List, Dict, Optional, Iterator
+from database.backend import get_connection
+from database.reference_cache import cached_reference, invalidates_reference
 from database.database_schema import Tables, Columns
+from database.row_formats import RowFormat
+from database.pagination import Page, SortKey, fetch_page
+from database.write_result import WriteResult
+from database.unique_indexes import execute_unique_write
+from models.die_tree import DieTree
+from models.serial_damage_summary import SerialDamageSummary
+
+SUM = Columns.SerialDamageSummary
 
 class SerialModel:
+    # Ordenamientos permitidos en page(); el último campo de cada uno es único.
+    # Solo columnas de serials, para que un índice compuesto resuelva cada página
+    # (scripts/create_sort_indexes.py): 'die_description' agrupa por su ID
+    PAGE_SORTS = {
+        'die_description': (SortKey('s.id_die_description', 'id_die_description', nullable=True),
+                            SortKey('s.Serial', 'Serial'),
+                            SortKey('s.id_serial', 'id_serial')),
+        'serial': (SortKey('s.Serial', 'Serial'), SortKey('s.id_serial', 'id_serial')),
+        'id': (SortKey('s.id_serial', 'id_serial'),),
+    }
+
+    # Columnas donde busca page(search=...)
+    SEARCH_COLUMNS = ('s.Serial', 'd.Die_Description', 'st.Status')
+
+    # Filtros permitidos en page(filters=...): nombre → columna
+    PAGE_FILTERS = {'status': 's.id_status', 'die_description': 's.id_die_description'}
+
     def __init__(self):
         """Inicializa el modelo de serials"""
-        self.db = MySQLConnection()
+        self.db = get_connection()
         self.table = "serials"
 
-    def getAllSerials(self) -> List[Dict]:
-        """Obtiene todos los serials ordenados por Die Description y Serial
-
-        Returns:
-            List[Dict]: Lista de diccionarios con los datos de los serials
-        """
-        query = f"""
+    def _serials_select(self) -> str:
+        """SELECT de serials con su Die Description, Status y resumen de daños, sin ordenamiento"""
+        if SerialDamageSummary.available(self.db):
+            # Resumen mantenido por DamageReportModel: un JOIN por clave primaria
+            damage_columns = f"""
+                   COALESCE(ds.{SUM.REPORT_COUNT}, 0) as DamageCount,
+                   COALESCE(ds.{SUM.OPEN_COUNT}, 0) as OpenDRCount,
+                   ds.{SUM.LAST_DAMAGE} as LastDamage"""
+            damage_join = (f"LEFT JOIN {Tables.SERIAL_DAMAGE_SUMMARY} ds "
+                           f"ON s.id_serial = ds.{SUM.SERIAL_ID}")
+        else:
+            damage_columns = """
+                   0 as DamageCount, 0 as OpenDRCount, NULL as LastDamage"""
+            damage_join = ""
+        return f"""
             SELECT s.id_serial, s.Serial, s.id_die_description, s.`inner`, s.`outer`,
                    s.id_status, d.Die_Description as DieDescription,
-                   st.Status as StatusName
+                   st.Status as StatusName,{damage_columns}
             FROM {self.table} s
             LEFT JOIN die_description d ON s.id_die_description = d.id_die_description
             LEFT JOIN status_seril st ON s.id_status = st.id_status
+            {damage_join}
+        """
+
+    def _all_serials_query(self) -> str:
+        """Consulta de todos los serials ordenados por Die Description y Serial"""
+        return self._serials_select() + """
             ORDER BY d.Die_Description ASC, s.Serial ASC
         """
-        return self.db.fetch_all(query)
+
+    def page(self, after_key: Optional[tuple] = None, limit: int = 100,
+             sort: str = 'die_description',
+             row_format: str = RowFormat.DICT, search: Optional[str] = None,
+             filters: Optional[Dict[str, Any]] = None) -> Page:
+        """Obtiene una página de serials con paginación por clave
+
+        Args:
+            after_key (tuple, optional): ``next_key`` de la página anterior; None para la primera
+            limit (int): Serials por página
+            sort (str): Uno de PAGE_SORTS; con prefijo ``-`` en orden descendente
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+            search (str, optional): Texto a buscar en SEARCH_COLUMNS (subcadena por término)
+            filters (Dict[str, Any], optional): Valor por filtro de PAGE_FILTERS (None no filtra)
+
+        Returns:
+            Page: Serials de la página y clave de la siguiente
+        """
+        return fetch_page(self.db, self._serials_select(), self.PAGE_SORTS, 'die_description',
+                          after_key, limit, sort, row_format=row_format,
+                          search=search, search_columns=self.SEARCH_COLUMNS,
+                          filters=filters, filter_columns=self.PAGE_FILTERS)
+
+    def estimate_count(self) -> int:
+        """Número aproximado de serials (para barras de desplazamiento)"""
+        return self.db.estimate_row_count(self.table)
+
+    def getAllSerials(self, row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Obtiene todos los serials ordenados por Die Description y Serial
+
+        Args:
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+
+        Returns:
+            List[Dict]: Lista de diccionarios con los datos de los serials
+        """
+        return self.db.fetch_all(self._all_serials_query(), row_format=row_format)
+
+    def iterAllSerials(self, batch_size: int = 500,
+                       row_format: str = RowFormat.DICT) -> Iterator[Dict]:
+        """Recorre todos los serials sin cargarlos completos en memoria
+
+        Args:
+            batch_size (int): Filas leídas por bloque
+            row_format (str): Formato de fila (ver RowFormat)
+
+        Returns:
+            Iterator[Dict]: Generador con los datos de cada serial
+        """
+        return self.db.fetch_iter(self._all_serials_query(), batch_size=batch_size,
+                                  row_format=row_format)
 
     def getSerialById(self, serial_id: int) -> Optional[Dict]:
         """Obtiene un serial por su ID
@@ -34,19 +124,14 @@ class SerialModel:
         Returns:
             Optional[Dict]: Diccionario con los datos del serial o None si no existe
         """
-        query = f"""
-            SELECT s.id_serial, s.Serial, s.id_die_description, s.`inner`, s.`outer`,
-                   s.id_status, d.Die_Description as DieDescription,
-                   st.Status as StatusName
-            FROM {self.table} s
-            LEFT JOIN die_description d ON s.id_die_description = d.id_die_description
-            LEFT JOIN status_seril st ON s.id_status = st.id_status
+        query = self._serials_select() + """
             WHERE s.id_serial = %s
         """
         return self.db.fetch_one(query, (serial_id,))
 
+    @invalidates_reference(Tables.SERIALS)
     def createSerial(self, serial_number: str, die_description_id: int, inner: float, 
-                    outer: float, status_id: int) -> bool:
+                    outer: float, status_id: int) -> WriteResult:
         """Crea un nuevo serial
 
         Args:
@@ -57,28 +142,26 @@ class SerialModel:
             status_id (int): ID del status
 
         Returns:
-            bool: True si se creó correctamente, False en caso contrario
+            WriteResult: Verdadero si se creó; ``duplicate`` si el número ya existe
         """
         # Convertir a mayúsculas y eliminar espacios
         serial_number = serial_number.strip().upper()
         
         if len(serial_number) > 15:  # Validar longitud máxima
-            return False
-            
-        # Verificar si ya existe un serial con el mismo número
-        check_query = f"SELECT id_serial FROM {self.table} WHERE Serial = %s"
-        if self.db.fetch_one(check_query, (serial_number,)):
-            return False
+            return WriteResult.failed()
             
+        # El índice único de Serial rechaza los duplicados (sin él, se consulta antes)
         query = f"""
             INSERT INTO {self.table} (Serial, id_die_description, `inner`, `outer`, id_status)
             VALUES (%s, %s, %s, %s, %s)
         """
-        return bool(self.db.execute_query(query, (serial_number, die_description_id, 
-                                                inner, outer, status_id)))
+        return execute_unique_write(self.db, query, (serial_number, die_description_id,
+                                                     inner, outer, status_id),
+                                    self.table, 'Serial', serial_number)
 
+    @invalidates_reference(Tables.SERIALS)
     def updateSerial(self, serial_id: int, serial_number: str, die_description_id: int, 
-                    inner: float, outer: float, status_id: int) -> bool:
+                    inner: float, outer: float, status_id: int) -> WriteResult:
         """Actualiza un serial existente
 
         Args:
@@ -90,31 +173,24 @@ class SerialModel:
             status_id (int): Nuevo ID del status
 
         Returns:
-            bool: True si se actualizó correctamente, False en caso contrario
+            WriteResult: Verdadero si se actualizó; ``duplicate`` si otro serial tiene el número
         """
         # Convertir a mayúsculas y eliminar espacios
         serial_number = serial_number.strip().upper()
         
         if len(serial_number) > 15:  # Validar longitud máxima
-            return False
-            
-        # Verificar si ya existe otro serial con el mismo número
-        check_query = f"""
-            SELECT id_serial 
-            FROM {self.table} 
-            WHERE Serial = %s AND id_serial != %s
-        """
-        if self.db.fetch_one(check_query, (serial_number, serial_id)):
-            return False
+            return WriteResult.failed()
             
         query = f"""
             UPDATE {self.table}
             SET Serial = %s, id_die_description = %s, `inner` = %s, `outer` = %s, id_status = %s
             WHERE id_serial = %s
         """
-        return bool(self.db.execute_query(query, (serial_number, die_description_id, 
-                                                inner, outer, status_id, serial_id)))
+        return execute_unique_write(self.db, query, (serial_number, die_description_id,
+                                                     inner, outer, status_id, serial_id),
+                                    self.table, 'Serial', serial_number, 'id_serial', serial_id)
 
+    @invalidates_reference(Tables.SERIALS)
     def deleteSerial(self, serial_id: int) -> bool:
         """Elimina un serial
 
@@ -130,6 +206,7 @@ class SerialModel:
         """
         return bool(self.db.execute_query(query, (serial_id,)))
 
+    @cached_reference(Tables.DIE_DESCRIPTION)
     def getAllDieDescriptions(self) -> List[Dict]:
         """Obtiene todas las descripciones de dies disponibles
 
@@ -145,6 +222,7 @@ class SerialModel:
         """
         return self.db.fetch_all(query)
 
+    @cached_reference(Tables.STATUS_SERIAL)
     def getAllStatus(self) -> List[Dict]:
         """Obtiene todos los status disponibles
 
@@ -158,23 +236,34 @@ class SerialModel:
         """
         return self.db.fetch_all(query)
 
+    @cached_reference(Tables.INCHES, Tables.PARTS, Tables.DIE_DESCRIPTION)
+    def getDieTree(self) -> DieTree:
+        """Carga con una sola consulta la jerarquía inch → part → die description vigente
+
+        El árbol queda en la caché de referencia y se recarga cuando cambian
+        los die descriptions, inches o parts.
+
+        Returns:
+            DieTree: Árbol con los die descriptions no obsoletos
+        """
+        query = """
+            SELECT i.id_inch, i.Inch, p.id_part, p.Part,
+                   d.id_die_description, d.Die_Description
+            FROM die_description d
+            INNER JOIN inches i ON d.id_inch = i.id_inch
+            INNER JOIN parts p ON d.id_part = p.id_part
+            WHERE d.Obsolet = 0
+            ORDER BY i.Inch, p.Part, d.Die_Description
+        """
+        return DieTree(self.db.fetch_all(query))
+
     def getAllInches(self) -> List[Dict]:
         """Obtiene todos los inches disponibles
 
         Returns:
             List[Dict]: Lista de diccionarios con los datos de los inches
         """
-        query = """
-            SELECT i.id_inch, i.Inch
-            FROM inches i
-            WHERE i.id_inch IN (
-                SELECT DISTINCT d.id_inch
-                FROM die_description d
-                WHERE d.Obsolet = 0
-            )
-            ORDER BY i.Inch
-        """
-        return self.db.fetch_all(query)
+        return self.getDieTree().inches()
 
     def getPartsByInch(self, inch_id: int) -> List[Dict]:
         """Obtiene las parts disponibles para un inch específico
@@ -185,14 +274,7 @@ class SerialModel:
         Returns:
             List[Dict]: Lista de diccionarios con los datos de las parts
         """
-        query = """
-            SELECT DISTINCT p.id_part, p.Part
-            FROM parts p
-            INNER JOIN die_description d ON d.id_part = p.id_part
-            WHERE d.id_inch = %s AND d.Obsolet = 0
-            ORDER BY p.Part
-        """
-        return self.db.fetch_all(query, (inch_id,))
+        return self.getDieTree().parts(inch_id)
 
     def getDescriptionsByInchAndPart(self, inch_id: int, part_id: int) -> List[Dict]:
         """Obtiene las descripciones disponibles para un inch y part específicos
@@ -204,15 +286,7 @@ class SerialModel:
         Returns:
             List[Dict]: Lista de diccionarios con los datos de las descripciones
         """
-        query = """
-            SELECT d.id_die_description, d.Die_Description
-            FROM die_description d
-            WHERE d.id_inch = %s 
-            AND d.id_part = %s 
-            AND d.Obsolet = 0
-            ORDER BY d.Die_Description
-        """
-        return self.db.fetch_all(query, (inch_id, part_id))
+        return self.getDieTree().descriptions(inch_id, part_id)
 
     def getDieDescriptionById(self, die_id: int) -> Optional[Dict]:
         """Obtiene los datos completos de un die description por su ID
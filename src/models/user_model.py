@@ -1,28 +1,79 @@
-from database.connection import MySQLConnection
+from database.backend import get_connection
+from database.write_result import WriteResult, execute_write
 from database.database_schema import Tables, Columns
-from typing import List, Dict, Optional
+from database.row_formats import RowFormat
+from database.pagination import Page, SortKey, fetch_page
+from typing import Any, List, Dict, Optional
 import bcrypt
 
 class UserModel:
+    # Ordenamientos permitidos en page(); el último campo de cada uno es único
+    PAGE_SORTS = {
+        'username': (SortKey(f"u.{Columns.Users.USERNAME}", Columns.Users.USERNAME),
+                     SortKey(f"u.{Columns.Users.ID}", Columns.Users.ID)),
+        'id': (SortKey(f"u.{Columns.Users.ID}", Columns.Users.ID),),
+    }
+
+    # Columnas donde busca page(search=...)
+    SEARCH_COLUMNS = (f"u.{Columns.Users.USERNAME}", f"u.{Columns.Users.EMAIL}",
+                      f"w.{Columns.Workers.NAME}")
+
+    # Filtros permitidos en page(filters=...): nombre → columna
+    PAGE_FILTERS = {'worker': f"u.{Columns.Users.WORKER_ID}"}
+
     def __init__(self):
-        self.db = MySQLConnection()
-    
-    def get_all_users(self) -> List[Dict]:
-        """Obtiene todos los usuarios con sus trabajadores asociados"""
-        query = """
+        self.db = get_connection()
+
+    def _users_select(self) -> str:
+        """SELECT de usuarios con su trabajador asociado, sin ordenamiento"""
+        return """
             SELECT u.*, w.{name} as worker_name
             FROM {user} u
             LEFT JOIN {workers} w ON u.{worker_id} = w.{worker_pk}
-            ORDER BY u.{username}
         """.format(
             user=Tables.USER,
             workers=Tables.WORKERS,
             name=Columns.Workers.NAME,
             worker_id=Columns.Users.WORKER_ID,
-            worker_pk=Columns.Workers.ID,
-            username=Columns.Users.USERNAME
+            worker_pk=Columns.Workers.ID
         )
-        return self.db.fetch_all(query)
+    
+    def get_all_users(self, row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Obtiene todos los usuarios con sus trabajadores asociados
+
+        Args:
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+        """
+        query = self._users_select() + """
+            ORDER BY u.{username}
+        """.format(username=Columns.Users.USERNAME)
+        return self.db.fetch_all(query, row_format=row_format)
+
+    def page(self, after_key: Optional[tuple] = None, limit: int = 100,
+             sort: str = 'username',
+             row_format: str = RowFormat.DICT, search: Optional[str] = None,
+             filters: Optional[Dict[str, Any]] = None) -> Page:
+        """Obtiene una página de usuarios con paginación por clave
+
+        Args:
+            after_key (tuple, optional): ``next_key`` de la página anterior; None para la primera
+            limit (int): Usuarios por página
+            sort (str): Uno de PAGE_SORTS; con prefijo ``-`` en orden descendente
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+            search (str, optional): Texto a buscar en SEARCH_COLUMNS (subcadena por término)
+            filters (Dict[str, Any], optional): Valor por filtro de PAGE_FILTERS (None no filtra)
+
+        Returns:
+            Page: Usuarios de la página y clave de la siguiente
+        """
+        return fetch_page(self.db, self._users_select(), self.PAGE_SORTS, 'username',
+                          after_key, limit, sort, row_format=row_format,
+                          search=search, search_columns=self.SEARCH_COLUMNS,
+                          filters=filters, filter_columns=self.PAGE_FILTERS)
+
+    def estimate_count(self) -> int:
+        """Número aproximado de usuarios (para barras de desplazamiento)"""
+        return self.db.estimate_row_count(Tables.USER)
     
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         """Obtiene un usuario por su ID"""
@@ -41,8 +92,8 @@ class UserModel:
         )
         return self.db.fetch_one(query, (user_id,))
     
-    def createUser(self, username: str, email: str, password: str, workerId: int) -> bool:
-        """Crea un nuevo usuario"""
+    def createUser(self, username: str, email: str, password: str, workerId: int) -> WriteResult:
+        """Crea un nuevo usuario; el resultado incluye el ID generado"""
         # Hash de la contraseña
         hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
         
@@ -57,14 +108,14 @@ class UserModel:
             password=Columns.Users.PASSWORD,
             worker_id=Columns.Users.WORKER_ID
         )
-        return bool(self.db.execute_query(query, (
+        return execute_write(self.db, query, (
             username,
             email,
             hashed_password,
             workerId
-        )))
+        ))
     
-    def update_user(self, user_id: int, username: str, email: str, worker_id: Optional[int] = None) -> bool:
+    def update_user(self, user_id: int, username: str, email: str, worker_id: Optional[int] = None) -> WriteResult:
         """Actualiza un usuario existente"""
         query = """
             UPDATE {user}
@@ -79,7 +130,7 @@ class UserModel:
             worker_id=Columns.Users.WORKER_ID,
             id=Columns.Users.ID
         )
-        return bool(self.db.execute_query(query, (username, email, worker_id, user_id)))
+        return execute_write(self.db, query, (username, email, worker_id, user_id))
     
     def update_password(self, user_id: int, new_password: str) -> bool:
         """Actualiza la contraseña de un usuario"""
@@ -210,4 +261,20 @@ class UserModel:
             roles_user=Tables.ROLES_USER,
             user_id=Columns.RolesUser.USER_ID
         )
-        return bool(self.db.execute_query(query, (user_id,))) 
\ No newline at end of file
+        return bool(self.db.execute_query(query, (user_id,)))
+    
+    def set_user_roles(self, user_id: int, role_ids: List[int]) -> bool:
+        """Reemplaza los roles de un usuario en una sola transacción
+
+        La transacción se repite si aborta por deadlock o pérdida de conexión.
+        """
+        def replace_roles():
+            self.remove_all_user_roles(user_id)
+            if role_ids:
+                self.db.insert_many(
+                    Tables.ROLES_USER,
+                    (Columns.RolesUser.USER_ID, Columns.RolesUser.ROLE_ID),
+                    [(user_id, role_id) for role_id in role_ids]
+                )
+        self.db.run_transaction(replace_roles)
+        return True
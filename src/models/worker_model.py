@@ -1,15 +1,22 @@
-from database.connection import MySQLConnection
+from database.backend import get_connection
+from database.write_result import WriteResult, execute_write
+from database.reference_cache import invalidates_reference
 from database.database_schema import Tables, Columns, CommonQueries
+from database.row_formats import RowFormat
 from typing import List, Dict, Optional
 from datetime import datetime
 
 class WorkerModel:
     def __init__(self):
-        self.db = MySQLConnection()
+        self.db = get_connection()
     
-    def getAllWorkers(self) -> List[Dict]:
-        """Obtiene todos los trabajadores con sus posiciones"""
-        return self.db.fetch_all(CommonQueries.GET_WORKER_WITH_POSITION)
+    def getAllWorkers(self, row_format: str = RowFormat.DICT) -> List[Dict]:
+        """Obtiene todos los trabajadores con sus posiciones
+
+        Args:
+            row_format (str): Formato de fila; RowFormat.RECORD evita un dict por fila
+        """
+        return self.db.fetch_all(CommonQueries.GET_WORKER_WITH_POSITION, row_format=row_format)
     
     def getWorkerById(self, workerId: int) -> Optional[Dict]:
         """Obtiene un trabajador por su ID"""
@@ -18,8 +25,9 @@ class WorkerModel:
         )
         return self.db.fetch_one(query, (workerId,))
     
-    def createWorker(self, name: str, positionId: int) -> bool:
-        """Crea un nuevo trabajador"""
+    @invalidates_reference(Tables.WORKERS)
+    def createWorker(self, name: str, positionId: int) -> WriteResult:
+        """Crea un nuevo trabajador; el resultado incluye el ID generado"""
         query = """
             INSERT INTO {workers} ({name}, {position_id})
             VALUES (%s, %s)
@@ -28,9 +36,10 @@ class WorkerModel:
             name=Columns.Workers.NAME,
             position_id=Columns.Workers.POSITION_ID
         )
-        return bool(self.db.execute_query(query, (name, positionId)))
+        return execute_write(self.db, query, (name, positionId))
     
-    def updateWorker(self, workerId: int, name: str, positionId: int) -> bool:
+    @invalidates_reference(Tables.WORKERS)
+    def updateWorker(self, workerId: int, name: str, positionId: int) -> WriteResult:
         """Actualiza un trabajador existente"""
         query = """
             UPDATE {workers}
@@ -43,8 +52,9 @@ class WorkerModel:
             position_id=Columns.Workers.POSITION_ID,
             id=Columns.Workers.ID
         )
-        return bool(self.db.execute_query(query, (name, positionId, workerId)))
+        return execute_write(self.db, query, (name, positionId, workerId))
     
+    @invalidates_reference(Tables.WORKERS)
     def deleteWorker(self, workerId: int) -> bool:
         """Elimina un trabajador"""
         query = "DELETE FROM {workers} WHERE {id} = %s".format(
@@ -0,0 +1,51 @@
+from database.connection import MySQLConnection
+
+# Índices en los que se apoyan los ordenamientos (PAGE_SORTS) y filtros (PAGE_FILTERS)
+# de los listados paginados; sin ellos, cada página ordena la tabla completa
+SORT_INDEXES = [
+    ('damage_report', 'ix_damage_report_create_time', ('create_time', 'id_dagame_report')),
+    ('damage_report', 'ix_damage_report_status_time', ('id_dr_status', 'create_time')),
+    ('damage_report', 'ix_damage_report_serial', ('id_serial', 'id_dagame_report')),
+    ('products', 'ix_products_product', ('Product',)),
+    ('products', 'ix_products_die_product', ('id_die_description', 'Product', 'id_product')),
+    ('serials', 'ix_serials_status_serial', ('id_status', 'Serial')),
+    ('serials', 'ix_serials_die_serial', ('id_die_description', 'Serial', 'id_serial')),
+    ('die_description', 'ix_die_description_inch',
+     ('id_inch', 'id_description', 'id_part', 'id_die_description')),
+    ('die_description', 'ix_die_description_part', ('id_part',)),
+    ('user', 'ix_user_username', ('username',)),
+]
+
+def index_exists(db: MySQLConnection, table: str, columns: tuple) -> bool:
+    """Indica si algún índice empieza por las columnas indicadas, en ese orden"""
+    query = """
+        SELECT INDEX_NAME, GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX) AS index_columns
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+        GROUP BY INDEX_NAME
+    """
+    wanted = [column.lower() for column in columns]
+    for row in db.fetch_all(query, (db.database, table)):
+        existing = row['index_columns'].lower().split(',')
+        if existing[:len(wanted)] == wanted:
+            return True
+    return False
+
+def create_sort_indexes():
+    """Crea los índices de ordenamiento y filtro que faltan"""
+    db = MySQLConnection()
+
+    for table, index_name, columns in SORT_INDEXES:
+        try:
+            if index_exists(db, table, columns):
+                print(f"{table}({', '.join(columns)}) ya tiene un índice")
+                continue
+
+            column_list = ', '.join(f"`{column}`" for column in columns)
+            db.execute_query(f"ALTER TABLE {table} ADD INDEX {index_name} ({column_list})")
+            print(f"Índice {index_name} creado en {table}({', '.join(columns)})")
+        except Exception as e:
+            print(f"Error creando el índice {index_name}: {str(e)}")
+
+if __name__ == "__main__":
+    create_sort_indexes()
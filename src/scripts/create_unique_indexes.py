@@ -0,0 +1,37 @@
+from database.connection import MySQLConnection
+from database.unique_indexes import UNIQUE_INDEXES
+
+def find_duplicates(db: MySQLConnection, table: str, column: str):
+    """Devuelve los valores repetidos que impedirían crear el índice"""
+    query = f"""
+        SELECT `{column}` AS value, COUNT(*) AS total
+        FROM {table}
+        GROUP BY `{column}`
+        HAVING COUNT(*) > 1
+    """
+    return db.fetch_all(query)
+
+def create_unique_indexes():
+    """Crea los índices únicos que faltan, informando los duplicados existentes"""
+    db = MySQLConnection()
+
+    for table, index_name, column in UNIQUE_INDEXES:
+        try:
+            if db.has_unique_index(table, column):
+                print(f"{table}.{column} ya tiene un índice único")
+                continue
+
+            duplicates = find_duplicates(db, table, column)
+            if duplicates:
+                print(f"No se puede crear {index_name}: {len(duplicates)} valores repetidos en {table}.{column}")
+                for row in duplicates:
+                    print(f"    {row['value']!r} ({row['total']} filas)")
+                continue
+
+            db.execute_query(f"ALTER TABLE {table} ADD UNIQUE INDEX {index_name} (`{column}`)")
+            print(f"Índice {index_name} creado en {table}.{column}")
+        except Exception as e:
+            print(f"Error creando el índice {index_name}: {str(e)}")
+
+if __name__ == "__main__":
+    create_unique_indexes()
@@ -0,0 +1,37 @@
+import sys
+import os
+
+# Agregar el directorio src al path de Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.serial_damage_summary import SerialDamageSummary
+
+def rebuild_damage_summary(check_only: bool = False):
+    """Crea, verifica y reconstruye el resumen de damage reports por serial
+
+    Args:
+        check_only (bool): Solo informar las diferencias, sin reconstruir
+    """
+    summary = SerialDamageSummary()
+    try:
+        summary.createTable()
+
+        mismatches = summary.check()
+        if not mismatches:
+            print(f"{summary.table} coincide con los damage reports")
+            return
+        print(f"{len(mismatches)} serials no coinciden (report_count, open_count, last_damage_time):")
+        for serial_id, stored, computed in mismatches[:20]:
+            print(f"    serial {serial_id}: guardado {stored}, calculado {computed}")
+        if len(mismatches) > 20:
+            print(f"    ... y {len(mismatches) - 20} más")
+
+        if check_only:
+            return
+        serials = summary.rebuild()
+        print(f"{summary.table} reconstruida: {serials} serials con reportes")
+    except Exception as e:
+        print(f"Error reconstruyendo {summary.table}: {str(e)}")
+
+if __name__ == "__main__":
+    rebuild_damage_summary(check_only='--check' in sys.argv[1:])
@@ -0,0 +1,36 @@
+import os
+import sys
+import json
+import argparse
+from database.query_stats import format_report
+
+def main():
+    parser = argparse.ArgumentParser(description="Muestra las consultas con mayor tiempo acumulado")
+    parser.add_argument('file', nargs='?', default=os.getenv('DB_QUERY_STATS_FILE', 'query_stats.json'),
+                        help="Archivo JSON guardado por la aplicación (DB_QUERY_STATS_FILE)")
+    parser.add_argument('--top', type=int, default=10, help="Número de consultas a mostrar")
+    parser.add_argument('--order-by', default='total_ms',
+                        choices=['total_ms', 'count', 'p50_ms', 'p95_ms', 'max_ms', 'rows'],
+                        help="Métrica para ordenar")
+    parser.add_argument('--plans', action='store_true',
+                        help="Mostrar los planes EXPLAIN capturados (DB_EXPLAIN_SLOW=1)")
+    args = parser.parse_args()
+
+    try:
+        with open(args.file, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error al leer {args.file}: {str(e)}")
+        sys.exit(1)
+
+    entries = sorted(data.get('queries', []), key=lambda entry: entry[args.order_by], reverse=True)
+    print(f"\nConsultas más costosas (umbral de consulta lenta: {data.get('slow_threshold_ms')} ms)\n")
+    print(format_report(entries[:args.top]))
+
+    if args.plans:
+        for query, entry in data.get('plans', {}).items():
+            print(f"\n{query}")
+            print(json.dumps(entry['plan'], indent=2))
+
+if __name__ == "__main__":
+    main()
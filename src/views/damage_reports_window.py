@@ -0,0 +1,293 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
+                             QPushButton, QHeaderView,
+                             QSpacerItem, QSizePolicy, QMessageBox)
+from PyQt5.QtGui import QPixmap, QIcon
+from PyQt5.QtCore import Qt
+import os
+from models.damage_report_model import DamageReportModel
+from database.database_schema import Columns
+from views.dialogs.damage_report_dialog import DamageReportDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
+from views.widgets.filter_combo import FilterCombo
+from views.widgets.background_loader import BackgroundLoader
+
+# Con más reportes nuevos, recargar la página cuesta menos que consultarlos por ID
+MAX_ROW_REFRESH = 50
+
+class DamageReportsWindow(QWidget):
+    def __init__(self):
+        """Inicializa la ventana de damage reports"""
+        super().__init__()
+        self.setWindowTitle("Damage Reports")
+
+        # Establecer el ícono de la ventana
+        iconPath = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'icono.ico')
+        if os.path.exists(iconPath):
+            self.setWindowIcon(QIcon(iconPath))
+
+        self.model = DamageReportModel()
+        self.countLoader = BackgroundLoader(self)
+        self.countLoader.loaded.connect(self._showCount)
+        # Escritura de los reportes en cola (flush) fuera del hilo de la interfaz
+        self.flushLoader = BackgroundLoader(self)
+        self.flushLoader.loaded.connect(self._flushed)
+        self.flushLoader.failed.connect(self._flushed)
+        self.submitLoader = BackgroundLoader(self)
+        self.submitLoader.loaded.connect(self._checkSubmitted)
+        # Reportes registrados en el diálogo que aún no aparecen en la tabla
+        self.pendingReports = []
+        self.setupUi()
+        self.loadData()
+
+    def setupUi(self):
+        # Layout principal
+        mainLayout = QVBoxLayout()
+        mainLayout.setContentsMargins(10, 10, 10, 10)
+        mainLayout.setSpacing(10)
+        self.setLayout(mainLayout)
+
+        # Frame superior para el logo
+        topFrame = QFrame()
+        topFrame.setStyleSheet("""
+            QFrame {
+                background-color: white;
+                border: 1px solid #cccccc;
+                border-radius: 5px;
+                padding: 5px;
+            }
+        """)
+        topFrame.setFrameShape(QFrame.StyledPanel)
+        topLayout = QHBoxLayout(topFrame)
+        topLayout.setContentsMargins(5, 5, 5, 5)
+
+        # Título de la sección
+        titleLabel = QLabel("Damage Reports")
+        titleLabel.setStyleSheet("font-size: 16px; font-weight: bold; color: #333;")
+        topLayout.addWidget(titleLabel)
+
+        # Agregar espaciador entre el título y el logo
+        topLayout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
+
+        # Agregar logo
+        logoLabel = QLabel()
+        logoPath = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'logo_masternet.png')
+        if os.path.exists(logoPath):
+            pixmap = QPixmap(logoPath)
+            scaledPixmap = pixmap.scaled(108, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            logoLabel.setPixmap(scaledPixmap)
+            logoLabel.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+        topLayout.addWidget(logoLabel)
+        mainLayout.addWidget(topFrame)
+
+        # Frame principal para el contenido
+        contentFrame = QFrame()
+        contentFrame.setStyleSheet("""
+            QFrame {
+                background-color: white;
+                border: 1px solid #cccccc;
+                border-radius: 5px;
+            }
+            QPushButton {
+                background-color: #0056b3;
+                color: white;
+                border: none;
+                padding: 5px 15px;
+                border-radius: 3px;
+                min-width: 80px;
+            }
+            QPushButton:hover {
+                background-color: #003d80;
+            }
+            QPushButton#deleteButton {
+                background-color: #dc3545;
+            }
+            QPushButton#deleteButton:hover {
+                background-color: #c82333;
+            }
+            QTableView {
+                border: 1px solid #cccccc;
+                border-radius: 3px;
+                background-color: white;
+            }
+            QHeaderView::section {
+                background-color: #f8f9fa;
+                padding: 5px;
+                border: 1px solid #cccccc;
+                font-weight: bold;
+            }
+        """)
+        contentLayout = QVBoxLayout(contentFrame)
+
+        # Barra de herramientas
+        toolbar = QHBoxLayout()
+
+        self.countLabel = QLabel("")
+        self.countLabel.setStyleSheet("color: #6c757d; border: none;")
+        toolbar.addWidget(self.countLabel)
+
+        # Espaciador
+        toolbar.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
+
+        # Botones
+        self.addButton = QPushButton("Add Report")
+        self.editButton = QPushButton("Edit")
+        self.deleteButton = QPushButton("Delete")
+        self.deleteButton.setObjectName("deleteButton")
+
+        toolbar.addWidget(self.addButton)
+        toolbar.addWidget(self.editButton)
+        toolbar.addWidget(self.deleteButton)
+
+        contentLayout.addLayout(toolbar)
+
+        # Tabla de reportes
+        self.columns = [
+            ("ID", Columns.DamageReport.ID),
+            ("Date", Columns.DamageReport.CREATE_TIME),
+            ("Serial", 'Serial'),
+            ("Line", Columns.Lines.LINE),
+            ("Product", 'Product'),
+            ("Description", 'DRDescription'),
+            ("Explanation", 'Explanation'),
+            ("Sample", Columns.DamageReport.SAMPLE),
+            ("Supervisor", 'SupervisorName'),
+            ("Operator", 'OperatorName'),
+            ("Status", 'DRStatus'),
+            ("Note", Columns.DamageReport.NOTE),
+        ]
+        # Los turnos acumulan miles de reportes: se piden por página al desplazarse
+        self.tableModel = RecordTableModel(self.columns, self, id_field=Columns.DamageReport.ID,
+                                           fetch_one=self.model.getReportById,
+                                           fetch_many=self.model.getReportsByIds,
+                                           search_fields=('Serial', 'Product', 'DRDescription', 'Explanation',
+                                                          'SupervisorName', 'OperatorName'),
+                                           sort_fields={Columns.DamageReport.ID: 'id',
+                                                        Columns.DamageReport.CREATE_TIME: 'date',
+                                                        'Serial': 'serial'})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.tableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        # Filtro por status del reporte (en el servidor)
+        self.statusFilter = FilterCombo(self.tableModel, 'status',
+                                        lambda: [(status[Columns.DRStatus.STATUS],
+                                                  status[Columns.DRStatus.ID])
+                                                 for status in self.model.drStatusModel.getAllStatus()],
+                                        field=Columns.DamageReport.DR_STATUS_ID,
+                                        all_text="All statuses")
+        toolbar.insertWidget(1, self.statusFilter)
+        self.table = RecordTableView(self.tableModel)
+        self.table.verticalHeader().setVisible(False)
+
+        # Ajustar columnas
+        header = self.table.horizontalHeader()
+        for column in range(len(self.columns)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(len(self.columns) - 1, QHeaderView.Stretch)  # Note
+
+        contentLayout.addWidget(self.table)
+
+        mainLayout.addWidget(contentFrame)
+
+        # Ocultar columna de ID
+        self.table.setColumnHidden(0, True)
+
+        # Conectar señales
+        self.addButton.clicked.connect(self.addReport)
+        self.editButton.clicked.connect(self.editReport)
+        self.deleteButton.clicked.connect(self.deleteReport)
+
+        # Establecer un tamaño mínimo para la ventana
+        self.setMinimumSize(1000, 600)
+
+    def loadData(self):
+        """Carga la primera página de reportes en la tabla
+
+        Los reportes registrados en esta terminal deben aparecer en la lista:
+        la página se pide después de escribirlos, sin bloquear la ventana.
+        """
+        self.flushLoader.load(self.model.flush)
+        self.countLoader.load(self.model.estimate_count)
+
+    def _flushed(self, *args):
+        """Pide la primera página una vez escritos los reportes en cola"""
+        self.tableModel.setPager(self.model.page)
+
+    def _showCount(self, count):
+        """Muestra el número aproximado de reportes"""
+        self.countLabel.setText(f"About {count} reports")
+
+    def _writeSubmitted(self, futures):
+        """Escribe los reportes en cola (en el hilo de la carga)
+
+        Returns:
+            list: Los mismos futures, resueltos salvo que venza la espera
+        """
+        self.model.flush()
+        return futures
+
+    def _checkSubmitted(self, futures):
+        """Avisa si alguno de los reportes registrados no pudo escribirse y muestra los escritos
+
+        Los que siguen sin escribirse quedan pendientes para el siguiente registro.
+        """
+        done = [future for future in futures if future.done()]
+        self.pendingReports = [future for future in self.pendingReports if not future.done()]
+        failed = [future for future in done if future.exception()]
+        if failed:
+            QMessageBox.critical(self, "Error",
+                                 f"{len(failed)} of {len(futures)} reports could not be saved:\n"
+                                 f"{failed[0].exception()}")
+        reportIds = [future.result() for future in done if not future.exception()]
+        if len(reportIds) > MAX_ROW_REFRESH:
+            self.tableModel.reload()
+        else:
+            # Una consulta por todos los IDs; sin ID (None) recarga el listado
+            self.tableModel.refreshRecords(reportIds)
+
+    def addReport(self):
+        """Abre el diálogo para agregar reportes"""
+        dialog = DamageReportDialog(self)
+        if dialog.exec_():
+            self.pendingReports.extend(dialog.submitted)
+            self.submitLoader.load(self._writeSubmitted, list(self.pendingReports))
+
+    def editReport(self):
+        """Abre el diálogo para editar el reporte seleccionado"""
+        report = self.table.selectedRecord()
+        if report is None:
+            QMessageBox.warning(self, "Selection Required", "Please select a report to edit")
+            return
+
+        reportId = report[Columns.DamageReport.ID]
+        row = self.table.selectedRow()
+        dialog = DamageReportDialog(self, reportId)
+        if dialog.exec_():
+            self.tableModel.refreshRecord(reportId, row)
+
+    def deleteReport(self):
+        """Elimina el reporte seleccionado"""
+        report = self.table.selectedRecord()
+        if report is None:
+            QMessageBox.warning(self, "Selection Required", "Please select a report to delete")
+            return
+
+        reportId = report[Columns.DamageReport.ID]
+        serialNumber = report['Serial']
+        row = self.table.selectedRow()
+
+        reply = QMessageBox.question(
+            self,
+            "Confirm Deletion",
+            f"Are you sure you want to delete the report for serial {serialNumber}?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+
+        if reply == QMessageBox.Yes:
+            if self.model.deleteReport(reportId):
+                self.tableModel.removeId(reportId, row)
+            else:
+                QMessageBox.critical(self, "Error", "Failed to delete report")
@@ -7,6 +7,8 @@ class DescriptionDialog(QDialog):
         super().__init__(parent)
         self.description_model = DescriptionModel()
         self.description_data = description_data
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.setupUI()
 
     def setupUI(self):
@@ -113,6 +115,7 @@ class DescriptionDialog(QDialog):
             success = self.description_model.create_description(value)
         
         if success:
+            self.saved_id = self.description_data['id_description'] if self.description_data else success.id
             self.accept()
         else:
             QMessageBox.critical(
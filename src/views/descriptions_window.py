@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.description_model import DescriptionModel
 from views.description_dialog import DescriptionDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class DescriptionsWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class DescriptionsWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,16 +122,21 @@ class DescriptionsWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de descriptions
-        self.descriptionsTable = QTableWidget()
-        self.descriptionsTable.setColumnCount(1)
-        self.descriptionsTable.setHorizontalHeaderLabels(['Description'])
+        self.descriptionsTableModel = RecordTableModel([('Description', 'Description')], self,
+                                                       id_field='id_description',
+                                                       fetch_one=self.description_model.get_description_by_id,
+                                                       search_fields=('Description',),
+                                                       sort_fields={'Description':
+                                                                    self.description_model.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.descriptionsTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.descriptionsTable = RecordTableView(self.descriptionsTableModel)
         
         # Configurar la tabla
         header = self.descriptionsTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        self.descriptionsTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.descriptionsTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.descriptionsTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.descriptionsTable)
         mainLayout.addWidget(contentFrame)
@@ -144,35 +151,17 @@ class DescriptionsWindow(QWidget):
 
     def load_descriptions(self):
         """Carga las descriptions en la tabla"""
-        self.descriptionsTable.setRowCount(0)
-        descriptions = self.description_model.get_all_descriptions()
-        
-        # Crear un diccionario para almacenar la relación entre description y su ID
-        self.description_ids = {}
-        
-        for row, description in enumerate(descriptions):
-            self.descriptionsTable.insertRow(row)
-            
-            # Description
-            description_item = QTableWidgetItem(description['Description'])
-            self.descriptionsTable.setItem(row, 0, description_item)
-            
-            # Guardar el ID asociado a esta description
-            self.description_ids[row] = description['id_description']
+        self.descriptionsTableModel.setPager(self.description_model.page)
 
     def get_selected_description_id(self):
         """Obtiene el ID de la description seleccionada"""
-        selectedItems = self.descriptionsTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.description_ids[selectedRow]
+        return self.descriptionsTable.selectedValue('id_description')
 
     def show_add_dialog(self):
         """Muestra el diálogo para agregar una nueva description"""
         dialog = DescriptionDialog(self)
         if dialog.exec_() == DescriptionDialog.Accepted:
-            self.load_descriptions()
+            self.descriptionsTableModel.refreshRecord(dialog.saved_id)
 
     def edit_selected(self):
         """Edita la description seleccionada"""
@@ -181,14 +170,14 @@ class DescriptionsWindow(QWidget):
             QMessageBox.warning(self, "Selection Required", "Please select a description to edit")
             return
             
-        # Obtener los datos de la description
-        descriptions = self.description_model.get_all_descriptions()
-        description_data = next((desc for desc in descriptions if desc['id_description'] == description_id), None)
+        # Solo la fila seleccionada, por su clave primaria
+        row = self.descriptionsTable.selectedRow()
+        description_data = self.description_model.get_description_by_id(description_id)
         
         if description_data:
             dialog = DescriptionDialog(self, description_data)
             if dialog.exec_() == DescriptionDialog.Accepted:
-                self.load_descriptions()
+                self.descriptionsTableModel.refreshRecord(description_id, row)
 
     def delete_selected(self):
         """Elimina la description seleccionada"""
@@ -196,6 +185,7 @@ class DescriptionsWindow(QWidget):
         if not description_id:
             QMessageBox.warning(self, "Selection Required", "Please select a description to delete")
             return
+        row = self.descriptionsTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -207,7 +197,7 @@ class DescriptionsWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.description_model.delete_description(description_id):
-                self.load_descriptions()
+                self.descriptionsTableModel.removeId(description_id, row)
                 QMessageBox.information(self, "Success", "Description deleted successfully!")
             else:
                 QMessageBox.critical(self, "Error", "Could not delete the description.") 
\ No newline at end of file
@@ -0,0 +1,304 @@
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                             QLineEdit, QComboBox, QPushButton, QMessageBox,
+                             QFrame, QCompleter)
+from PyQt5.QtCore import Qt, QStringListModel
+from models.damage_report_model import DamageReportModel
+from database.database_schema import Columns
+from views.widgets.background_loader import BackgroundLoader
+
+# Caracteres escritos antes de consultar sugerencias de serial
+SERIAL_MIN_PREFIX = 2
+# Sugerencias de serial mostradas
+SERIAL_COMPLETIONS = 20
+
+class DamageReportDialog(QDialog):
+    def __init__(self, parent=None, report_id=None):
+        """Inicializa el diálogo de damage reports
+
+        Los reportes nuevos se registran en el agrupador de inserciones y el
+        diálogo no espera a la base de datos; con "Save && New" queda abierto
+        para capturar el siguiente reporte de la misma línea.
+
+        Args:
+            parent: Widget padre
+            report_id (int, optional): ID del reporte a editar. Defaults to None.
+        """
+        super().__init__(parent)
+        self.report_id = report_id
+        self.model = DamageReportModel()
+        # Futures de los reportes registrados en esta sesión del diálogo
+        self.submitted = []
+        # Listas de referencia desde la caché, cargadas una sola vez
+        self.lookups = self.model.getLookups()
+        self.setupUi()
+
+        if report_id:
+            self.setWindowTitle("Edit Damage Report")
+            self.loadReportData()
+        else:
+            self.setWindowTitle("New Damage Report")
+
+    def setupUi(self):
+        """Configura la interfaz de usuario"""
+        self.setModal(True)
+        self.resize(450, 500)
+
+        # Layout principal
+        mainLayout = QVBoxLayout(self)
+        mainLayout.setContentsMargins(10, 10, 10, 10)
+        mainLayout.setSpacing(10)
+
+        # Establecer el estilo para todo el diálogo
+        self.setStyleSheet("""
+            QDialog {
+                background-color: white;
+            }
+            QLabel {
+                color: #333333;
+            }
+            QLineEdit, QComboBox {
+                padding: 5px;
+                border: 1px solid #cccccc;
+                border-radius: 3px;
+                background-color: white;
+                min-width: 200px;
+            }
+            QLineEdit:focus, QComboBox:focus {
+                border: 1px solid #0056b3;
+            }
+            QPushButton {
+                background-color: #0056b3;
+                color: white;
+                border: none;
+                padding: 5px 15px;
+                border-radius: 3px;
+                min-width: 80px;
+            }
+            QPushButton:hover {
+                background-color: #003d80;
+            }
+            QPushButton[text="Cancel"] {
+                background-color: #6c757d;
+            }
+            QPushButton[text="Cancel"]:hover {
+                background-color: #545b62;
+            }
+        """)
+
+        # Frame para el contenido
+        contentFrame = QFrame()
+        contentFrame.setStyleSheet("""
+            QFrame {
+                background-color: white;
+                border: 1px solid #cccccc;
+                border-radius: 5px;
+            }
+        """)
+
+        self.contentLayout = QVBoxLayout(contentFrame)
+        self.contentLayout.setSpacing(10)
+        self.contentLayout.setContentsMargins(20, 20, 20, 20)
+
+        # Serial (las sugerencias se consultan por prefijo en segundo plano;
+        # al guardar se resuelve por índice)
+        self.serialInput = QLineEdit()
+        self.serialInput.setMaxLength(15)
+        self.serialInput.setPlaceholderText("Enter serial number")
+        self.serialInput.textChanged.connect(self._convert_to_upper)
+        self.serialSuggestions = QStringListModel(self)
+        self.serialCompleter = QCompleter(self.serialSuggestions, self)
+        self.serialCompleter.setCaseSensitivity(Qt.CaseInsensitive)
+        self.serialInput.setCompleter(self.serialCompleter)
+        self.serialLoader = BackgroundLoader(self)
+        self.serialLoader.loaded.connect(self._serialsLoaded)
+        self.serialInput.textEdited.connect(self._serialEdited)
+        self._addRow("Serial:", self.serialInput)
+
+        workers = self.lookups['workers']
+        self.supervisorCombo = self._combo(workers, Columns.Workers.ID, Columns.Workers.NAME, "Select Supervisor")
+        self._addRow("Supervisor:", self.supervisorCombo)
+        self.operatorCombo = self._combo(workers, Columns.Workers.ID, Columns.Workers.NAME, "Select Operator")
+        self._addRow("Operator:", self.operatorCombo)
+        self.lineCombo = self._combo(self.lookups['lines'], Columns.Lines.ID, Columns.Lines.LINE, "Select Line")
+        self._addRow("Line:", self.lineCombo)
+        self.productCombo = self._combo(self.lookups['products'], 'id_product', 'Product', "Select Product")
+        self._addRow("Product:", self.productCombo)
+        self.descriptionCombo = self._combo(self.lookups['dr_descriptions'], Columns.DRDescription.ID,
+                                            Columns.DRDescription.DESCRIPTION, "Select Description")
+        self._addRow("Description:", self.descriptionCombo)
+        self.explanationCombo = self._combo(self.lookups['explanations'], Columns.Explanation.ID,
+                                            Columns.Explanation.EXPLANATION, "Select Explanation")
+        self._addRow("Explanation:", self.explanationCombo)
+
+        self.sampleInput = QLineEdit()
+        self.sampleInput.setPlaceholderText("Sample")
+        self._addRow("Sample:", self.sampleInput)
+
+        self.noteInput = QLineEdit()
+        self.noteInput.setPlaceholderText("Optional note")
+        self._addRow("Note:", self.noteInput)
+
+        self.statusCombo = self._combo(self.lookups['dr_status'], Columns.DRStatus.ID,
+                                       Columns.DRStatus.STATUS, "Select Status")
+        self._addRow("Status:", self.statusCombo)
+
+        mainLayout.addWidget(contentFrame)
+
+        # Reportes registrados en esta sesión
+        self.queuedLabel = QLabel("")
+        self.queuedLabel.setStyleSheet("color: #6c757d;")
+        mainLayout.addWidget(self.queuedLabel)
+
+        # Botones
+        buttonLayout = QHBoxLayout()
+        buttonLayout.addStretch()
+
+        self.saveButton = QPushButton("Save")
+        self.saveNewButton = QPushButton("Save && New")
+        self.cancelButton = QPushButton("Cancel")
+        self.saveNewButton.setVisible(not self.report_id)
+
+        self.saveButton.clicked.connect(self.saveReport)
+        self.saveNewButton.clicked.connect(self.saveAndNew)
+        self.cancelButton.clicked.connect(self.reject)
+
+        buttonLayout.addWidget(self.saveButton)
+        buttonLayout.addWidget(self.saveNewButton)
+        buttonLayout.addWidget(self.cancelButton)
+        mainLayout.addLayout(buttonLayout)
+
+    def _addRow(self, text: str, widget):
+        """Agrega una fila etiqueta + campo al formulario"""
+        rowLayout = QHBoxLayout()
+        label = QLabel(text)
+        label.setMinimumWidth(100)
+        rowLayout.addWidget(label)
+        rowLayout.addWidget(widget)
+        self.contentLayout.addLayout(rowLayout)
+
+    def _combo(self, rows, id_column: str, text_column: str, placeholder: str) -> QComboBox:
+        """Crea un combo con las filas de una lista de referencia"""
+        combo = QComboBox()
+        combo.addItem(placeholder, None)
+        for row in rows:
+            combo.addItem(str(row[text_column]), row[id_column])
+        return combo
+
+    def _select(self, combo: QComboBox, value):
+        """Selecciona en un combo el elemento con el dato indicado"""
+        index = combo.findData(value)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+
+    def loadReportData(self):
+        """Carga los datos del reporte a editar"""
+        report = self.model.getReportById(self.report_id)
+        if report:
+            DR = Columns.DamageReport
+            self.serialInput.setText(report['Serial'] or '')
+            self._select(self.supervisorCombo, report[DR.SUPERVISOR_ID])
+            self._select(self.operatorCombo, report[DR.OPERATOR_ID])
+            self._select(self.lineCombo, report[DR.LINE_ID])
+            self._select(self.productCombo, report[DR.PRODUCT_ID])
+            self._select(self.descriptionCombo, report[DR.DR_DESCRIPTION_ID])
+            self._select(self.explanationCombo, report[DR.EXPLANATION_ID])
+            self.sampleInput.setText(str(report[DR.SAMPLE] or ''))
+            self.noteInput.setText(report[DR.NOTE] or '')
+            self._select(self.statusCombo, report[DR.DR_STATUS_ID])
+
+    def _serialEdited(self, text):
+        """Pide las sugerencias del prefijo escrito (la última petición reemplaza a las anteriores)"""
+        prefix = text.strip().upper()
+        if len(prefix) < SERIAL_MIN_PREFIX:
+            self.serialLoader.cancel()
+            self.serialSuggestions.setStringList([])
+            return
+        self.serialLoader.load(self.model.searchSerials, prefix, SERIAL_COMPLETIONS)
+
+    def _serialsLoaded(self, serials):
+        """Muestra las sugerencias recibidas"""
+        self.serialSuggestions.setStringList(serials)
+        if self.serialInput.hasFocus():
+            self.serialCompleter.complete()
+
+    def _convert_to_upper(self, text):
+        """Convierte el texto a mayúsculas y actualiza el campo"""
+        cursor_pos = self.serialInput.cursorPosition()
+        self.serialInput.setText(text.upper())
+        self.serialInput.setCursorPosition(cursor_pos)
+
+    def _formValues(self):
+        """Valida el formulario y devuelve los argumentos del modelo, o None"""
+        serial = self.serialInput.text().strip().upper()
+        serial_id = self.model.resolveSerial(serial) if serial else None
+        if not serial_id:
+            QMessageBox.warning(self, "Validation Error", f"Serial {serial} does not exist" if serial
+                                else "Serial number is required")
+            self.serialInput.setFocus()
+            return None
+
+        required = (
+            (self.supervisorCombo, "Please select a Supervisor"),
+            (self.operatorCombo, "Please select an Operator"),
+            (self.lineCombo, "Please select a Line"),
+            (self.productCombo, "Please select a Product"),
+            (self.descriptionCombo, "Please select a Description"),
+            (self.explanationCombo, "Please select an Explanation"),
+            (self.statusCombo, "Please select a Status"),
+        )
+        for combo, message in required:
+            if not combo.currentData():
+                QMessageBox.warning(self, "Validation Error", message)
+                combo.setFocus()
+                return None
+
+        return (serial_id, self.supervisorCombo.currentData(), self.operatorCombo.currentData(),
+                self.lineCombo.currentData(), self.productCombo.currentData(),
+                self.descriptionCombo.currentData(), self.explanationCombo.currentData(),
+                self.sampleInput.text().strip(), self.noteInput.text().strip(),
+                self.statusCombo.currentData())
+
+    def _submit(self) -> bool:
+        """Registra el reporte en el agrupador de inserciones"""
+        values = self._formValues()
+        if values is None:
+            return False
+        future = self.model.submitReport(*values)
+        if future is None:
+            QMessageBox.warning(self, "Error",
+                                "Could not save report. Please verify the entered data.")
+            return False
+        self.submitted.append(future)
+        return True
+
+    def saveReport(self):
+        """Valida y guarda los datos del reporte"""
+        if self.report_id:  # Editar
+            values = self._formValues()
+            if values is None:
+                return
+            if self.model.updateReport(self.report_id, *values):
+                self.accept()
+            else:
+                QMessageBox.warning(self, "Error",
+                                    "Could not save report. Please verify the entered data.")
+        elif self._submit():  # Nuevo
+            self.accept()
+
+    def saveAndNew(self):
+        """Registra el reporte y limpia el formulario para el siguiente"""
+        if not self._submit():
+            return
+        # Línea, supervisor, operador y producto se conservan para la ráfaga
+        self.serialInput.clear()
+        self.sampleInput.clear()
+        self.noteInput.clear()
+        self.queuedLabel.setText(f"{len(self.submitted)} report(s) registered")
+        self.serialInput.setFocus()
+
+    def reject(self):
+        """Cierra el diálogo; si ya se registraron reportes, se considera aceptado"""
+        if self.submitted:
+            self.accept()
+        else:
+            super().reject()
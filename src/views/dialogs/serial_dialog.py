@@ -14,7 +14,11 @@ class SerialDialog(QDialog):
         """
         super().__init__(parent)
         self.serial_id = serial_id
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.model = SerialModel()
+        # Jerarquía inch → part → die cargada una sola vez para los tres combos
+        self.dieTree = self.model.getDieTree()
         self.setupUi()
         
         if serial_id:
@@ -182,7 +186,7 @@ class SerialDialog(QDialog):
 
     def loadInches(self):
         """Carga los inches en el combo"""
-        inches = self.model.getAllInches()
+        inches = self.dieTree.inches()
         self.inchCombo.clear()
         self.inchCombo.addItem("Select Inch", None)
         for inch in inches:
@@ -190,7 +194,7 @@ class SerialDialog(QDialog):
 
     def loadParts(self, inch_id: int):
         """Carga las parts en el combo basado en el inch seleccionado"""
-        parts = self.model.getPartsByInch(inch_id) if inch_id else []
+        parts = self.dieTree.parts(inch_id) if inch_id else []
         self.partCombo.clear()
         self.partCombo.addItem("Select Part", None)
         for part in parts:
@@ -198,7 +202,7 @@ class SerialDialog(QDialog):
 
     def loadDescriptions(self, inch_id: int, part_id: int):
         """Carga las descripciones en el combo basado en el inch y part seleccionados"""
-        descriptions = self.model.getDescriptionsByInchAndPart(inch_id, part_id) if inch_id and part_id else []
+        descriptions = self.dieTree.descriptions(inch_id, part_id) if inch_id and part_id else []
         self.dieCombo.clear()
         self.dieCombo.addItem("Select Description", None)
         for desc in descriptions:
@@ -234,21 +238,27 @@ class SerialDialog(QDialog):
         if serial_data:
             self.serialInput.setText(serial_data['Serial'])
             
-            # Obtener los datos del die description para seleccionar inch y part
+            # Ubicar inch y part del die description en el árbol (sin consultar la base);
+            # los obsoletos no están en el árbol y se consultan por ID
             die_id = serial_data['id_die_description']
-            die_data = self.model.getDieDescriptionById(die_id)
-            if die_data:
+            location = self.dieTree.locate(die_id)
+            if location is None:
+                die_data = self.model.getDieDescriptionById(die_id)
+                if die_data:
+                    location = (die_data['id_inch'], die_data['id_part'])
+            if location:
+                inch_id, part_id = location
                 # Seleccionar Inch
-                inch_index = self.inchCombo.findData(die_data['id_inch'])
+                inch_index = self.inchCombo.findData(inch_id)
                 if inch_index >= 0:
                     self.inchCombo.setCurrentIndex(inch_index)
                     # Cargar y seleccionar Part
-                    self.loadParts(die_data['id_inch'])
-                    part_index = self.partCombo.findData(die_data['id_part'])
+                    self.loadParts(inch_id)
+                    part_index = self.partCombo.findData(part_id)
                     if part_index >= 0:
                         self.partCombo.setCurrentIndex(part_index)
                         # Cargar y seleccionar Description
-                        self.loadDescriptions(die_data['id_inch'], die_data['id_part'])
+                        self.loadDescriptions(inch_id, part_id)
                         die_index = self.dieCombo.findData(die_id)
                         if die_index >= 0:
                             self.dieCombo.setCurrentIndex(die_index)
@@ -291,15 +301,19 @@ class SerialDialog(QDialog):
             self.statusCombo.setFocus()
             return
             
-        success = False
         if self.serial_id:  # Editar
-            success = self.model.updateSerial(self.serial_id, serial, die_id, 
-                                            inner, outer, status_id)
+            result = self.model.updateSerial(self.serial_id, serial, die_id, 
+                                           inner, outer, status_id)
         else:  # Nuevo
-            success = self.model.createSerial(serial, die_id, inner, outer, status_id)
+            result = self.model.createSerial(serial, die_id, inner, outer, status_id)
             
-        if success:
+        if result:
+            self.saved_id = self.serial_id or result.id
             self.accept()
+        elif result.duplicate:
+            QMessageBox.warning(self, "Duplicate Serial", 
+                              f"The serial number {serial} is already in use.")
+            self.serialInput.setFocus()
         else:
             QMessageBox.warning(self, "Error", 
-                              "Could not save serial. Please verify that the serial number is not already in use.") 
\ No newline at end of file
+                              "Could not save serial. Please verify the entered data.") 
\ No newline at end of file
@@ -16,6 +16,8 @@ class DieDescriptionDialog(QDialog):
         """
         super().__init__(parent)
         self.die_description_data = die_description_data
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.model = DieDescriptionModel()
         self.related_data = self.model.get_related_data()
         self.setupUI()
@@ -204,22 +206,28 @@ class DieDescriptionDialog(QDialog):
             'New': self.new_spin.value()
         }
 
-        success = False
         if self.die_description_data:
             # Actualizar
-            success = self.model.update_die_description(
+            result = self.model.update_die_description(
                 self.die_description_data['id_die_description'],
                 data
             )
         else:
             # Crear nuevo
-            success = self.model.create_die_description(data)
+            result = self.model.create_die_description(data)
 
-        if success:
+        if result:
+            self.saved_id = self.die_description_data['id_die_description'] if self.die_description_data else result.id
             self.accept()
+        elif result.duplicate:
+            QMessageBox.warning(
+                self,
+                "Duplicate Die Description",
+                f"The Die Description {data['Die_Description']} already exists."
+            )
         else:
             QMessageBox.warning(
                 self,
                 "Error",
-                "Could not save Die Description. Please check if a similar one already exists."
+                "Could not save Die Description. Please verify the entered data."
             ) 
\ No newline at end of file
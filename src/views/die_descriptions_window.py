@@ -1,11 +1,16 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.die_description_model import DieDescriptionModel
+from models.inch_model import InchModel
+from models.part_model import PartModel
 from views.die_description_dialog import DieDescriptionDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView, format_yes_no
+from views.widgets.search_bar import SearchBar
+from views.widgets.filter_combo import FilterCombo
 
 class DieDescriptionsWindow(QWidget):
     def __init__(self):
@@ -87,7 +92,7 @@ class DieDescriptionsWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,12 +125,40 @@ class DieDescriptionsWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de die descriptions
-        self.dieDescriptionsTable = QTableWidget()
-        self.dieDescriptionsTable.setColumnCount(8)
-        self.dieDescriptionsTable.setHorizontalHeaderLabels([
-            'Die Description', 'Inch', 'Part', 'Description',
-            'Obsolet', 'Circulation', 'New', 'Last Update'
-        ])
+        self.dieDescriptionsTableModel = RecordTableModel([
+            ('Die Description', 'Die_Description'),
+            ('Inch', 'Inch'),
+            ('Part', 'Part'),
+            ('Description', 'Description'),
+            ('Obsolet', 'Obsolet', format_yes_no),
+            ('Circulation', 'Circulation'),
+            ('New', 'New'),
+            ('Last Update', 'updat_time'),
+        ], self, id_field='id_die_description',
+            fetch_one=self.die_description_model.get_die_description_by_id,
+            search_fields=('Die_Description', 'Inch', 'Part', 'Description'),
+            sort_fields={'Die_Description': 'die_description', 'Inch': 'inch'})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.dieDescriptionsTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        # Filtros por inch, part y obsolet (en el servidor)
+        model = self.dieDescriptionsTableModel
+        inchModel, partModel = InchModel(), PartModel()
+        self.inchFilter = FilterCombo(model, 'inch',
+                                      lambda: [(inch['Inch'], inch['id_inch'])
+                                               for inch in inchModel.get_all_inches()],
+                                      field='id_inch', all_text="All inches")
+        self.partFilter = FilterCombo(model, 'part',
+                                      lambda: [(part['Part'], part['id_part'])
+                                               for part in partModel.get_all_parts()],
+                                      field='id_part', all_text="All parts")
+        self.obsoleteFilter = FilterCombo(model, 'obsolete', [("Obsolete", 1), ("Current", 0)],
+                                          field='Obsolet', all_text="Obsolete and current")
+        toolbar.insertWidget(1, self.inchFilter)
+        toolbar.insertWidget(2, self.partFilter)
+        toolbar.insertWidget(3, self.obsoleteFilter)
+        self.dieDescriptionsTable = RecordTableView(self.dieDescriptionsTableModel)
         
         # Configurar la tabla
         header = self.dieDescriptionsTable.horizontalHeader()
@@ -138,10 +171,6 @@ class DieDescriptionsWindow(QWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # New
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents)  # Last Update
         
-        self.dieDescriptionsTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.dieDescriptionsTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.dieDescriptionsTable.setEditTriggers(QTableWidget.NoEditTriggers)
-        
         contentLayout.addWidget(self.dieDescriptionsTable)
         mainLayout.addWidget(contentFrame)
         
@@ -155,63 +184,17 @@ class DieDescriptionsWindow(QWidget):
 
     def load_die_descriptions(self):
         """Carga las die descriptions en la tabla"""
-        self.dieDescriptionsTable.setRowCount(0)
-        die_descriptions = self.die_description_model.get_all_die_descriptions()
-        
-        # Crear un diccionario para almacenar la relación entre die description y su ID
-        self.die_description_ids = {}
-        
-        for row, die_description in enumerate(die_descriptions):
-            self.dieDescriptionsTable.insertRow(row)
-            
-            # Die Description
-            description_item = QTableWidgetItem(die_description['Die_Description'])
-            self.dieDescriptionsTable.setItem(row, 0, description_item)
-            
-            # Inch
-            inch_item = QTableWidgetItem(die_description['Inch'])
-            self.dieDescriptionsTable.setItem(row, 1, inch_item)
-            
-            # Part
-            part_item = QTableWidgetItem(die_description['Part'])
-            self.dieDescriptionsTable.setItem(row, 2, part_item)
-            
-            # Description
-            desc_item = QTableWidgetItem(die_description['Description'])
-            self.dieDescriptionsTable.setItem(row, 3, desc_item)
-            
-            # Obsolet
-            obsolet_item = QTableWidgetItem('Yes' if die_description['Obsolet'] else 'No')
-            self.dieDescriptionsTable.setItem(row, 4, obsolet_item)
-            
-            # Circulation
-            circulation_item = QTableWidgetItem(str(die_description['Circulation']))
-            self.dieDescriptionsTable.setItem(row, 5, circulation_item)
-            
-            # New
-            new_item = QTableWidgetItem(str(die_description['New']))
-            self.dieDescriptionsTable.setItem(row, 6, new_item)
-            
-            # Last Update
-            update_item = QTableWidgetItem(str(die_description['updat_time']))
-            self.dieDescriptionsTable.setItem(row, 7, update_item)
-            
-            # Guardar el ID asociado a esta die description
-            self.die_description_ids[row] = die_description['id_die_description']
+        self.dieDescriptionsTableModel.setPager(self.die_description_model.page)
 
     def get_selected_die_description_id(self):
         """Obtiene el ID de la die description seleccionada"""
-        selectedItems = self.dieDescriptionsTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.die_description_ids[selectedRow]
+        return self.dieDescriptionsTable.selectedValue('id_die_description')
 
     def show_add_dialog(self):
         """Muestra el diálogo para agregar una nueva die description"""
         dialog = DieDescriptionDialog(self)
         if dialog.exec_() == DieDescriptionDialog.Accepted:
-            self.load_die_descriptions()
+            self.dieDescriptionsTableModel.refreshRecord(dialog.saved_id)
 
     def edit_selected(self):
         """Edita la die description seleccionada"""
@@ -219,6 +202,7 @@ class DieDescriptionsWindow(QWidget):
         if not die_description_id:
             QMessageBox.warning(self, "Selection Required", "Please select a die description to edit")
             return
+        row = self.dieDescriptionsTable.selectedRow()
             
         # Obtener los datos de la die description
         die_description_data = self.die_description_model.get_die_description_by_id(die_description_id)
@@ -226,7 +210,7 @@ class DieDescriptionsWindow(QWidget):
         if die_description_data:
             dialog = DieDescriptionDialog(self, die_description_data)
             if dialog.exec_() == DieDescriptionDialog.Accepted:
-                self.load_die_descriptions()
+                self.dieDescriptionsTableModel.refreshRecord(die_description_id, row)
 
     def delete_selected(self):
         """Elimina la die description seleccionada"""
@@ -234,6 +218,7 @@ class DieDescriptionsWindow(QWidget):
         if not die_description_id:
             QMessageBox.warning(self, "Selection Required", "Please select a die description to delete")
             return
+        row = self.dieDescriptionsTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -245,7 +230,7 @@ class DieDescriptionsWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.die_description_model.delete_die_description(die_description_id):
-                self.load_die_descriptions()
+                self.dieDescriptionsTableModel.removeId(die_description_id, row)
                 QMessageBox.information(self, "Success", "Die description deleted successfully!")
             else:
                 QMessageBox.critical(self, "Error", "Could not delete the die description.") 
\ No newline at end of file
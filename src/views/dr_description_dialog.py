@@ -16,6 +16,8 @@ class DRDescriptionDialog(QDialog):
         """
         super().__init__(parent)
         self.descriptionId = descriptionId
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.savedId = None
         self.descriptionModel = DRDescriptionModel()
         
         # Establecer el ícono de la ventana
@@ -122,6 +124,10 @@ class DRDescriptionDialog(QDialog):
             success = self.descriptionModel.createDescription(descriptionText)
         
         if success:
+            self.savedId = self.descriptionId or success.id
             self.accept()
+        elif success.duplicate:
+            QMessageBox.warning(self, "Duplicate Description",
+                                f"The description {descriptionText} already exists.")
         else:
             QMessageBox.critical(self, "Error", "Failed to save description") 
\ No newline at end of file
@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.dr_description_model import DRDescriptionModel
 from database.database_schema import Columns
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class DRDescriptionWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class DRDescriptionWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,16 +122,21 @@ class DRDescriptionWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de descripciones
-        self.descriptionTable = QTableWidget()
-        self.descriptionTable.setColumnCount(1)  # Solo una columna para Description
-        self.descriptionTable.setHorizontalHeaderLabels(['Description'])
+        self.descriptionTableModel = RecordTableModel([('Description', Columns.DRDescription.DESCRIPTION)], self,
+                                                      id_field=Columns.DRDescription.ID,
+                                                      fetch_one=self.descriptionModel.getDescriptionById,
+                                                      search_fields=(Columns.DRDescription.DESCRIPTION,),
+                                                      sort_fields={Columns.DRDescription.DESCRIPTION:
+                                                                   self.descriptionModel.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.descriptionTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.descriptionTable = RecordTableView(self.descriptionTableModel)
         
         # Configurar la tabla
         header = self.descriptionTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Description
-        self.descriptionTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.descriptionTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.descriptionTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.descriptionTable)
         mainLayout.addWidget(contentFrame)
@@ -144,33 +151,18 @@ class DRDescriptionWindow(QWidget):
     
     def loadDescriptions(self):
         """Carga las descripciones en la tabla"""
-        self.descriptionTable.setRowCount(0)
-        descriptions = self.descriptionModel.getAllDescriptions()
-        
-        # Crear un diccionario para almacenar la relación entre descripción y su ID
-        self.descriptionIds = {}
-        
-        for row, description in enumerate(descriptions):
-            self.descriptionTable.insertRow(row)
-            descriptionText = description[Columns.DRDescription.DESCRIPTION]
-            self.descriptionTable.setItem(row, 0, QTableWidgetItem(descriptionText))
-            # Guardar el ID asociado a esta descripción
-            self.descriptionIds[row] = description[Columns.DRDescription.ID]
-    
+        self.descriptionTableModel.setPager(self.descriptionModel.page)
+
     def getSelectedDescriptionId(self):
         """Obtiene el ID de la descripción seleccionada"""
-        selectedItems = self.descriptionTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.descriptionIds[selectedRow]
-        
+        return self.descriptionTable.selectedValue(Columns.DRDescription.ID)
+
     def addDescription(self):
         """Abre el diálogo para agregar una nueva descripción"""
         from .dr_description_dialog import DRDescriptionDialog
         dialog = DRDescriptionDialog(self)
         if dialog.exec_() == DRDescriptionDialog.Accepted:
-            self.loadDescriptions()
+            self.descriptionTableModel.refreshRecord(dialog.savedId)
         
     def editDescription(self):
         """Abre el diálogo para editar una descripción existente"""
@@ -178,11 +170,12 @@ class DRDescriptionWindow(QWidget):
         if not descriptionId:
             QMessageBox.warning(self, "Selection Required", "Please select a description to edit")
             return
+        row = self.descriptionTable.selectedRow()
             
         from .dr_description_dialog import DRDescriptionDialog
         dialog = DRDescriptionDialog(self, descriptionId)
         if dialog.exec_() == DRDescriptionDialog.Accepted:
-            self.loadDescriptions()
+            self.descriptionTableModel.refreshRecord(descriptionId, row)
         
     def deleteDescription(self):
         """Elimina la descripción seleccionada"""
@@ -190,6 +183,7 @@ class DRDescriptionWindow(QWidget):
         if not descriptionId:
             QMessageBox.warning(self, "Selection Required", "Please select a description to delete")
             return
+        row = self.descriptionTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -201,6 +195,6 @@ class DRDescriptionWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.descriptionModel.deleteDescription(descriptionId):
-                self.loadDescriptions()
+                self.descriptionTableModel.removeId(descriptionId, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete description") 
\ No newline at end of file
@@ -16,6 +16,8 @@ class DRStatusDialog(QDialog):
         """
         super().__init__(parent)
         self.status_id = status_id
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.statusModel = DRStatusModel()
         
         # Establecer el ícono de la ventana
@@ -122,6 +124,9 @@ class DRStatusDialog(QDialog):
             success = self.statusModel.createStatus(statusText)
         
         if success:
+            self.saved_id = self.status_id or success.id
             self.accept()
+        elif success.duplicate:
+            QMessageBox.warning(self, "Duplicate Status", f"The status {statusText} already exists.")
         else:
             QMessageBox.critical(self, "Error", "Failed to save status") 
\ No newline at end of file
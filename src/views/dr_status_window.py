@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.dr_status_model import DRStatusModel
 from database.database_schema import Columns
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class DRStatusWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class DRStatusWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,16 +122,21 @@ class DRStatusWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de estados
-        self.statusTable = QTableWidget()
-        self.statusTable.setColumnCount(1)  # Solo una columna para Status
-        self.statusTable.setHorizontalHeaderLabels(['Status'])
+        self.statusTableModel = RecordTableModel([('Status', Columns.DRStatus.STATUS)], self,
+                                                 id_field=Columns.DRStatus.ID,
+                                                 fetch_one=self.statusModel.getStatusById,
+                                                 search_fields=(Columns.DRStatus.STATUS,),
+                                                 sort_fields={Columns.DRStatus.STATUS:
+                                                              self.statusModel.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.statusTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.statusTable = RecordTableView(self.statusTableModel)
         
         # Configurar la tabla
         header = self.statusTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Status
-        self.statusTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.statusTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.statusTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.statusTable)
         mainLayout.addWidget(contentFrame)
@@ -144,33 +151,18 @@ class DRStatusWindow(QWidget):
     
     def loadStatus(self):
         """Carga los estados en la tabla"""
-        self.statusTable.setRowCount(0)
-        status_list = self.statusModel.getAllStatus()
-        
-        # Crear un diccionario para almacenar la relación entre estado y su ID
-        self.statusIds = {}
-        
-        for row, status in enumerate(status_list):
-            self.statusTable.insertRow(row)
-            statusText = status[Columns.DRStatus.STATUS]
-            self.statusTable.setItem(row, 0, QTableWidgetItem(statusText))
-            # Guardar el ID asociado a este estado
-            self.statusIds[row] = status[Columns.DRStatus.ID]
-    
+        self.statusTableModel.setPager(self.statusModel.page)
+
     def getSelectedStatusId(self):
         """Obtiene el ID del estado seleccionado"""
-        selectedItems = self.statusTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.statusIds[selectedRow]
-        
+        return self.statusTable.selectedValue(Columns.DRStatus.ID)
+
     def addStatus(self):
         """Abre el diálogo para agregar un nuevo estado"""
         from .dr_status_dialog import DRStatusDialog
         dialog = DRStatusDialog(self)
         if dialog.exec_() == DRStatusDialog.Accepted:
-            self.loadStatus()
+            self.statusTableModel.refreshRecord(dialog.saved_id)
         
     def editStatus(self):
         """Abre el diálogo para editar un estado existente"""
@@ -178,11 +170,12 @@ class DRStatusWindow(QWidget):
         if not statusId:
             QMessageBox.warning(self, "Selection Required", "Please select a status to edit")
             return
+        row = self.statusTable.selectedRow()
             
         from .dr_status_dialog import DRStatusDialog
         dialog = DRStatusDialog(self, statusId)
         if dialog.exec_() == DRStatusDialog.Accepted:
-            self.loadStatus()
+            self.statusTableModel.refreshRecord(statusId, row)
         
     def deleteStatus(self):
         """Elimina el estado seleccionado"""
@@ -190,6 +183,7 @@ class DRStatusWindow(QWidget):
         if not statusId:
             QMessageBox.warning(self, "Selection Required", "Please select a status to delete")
             return
+        row = self.statusTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -201,6 +195,6 @@ class DRStatusWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.statusModel.deleteStatus(statusId):
-                self.loadStatus()
+                self.statusTableModel.removeId(statusId, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete status") 
\ No newline at end of file
@@ -10,6 +10,8 @@ class ExplanationDialog(QDialog):
     def __init__(self, parent=None, explanationId=None):
         super().__init__(parent)
         self.explanationId = explanationId
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.savedId = None
         self.explanationModel = ExplanationModel()
         
         # Establecer el ícono de la ventana
@@ -113,6 +115,7 @@ class ExplanationDialog(QDialog):
             success = self.explanationModel.createExplanation(explanationText)
         
         if success:
+            self.savedId = self.explanationId or success.id
             self.accept()
         else:
             QMessageBox.critical(self, "Error", "Failed to save explanation") 
\ No newline at end of file
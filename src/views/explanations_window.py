@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.explanation_model import ExplanationModel
 from database.database_schema import Columns
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class ExplanationsWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class ExplanationsWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,16 +122,21 @@ class ExplanationsWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de explicaciones
-        self.explanationsTable = QTableWidget()
-        self.explanationsTable.setColumnCount(1)  # Solo una columna para Explanation
-        self.explanationsTable.setHorizontalHeaderLabels(['Explanation'])
+        self.explanationsTableModel = RecordTableModel([('Explanation', Columns.Explanation.EXPLANATION)], self,
+                                                       id_field=Columns.Explanation.ID,
+                                                       fetch_one=self.explanationModel.getExplanationById,
+                                                       search_fields=(Columns.Explanation.EXPLANATION,),
+                                                       sort_fields={Columns.Explanation.EXPLANATION:
+                                                                    self.explanationModel.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.explanationsTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.explanationsTable = RecordTableView(self.explanationsTableModel)
         
         # Configurar la tabla
         header = self.explanationsTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Explanation
-        self.explanationsTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.explanationsTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.explanationsTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.explanationsTable)
         mainLayout.addWidget(contentFrame)
@@ -144,33 +151,18 @@ class ExplanationsWindow(QWidget):
     
     def loadExplanations(self):
         """Carga las explicaciones en la tabla"""
-        self.explanationsTable.setRowCount(0)
-        explanations = self.explanationModel.getAllExplanations()
-        
-        # Crear un diccionario para almacenar la relación entre explicación y su ID
-        self.explanationIds = {}
-        
-        for row, explanation in enumerate(explanations):
-            self.explanationsTable.insertRow(row)
-            explanationText = explanation[Columns.Explanation.EXPLANATION]
-            self.explanationsTable.setItem(row, 0, QTableWidgetItem(explanationText))
-            # Guardar el ID asociado a esta explicación
-            self.explanationIds[row] = explanation[Columns.Explanation.ID]
-    
+        self.explanationsTableModel.setPager(self.explanationModel.page)
+
     def getSelectedExplanationId(self):
         """Obtiene el ID de la explicación seleccionada"""
-        selectedItems = self.explanationsTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.explanationIds[selectedRow]
-        
+        return self.explanationsTable.selectedValue(Columns.Explanation.ID)
+
     def addExplanation(self):
         """Abre el diálogo para agregar una nueva explicación"""
         from .explanation_dialog import ExplanationDialog
         dialog = ExplanationDialog(self)
         if dialog.exec_() == ExplanationDialog.Accepted:
-            self.loadExplanations()
+            self.explanationsTableModel.refreshRecord(dialog.savedId)
         
     def editExplanation(self):
         """Abre el diálogo para editar una explicación existente"""
@@ -178,11 +170,12 @@ class ExplanationsWindow(QWidget):
         if not explanationId:
             QMessageBox.warning(self, "Selection Required", "Please select an explanation to edit")
             return
+        row = self.explanationsTable.selectedRow()
             
         from .explanation_dialog import ExplanationDialog
         dialog = ExplanationDialog(self, explanationId)
         if dialog.exec_() == ExplanationDialog.Accepted:
-            self.loadExplanations()
+            self.explanationsTableModel.refreshRecord(explanationId, row)
         
     def deleteExplanation(self):
         """Elimina la explicación seleccionada"""
@@ -190,6 +183,7 @@ class ExplanationsWindow(QWidget):
         if not explanationId:
             QMessageBox.warning(self, "Selection Required", "Please select an explanation to delete")
             return
+        row = self.explanationsTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -201,6 +195,6 @@ class ExplanationsWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.explanationModel.deleteExplanation(explanationId):
-                self.loadExplanations()
+                self.explanationsTableModel.removeId(explanationId, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete explanation") 
\ No newline at end of file
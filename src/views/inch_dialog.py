@@ -13,6 +13,8 @@ class InchDialog(QDialog):
         super().__init__(parent)
         self.inch_model = InchModel()
         self.inch_data = inch_data
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.setupUI()
 
     def setupUI(self):
@@ -113,6 +115,7 @@ class InchDialog(QDialog):
             success = self.inch_model.create_inch(value)
         
         if success:
+            self.saved_id = self.inch_data['id_inch'] if self.inch_data else success.id
             self.accept()
         else:
             QMessageBox.critical(
@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.inch_model import InchModel
 from views.inch_dialog import InchDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class InchesWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class InchesWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,17 +122,22 @@ class InchesWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de pulgadas
-        self.inchesTable = QTableWidget()
-        self.inchesTable.setColumnCount(2)
-        self.inchesTable.setHorizontalHeaderLabels(['ID', 'Inch'])
+        self.inchesTableModel = RecordTableModel([('ID', 'id_inch'), ('Inch', 'Inch')], self,
+                                                 id_field='id_inch',
+                                                 fetch_one=self.inch_model.get_inch_by_id,
+                                                 search_fields=('Inch',),
+                                                 sort_fields={'id_inch':
+                                                              'id', 'Inch': self.inch_model.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.inchesTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.inchesTable = RecordTableView(self.inchesTableModel)
         
         # Configurar la tabla
         header = self.inchesTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
-        self.inchesTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.inchesTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.inchesTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.inchesTable)
         mainLayout.addWidget(contentFrame)
@@ -145,39 +152,17 @@ class InchesWindow(QWidget):
 
     def load_inches(self):
         """Carga las pulgadas en la tabla"""
-        self.inchesTable.setRowCount(0)
-        inches = self.inch_model.get_all_inches()
-        
-        # Crear un diccionario para almacenar la relación entre pulgada y su ID
-        self.inch_ids = {}
-        
-        for row, inch in enumerate(inches):
-            self.inchesTable.insertRow(row)
-            
-            # ID
-            id_item = QTableWidgetItem(str(inch['id_inch']))
-            self.inchesTable.setItem(row, 0, id_item)
-            
-            # Pulgada
-            inch_item = QTableWidgetItem(inch['Inch'])
-            self.inchesTable.setItem(row, 1, inch_item)
-            
-            # Guardar el ID asociado a esta pulgada
-            self.inch_ids[row] = inch['id_inch']
+        self.inchesTableModel.setPager(self.inch_model.page)
 
     def get_selected_inch_id(self):
         """Obtiene el ID de la pulgada seleccionada"""
-        selectedItems = self.inchesTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.inch_ids[selectedRow]
+        return self.inchesTable.selectedValue('id_inch')
 
     def show_add_dialog(self):
         """Muestra el diálogo para agregar una nueva pulgada"""
         dialog = InchDialog(self)
         if dialog.exec_() == InchDialog.Accepted:
-            self.load_inches()
+            self.inchesTableModel.refreshRecord(dialog.saved_id)
 
     def edit_selected(self):
         """Edita la pulgada seleccionada"""
@@ -186,14 +171,14 @@ class InchesWindow(QWidget):
             QMessageBox.warning(self, "Selection Required", "Please select an inch to edit")
             return
             
-        # Obtener los datos de la pulgada
-        inches = self.inch_model.get_all_inches()
-        inch_data = next((inch for inch in inches if inch['id_inch'] == inch_id), None)
+        # Solo la fila seleccionada, por su clave primaria
+        row = self.inchesTable.selectedRow()
+        inch_data = self.inch_model.get_inch_by_id(inch_id)
         
         if inch_data:
             dialog = InchDialog(self, inch_data)
             if dialog.exec_() == InchDialog.Accepted:
-                self.load_inches()
+                self.inchesTableModel.refreshRecord(inch_id, row)
 
     def delete_selected(self):
         """Elimina la pulgada seleccionada"""
@@ -201,6 +186,7 @@ class InchesWindow(QWidget):
         if not inch_id:
             QMessageBox.warning(self, "Selection Required", "Please select an inch to delete")
             return
+        row = self.inchesTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -212,7 +198,7 @@ class InchesWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.inch_model.delete_inch(inch_id):
-                self.load_inches()
+                self.inchesTableModel.removeId(inch_id, row)
                 QMessageBox.information(self, "Success", "Inch deleted successfully!")
             else:
                 QMessageBox.critical(self, "Error", "Could not delete the inch.") 
\ No newline at end of file
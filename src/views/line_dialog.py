@@ -13,6 +13,8 @@ class LineDialog(QDialog):
         """
         super().__init__(parent)
         self.line_id = line_id
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.model = LineModel()
         self.setupUI()
         
@@ -105,19 +107,25 @@ class LineDialog(QDialog):
             QMessageBox.warning(self, "Validation Error", "Line name cannot be empty")
             return
             
-        success = False
         if self.line_id:
             # Actualizar línea existente
-            success = self.model.updateLine(self.line_id, line_name)
+            result = self.model.updateLine(self.line_id, line_name)
         else:
             # Crear nueva línea
-            success = self.model.createLine(line_name)
+            result = self.model.createLine(line_name)
             
-        if success:
+        if result:
+            self.saved_id = self.line_id or result.id
             self.accept()
+        elif result.duplicate:
+            QMessageBox.warning(
+                self,
+                "Duplicate Line",
+                f"The line {line_name} already exists."
+            )
         else:
             QMessageBox.warning(
                 self,
                 "Error",
-                "Could not save line. Please check if a similar one already exists."
+                "Could not save line. Line names are limited to 10 characters."
             ) 
\ No newline at end of file
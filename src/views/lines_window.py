@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.line_model import LineModel
 from views.line_dialog import LineDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class LinesWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class LinesWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,17 +122,21 @@ class LinesWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de líneas
-        self.linesTable = QTableWidget()
-        self.linesTable.setColumnCount(1)  # Solo Line
-        self.linesTable.setHorizontalHeaderLabels(['Line'])
+        self.linesTableModel = RecordTableModel([('Line', 'Line')], self,
+                                                id_field='id_line',
+                                                fetch_one=self.lineModel.getLineById,
+                                                search_fields=('Line',),
+                                                sort_fields={'Line': self.lineModel.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.linesTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.linesTable = RecordTableView(self.linesTableModel)
         
         # Configurar la tabla
         header = self.linesTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Line
         
-        self.linesTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.linesTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.linesTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.linesTable)
         mainLayout.addWidget(contentFrame)
@@ -145,28 +151,17 @@ class LinesWindow(QWidget):
 
     def loadLines(self):
         """Carga las líneas en la tabla"""
-        self.linesTable.setRowCount(0)
-        lines_list = self.lineModel.getAllLines()
-        
-        for row, line in enumerate(lines_list):
-            self.linesTable.insertRow(row)
-            # Almacenar el ID como datos del item pero mostrar solo la Line
-            item = QTableWidgetItem(line['Line'])
-            item.setData(Qt.UserRole, line['id_line'])
-            self.linesTable.setItem(row, 0, item)
+        self.linesTableModel.setPager(self.lineModel.page)
 
     def getSelectedLineId(self):
         """Obtiene el ID de la línea seleccionada"""
-        selectedItems = self.linesTable.selectedItems()
-        if not selectedItems:
-            return None
-        return selectedItems[0].data(Qt.UserRole)
+        return self.linesTable.selectedValue('id_line')
 
     def addLine(self):
         """Abre el diálogo para agregar una nueva línea"""
         dialog = LineDialog(self)
         if dialog.exec_() == LineDialog.Accepted:
-            self.loadLines()
+            self.linesTableModel.refreshRecord(dialog.saved_id)
 
     def editLine(self):
         """Abre el diálogo para editar una línea existente"""
@@ -174,10 +169,11 @@ class LinesWindow(QWidget):
         if not line_id:
             QMessageBox.warning(self, "Selection Required", "Please select a line to edit")
             return
+        row = self.linesTable.selectedRow()
             
         dialog = LineDialog(self, line_id)
         if dialog.exec_() == LineDialog.Accepted:
-            self.loadLines()
+            self.linesTableModel.refreshRecord(line_id, row)
 
     def deleteLine(self):
         """Elimina la línea seleccionada"""
@@ -185,6 +181,7 @@ class LinesWindow(QWidget):
         if not line_id:
             QMessageBox.warning(self, "Selection Required", "Please select a line to delete")
             return
+        row = self.linesTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -196,6 +193,6 @@ class LinesWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.lineModel.deleteLine(line_id):
-                self.loadLines()
+                self.linesTableModel.removeId(line_id, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete line") 
\ No newline at end of file
@@ -13,6 +13,7 @@ from .descriptions_window import DescriptionsWindow
 from .dr_description_window import DRDescriptionWindow
 from .explanations_window import ExplanationsWindow
 from .dr_status_window import DRStatusWindow
+from .damage_reports_window import DamageReportsWindow
 
 class MainWindow(QMainWindow):
     def __init__(self, user_info=None):
@@ -202,6 +203,11 @@ class MainWindow(QMainWindow):
         database_menu.addMenu(damage_report_menu)
 
         # Acciones del menú Damage Report
+        manage_reports_action = damage_report_menu.addAction("Manage Damage Reports")
+        manage_reports_action.triggered.connect(self.show_damage_reports_window)
+
+        damage_report_menu.addSeparator()
+
         dr_description_action = damage_report_menu.addAction("DR Description")
         dr_description_action.triggered.connect(self.show_dr_description_window)
         
@@ -358,4 +364,13 @@ class MainWindow(QMainWindow):
         """Muestra la ventana de gestión de estados de DR"""
         dr_status_window = DRStatusWindow()
         sub_window = self.mdi_area.addSubWindow(dr_status_window)
-        sub_window.show() 
\ No newline at end of file
+        sub_window.show()
+
+    def show_damage_reports_window(self):
+        """Muestra la ventana de gestión de damage reports"""
+        damage_reports_window = DamageReportsWindow()
+        sub_window = QMdiSubWindow()
+        sub_window.setWidget(damage_reports_window)
+        sub_window.setAttribute(Qt.WA_DeleteOnClose)
+        self.mdi_area.addSubWindow(sub_window)
+        sub_window.show()
@@ -7,6 +7,8 @@ class PartDialog(QDialog):
         super().__init__(parent)
         self.part_model = PartModel()
         self.part_data = part_data
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.setupUI()
 
     def setupUI(self):
@@ -113,6 +115,7 @@ class PartDialog(QDialog):
             success = self.part_model.create_part(value)
         
         if success:
+            self.saved_id = self.part_data['id_part'] if self.part_data else success.id
             self.accept()
         else:
             QMessageBox.critical(
@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.part_model import PartModel
 from views.part_dialog import PartDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class PartsWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class PartsWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,17 +122,22 @@ class PartsWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de parts
-        self.partsTable = QTableWidget()
-        self.partsTable.setColumnCount(2)
-        self.partsTable.setHorizontalHeaderLabels(['ID', 'Part'])
+        self.partsTableModel = RecordTableModel([('ID', 'id_part'), ('Part', 'Part')], self,
+                                                id_field='id_part',
+                                                fetch_one=self.part_model.get_part_by_id,
+                                                search_fields=('Part',),
+                                                sort_fields={'id_part':
+                                                             'id', 'Part': self.part_model.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.partsTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.partsTable = RecordTableView(self.partsTableModel)
         
         # Configurar la tabla
         header = self.partsTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
-        self.partsTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.partsTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.partsTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.partsTable)
         mainLayout.addWidget(contentFrame)
@@ -145,39 +152,17 @@ class PartsWindow(QWidget):
 
     def load_parts(self):
         """Carga las parts en la tabla"""
-        self.partsTable.setRowCount(0)
-        parts = self.part_model.get_all_parts()
-        
-        # Crear un diccionario para almacenar la relación entre part y su ID
-        self.part_ids = {}
-        
-        for row, part in enumerate(parts):
-            self.partsTable.insertRow(row)
-            
-            # ID
-            id_item = QTableWidgetItem(str(part['id_part']))
-            self.partsTable.setItem(row, 0, id_item)
-            
-            # Part
-            part_item = QTableWidgetItem(part['Part'])
-            self.partsTable.setItem(row, 1, part_item)
-            
-            # Guardar el ID asociado a esta part
-            self.part_ids[row] = part['id_part']
+        self.partsTableModel.setPager(self.part_model.page)
 
     def get_selected_part_id(self):
         """Obtiene el ID de la part seleccionada"""
-        selectedItems = self.partsTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.part_ids[selectedRow]
+        return self.partsTable.selectedValue('id_part')
 
     def show_add_dialog(self):
         """Muestra el diálogo para agregar una nueva part"""
         dialog = PartDialog(self)
         if dialog.exec_() == PartDialog.Accepted:
-            self.load_parts()
+            self.partsTableModel.refreshRecord(dialog.saved_id)
 
     def edit_selected(self):
         """Edita la part seleccionada"""
@@ -186,14 +171,14 @@ class PartsWindow(QWidget):
             QMessageBox.warning(self, "Selection Required", "Please select a part to edit")
             return
             
-        # Obtener los datos de la part
-        parts = self.part_model.get_all_parts()
-        part_data = next((part for part in parts if part['id_part'] == part_id), None)
+        # Solo la fila seleccionada, por su clave primaria
+        row = self.partsTable.selectedRow()
+        part_data = self.part_model.get_part_by_id(part_id)
         
         if part_data:
             dialog = PartDialog(self, part_data)
             if dialog.exec_() == PartDialog.Accepted:
-                self.load_parts()
+                self.partsTableModel.refreshRecord(part_id, row)
 
     def delete_selected(self):
         """Elimina la part seleccionada"""
@@ -201,6 +186,7 @@ class PartsWindow(QWidget):
         if not part_id:
             QMessageBox.warning(self, "Selection Required", "Please select a part to delete")
             return
+        row = self.partsTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -212,7 +198,7 @@ class PartsWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.part_model.delete_part(part_id):
-                self.load_parts()
+                self.partsTableModel.removeId(part_id, row)
                 QMessageBox.information(self, "Success", "Part deleted successfully!")
             else:
                 QMessageBox.critical(self, "Error", "Could not delete the part.") 
\ No newline at end of file
@@ -10,6 +10,8 @@ class PositionDialog(QDialog):
     def __init__(self, parent=None, positionId=None):
         super().__init__(parent)
         self.positionId = positionId
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.savedId = None
         self.positionModel = PositionModel()
         
         # Establecer el ícono de la ventana
@@ -113,6 +115,7 @@ class PositionDialog(QDialog):
             success = self.positionModel.createPosition(positionName)
         
         if success:
+            self.savedId = self.positionId or success.id
             self.accept()
         else:
             QMessageBox.critical(self, "Error", "Failed to save position") 
\ No newline at end of file
@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.position_model import PositionModel
 from database.database_schema import Columns
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class PositionsWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class PositionsWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,16 +122,21 @@ class PositionsWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de posiciones
-        self.positionsTable = QTableWidget()
-        self.positionsTable.setColumnCount(1)  # Solo una columna para Position
-        self.positionsTable.setHorizontalHeaderLabels(['Position'])
+        self.positionsTableModel = RecordTableModel([('Position', Columns.Positions.POSITION)], self,
+                                                    id_field=Columns.Positions.ID,
+                                                    fetch_one=self.positionModel.getPositionById,
+                                                    search_fields=(Columns.Positions.POSITION,),
+                                                    sort_fields={Columns.Positions.POSITION:
+                                                                 self.positionModel.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.positionsTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.positionsTable = RecordTableView(self.positionsTableModel)
         
         # Configurar la tabla
         header = self.positionsTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Position
-        self.positionsTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.positionsTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.positionsTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.positionsTable)
         mainLayout.addWidget(contentFrame)
@@ -144,33 +151,18 @@ class PositionsWindow(QWidget):
     
     def loadPositions(self):
         """Carga las posiciones en la tabla"""
-        self.positionsTable.setRowCount(0)
-        positions = self.positionModel.getAllPositions()  # Ya viene ordenado por position
-        
-        # Crear un diccionario para almacenar la relación entre posición y su ID
-        self.positionIds = {}
-        
-        for row, position in enumerate(positions):
-            self.positionsTable.insertRow(row)
-            positionName = position[Columns.Positions.POSITION]
-            self.positionsTable.setItem(row, 0, QTableWidgetItem(positionName))
-            # Guardar el ID asociado a esta posición
-            self.positionIds[row] = position[Columns.Positions.ID]
-    
+        self.positionsTableModel.setPager(self.positionModel.page)
+
     def getSelectedPositionId(self):
         """Obtiene el ID de la posición seleccionada"""
-        selectedItems = self.positionsTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.positionIds[selectedRow]
-        
+        return self.positionsTable.selectedValue(Columns.Positions.ID)
+
     def addPosition(self):
         """Abre el diálogo para agregar una nueva posición"""
         from .position_dialog import PositionDialog
         dialog = PositionDialog(self)
         if dialog.exec_() == PositionDialog.Accepted:
-            self.loadPositions()
+            self.positionsTableModel.refreshRecord(dialog.savedId)
         
     def editPosition(self):
         """Abre el diálogo para editar una posición existente"""
@@ -178,11 +170,12 @@ class PositionsWindow(QWidget):
         if not positionId:
             QMessageBox.warning(self, "Selection Required", "Please select a position to edit")
             return
+        row = self.positionsTable.selectedRow()
             
         from .position_dialog import PositionDialog
         dialog = PositionDialog(self, positionId)
         if dialog.exec_() == PositionDialog.Accepted:
-            self.loadPositions()
+            self.positionsTableModel.refreshRecord(positionId, row)
         
     def deletePosition(self):
         """Elimina la posición seleccionada"""
@@ -190,6 +183,7 @@ class PositionsWindow(QWidget):
         if not positionId:
             QMessageBox.warning(self, "Selection Required", "Please select a position to delete")
             return
+        row = self.positionsTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -201,6 +195,6 @@ class PositionsWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.positionModel.deletePosition(positionId):
-                self.loadPositions()
+                self.positionsTableModel.removeId(positionId, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete position") 
\ No newline at end of file
@@ -14,6 +14,8 @@ class ProductDialog(QDialog):
         """
         super().__init__(parent)
         self.product_id = product_id
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.model = ProductModel()
         self.setupUI()
         
@@ -143,6 +145,7 @@ class ProductDialog(QDialog):
             success = self.model.createProduct(product_name, die_description_id)
             
         if success:
+            self.saved_id = self.product_id or success.id
             self.accept()
         else:
             QMessageBox.warning(
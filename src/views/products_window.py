@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.product_model import ProductModel
 from views.product_dialog import ProductDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class ProductsWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class ProductsWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,18 +122,23 @@ class ProductsWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de productos
-        self.productsTable = QTableWidget()
-        self.productsTable.setColumnCount(2)  # Product y Die Description
-        self.productsTable.setHorizontalHeaderLabels(['Product', 'Die Description'])
+        self.productsTableModel = RecordTableModel([('Product', 'Product'), ('Die Description', 'DieDescription')], self,
+                                                   id_field='id_product',
+                                                   fetch_one=self.productModel.getProductById,
+                                                   search_fields=('Product', 'DieDescription'),
+                                                   sort_fields={'Product': 'product',
+                                                                'DieDescription': 'die_description'})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.productsTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.productsTable = RecordTableView(self.productsTableModel)
         
         # Configurar la tabla
         header = self.productsTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Product
         header.setSectionResizeMode(1, QHeaderView.Stretch)  # Die Description
         
-        self.productsTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.productsTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.productsTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.productsTable)
         mainLayout.addWidget(contentFrame)
@@ -146,32 +153,17 @@ class ProductsWindow(QWidget):
 
     def loadProducts(self):
         """Carga los productos en la tabla"""
-        self.productsTable.setRowCount(0)
-        products_list = self.productModel.getAllProducts()
-        
-        for row, product in enumerate(products_list):
-            self.productsTable.insertRow(row)
-            # Almacenar el ID como datos del item pero mostrar solo el Product
-            item_product = QTableWidgetItem(product['Product'])
-            item_product.setData(Qt.UserRole, product['id_product'])
-            self.productsTable.setItem(row, 0, item_product)
-            
-            # Mostrar la descripción del die
-            item_die = QTableWidgetItem(product['DieDescription'])
-            self.productsTable.setItem(row, 1, item_die)
+        self.productsTableModel.setPager(self.productModel.page)
 
     def getSelectedProductId(self):
         """Obtiene el ID del producto seleccionado"""
-        selectedItems = self.productsTable.selectedItems()
-        if not selectedItems:
-            return None
-        return self.productsTable.item(selectedItems[0].row(), 0).data(Qt.UserRole)
+        return self.productsTable.selectedValue('id_product')
 
     def addProduct(self):
         """Abre el diálogo para agregar un nuevo producto"""
         dialog = ProductDialog(self)
         if dialog.exec_() == ProductDialog.Accepted:
-            self.loadProducts()
+            self.productsTableModel.refreshRecord(dialog.saved_id)
 
     def editProduct(self):
         """Abre el diálogo para editar un producto existente"""
@@ -179,10 +171,11 @@ class ProductsWindow(QWidget):
         if not product_id:
             QMessageBox.warning(self, "Selection Required", "Please select a product to edit")
             return
+        row = self.productsTable.selectedRow()
             
         dialog = ProductDialog(self, product_id)
         if dialog.exec_() == ProductDialog.Accepted:
-            self.loadProducts()
+            self.productsTableModel.refreshRecord(product_id, row)
 
     def deleteProduct(self):
         """Elimina el producto seleccionado"""
@@ -190,6 +183,7 @@ class ProductsWindow(QWidget):
         if not product_id:
             QMessageBox.warning(self, "Selection Required", "Please select a product to delete")
             return
+        row = self.productsTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -201,6 +195,6 @@ class ProductsWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.productModel.deleteProduct(product_id):
-                self.loadProducts()
+                self.productsTableModel.removeId(product_id, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete product") 
\ No newline at end of file
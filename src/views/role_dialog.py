@@ -10,6 +10,8 @@ class RoleDialog(QDialog):
     def __init__(self, parent=None, roleId=None):
         super().__init__(parent)
         self.roleId = roleId
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.savedId = None
         self.roleModel = RoleModel()
         
         # Establecer el ícono de la ventana
@@ -120,6 +122,7 @@ class RoleDialog(QDialog):
             success = self.roleModel.createRole(roleName)
         
         if success:
+            self.savedId = self.roleId or success.id
             self.accept()
         else:
             QMessageBox.critical(self, "Error", "Failed to save role") 
\ No newline at end of file
@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.role_model import RoleModel
 from database.database_schema import Columns
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class RolesWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class RolesWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,16 +122,21 @@ class RolesWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de roles
-        self.rolesTable = QTableWidget()
-        self.rolesTable.setColumnCount(1)
-        self.rolesTable.setHorizontalHeaderLabels(['Role'])
+        self.rolesTableModel = RecordTableModel([('Role', Columns.Roles.ROLE)], self,
+                                                id_field=Columns.Roles.ID,
+                                                fetch_one=self.roleModel.getRoleById,
+                                                search_fields=(Columns.Roles.ROLE,),
+                                                sort_fields={Columns.Roles.ROLE:
+                                                             self.roleModel.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.rolesTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.rolesTable = RecordTableView(self.rolesTableModel)
         
         # Configurar la tabla
         header = self.rolesTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        self.rolesTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.rolesTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.rolesTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.rolesTable)
         mainLayout.addWidget(contentFrame)
@@ -144,33 +151,18 @@ class RolesWindow(QWidget):
     
     def loadRoles(self):
         """Carga los roles en la tabla"""
-        self.rolesTable.setRowCount(0)
-        roles = self.roleModel.getAllRoles()  # Ya viene ordenado por rol
-        
-        # Crear un diccionario para almacenar la relación entre rol y su ID
-        self.roleIds = {}
-        
-        for row, role in enumerate(roles):
-            self.rolesTable.insertRow(row)
-            roleName = role[Columns.Roles.ROLE]
-            self.rolesTable.setItem(row, 0, QTableWidgetItem(roleName))
-            # Guardar el ID asociado a este rol
-            self.roleIds[row] = role[Columns.Roles.ID]
-    
+        self.rolesTableModel.setPager(self.roleModel.page)
+
     def getSelectedRoleId(self):
         """Obtiene el ID del rol seleccionado"""
-        selectedItems = self.rolesTable.selectedItems()
-        if not selectedItems:
-            return None
-        selectedRow = selectedItems[0].row()
-        return self.roleIds[selectedRow]
-        
+        return self.rolesTable.selectedValue(Columns.Roles.ID)
+
     def addRole(self):
         """Abre el diálogo para agregar un nuevo rol"""
         from .role_dialog import RoleDialog
         dialog = RoleDialog(self)
         if dialog.exec_() == RoleDialog.Accepted:
-            self.loadRoles()
+            self.rolesTableModel.refreshRecord(dialog.savedId)
         
     def editRole(self):
         """Abre el diálogo para editar un rol existente"""
@@ -178,11 +170,12 @@ class RolesWindow(QWidget):
         if not roleId:
             QMessageBox.warning(self, "Selection Required", "Please select a role to edit")
             return
+        row = self.rolesTable.selectedRow()
             
         from .role_dialog import RoleDialog
         dialog = RoleDialog(self, roleId)
         if dialog.exec_() == RoleDialog.Accepted:
-            self.loadRoles()
+            self.rolesTableModel.refreshRecord(roleId, row)
         
     def deleteRole(self):
         """Elimina el rol seleccionado"""
@@ -190,6 +183,7 @@ class RolesWindow(QWidget):
         if not roleId:
             QMessageBox.warning(self, "Selection Required", "Please select a role to delete")
             return
+        row = self.rolesTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -201,6 +195,6 @@ class RolesWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.roleModel.deleteRole(roleId):
-                self.loadRoles()
+                self.rolesTableModel.removeId(roleId, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete role") 
\ No newline at end of file
@@ -1,11 +1,14 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.serial_model import SerialModel
 from views.dialogs.serial_dialog import SerialDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
+from views.widgets.filter_combo import FilterCombo
 
 class SerialWindow(QWidget):
     def __init__(self):
@@ -88,7 +91,7 @@ class SerialWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,16 +123,34 @@ class SerialWindow(QWidget):
         
         contentLayout.addLayout(toolbar)
         
-        # Tabla de serials
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Serial", "Die Description", "Inner", "Outer", "Status", "ID Die"
-        ])
+        # Tabla de serials (las celdas se arman al pintarse)
+        self.tableModel = RecordTableModel([
+            ("ID", 'id_serial'),
+            ("Serial", 'Serial'),
+            ("Die Description", 'DieDescription'),
+            ("Inner", 'inner'),
+            ("Outer", 'outer'),
+            ("Status", 'StatusName'),
+            ("ID Die", 'id_die_description'),
+            # Columnas del resumen de damage reports (sin agregación al listar)
+            ("Reports", 'DamageCount'),
+            ("Open DR", 'OpenDRCount'),
+            ("Last Damage", 'LastDamage'),
+        ], self, id_field='id_serial', fetch_one=self.model.getSerialById,
+            search_fields=('Serial', 'DieDescription', 'StatusName'),
+            sort_fields={'Serial': 'serial', 'DieDescription': 'die_description'})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.tableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        # Filtro por status (en el servidor)
+        self.statusFilter = FilterCombo(self.tableModel, 'status',
+                                        lambda: [(status['Status'], status['id_status'])
+                                                 for status in self.model.getAllStatus()],
+                                        field='id_status', all_text="All statuses")
+        toolbar.insertWidget(1, self.statusFilter)
+        self.table = RecordTableView(self.tableModel)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         
         # Ajustar columnas
         header = self.table.horizontalHeader()
@@ -140,6 +161,9 @@ class SerialWindow(QWidget):
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Outer
         header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # Status
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # ID Die
+        header.setSectionResizeMode(7, QHeaderView.ResizeToContents)  # Reports
+        header.setSectionResizeMode(8, QHeaderView.ResizeToContents)  # Open DR
+        header.setSectionResizeMode(9, QHeaderView.ResizeToContents)  # Last Damage
         
         contentLayout.addWidget(self.table)
         mainLayout.addWidget(contentFrame)
@@ -157,49 +181,39 @@ class SerialWindow(QWidget):
         self.setMinimumSize(800, 600)
 
     def loadData(self):
-        """Carga los datos en la tabla"""
-        self.table.setRowCount(0)
-        serials = self.model.getAllSerials()
-        
-        for i, serial in enumerate(serials):
-            self.table.insertRow(i)
-            self.table.setItem(i, 0, QTableWidgetItem(str(serial['id_serial'])))
-            self.table.setItem(i, 1, QTableWidgetItem(serial['Serial']))
-            self.table.setItem(i, 2, QTableWidgetItem(serial['DieDescription']))
-            self.table.setItem(i, 3, QTableWidgetItem(str(serial['inner'])))
-            self.table.setItem(i, 4, QTableWidgetItem(str(serial['outer'])))
-            self.table.setItem(i, 5, QTableWidgetItem(serial['StatusName']))
-            self.table.setItem(i, 6, QTableWidgetItem(str(serial['id_die_description'])))
+        """Carga la primera página de serials; el resto se pide al desplazarse"""
+        self.tableModel.setPager(self.model.page)
 
     def addSerial(self):
         """Abre el diálogo para agregar un nuevo serial"""
         dialog = SerialDialog(self)
         if dialog.exec_():
-            self.loadData()
+            # Solo se consulta e inserta la fila nueva
+            self.tableModel.refreshRecord(dialog.saved_id)
 
     def editSerial(self):
         """Abre el diálogo para editar el serial seleccionado"""
-        selectedItems = self.table.selectedItems()
-        if not selectedItems:
+        serial = self.table.selectedRecord()
+        if serial is None:
             QMessageBox.warning(self, "Selection Required", "Please select a serial to edit")
             return
             
-        currentRow = self.table.currentRow()
-        serialId = int(self.table.item(currentRow, 0).text())
+        serialId = serial['id_serial']
+        row = self.table.selectedRow()
         dialog = SerialDialog(self, serialId)
         if dialog.exec_():
-            self.loadData()
+            self.tableModel.refreshRecord(serialId, row)
 
     def deleteSerial(self):
         """Elimina el serial seleccionado"""
-        selectedItems = self.table.selectedItems()
-        if not selectedItems:
+        serial = self.table.selectedRecord()
+        if serial is None:
             QMessageBox.warning(self, "Selection Required", "Please select a serial to delete")
             return
             
-        currentRow = self.table.currentRow()
-        serialId = int(self.table.item(currentRow, 0).text())
-        serialNumber = self.table.item(currentRow, 1).text()
+        serialId = serial['id_serial']
+        serialNumber = serial['Serial']
+        row = self.table.selectedRow()
         
         reply = QMessageBox.question(
             self,
@@ -211,6 +225,6 @@ class SerialWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.model.deleteSerial(serialId):
-                self.loadData()
+                self.tableModel.removeId(serialId, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete serial") 
\ No newline at end of file
@@ -13,6 +13,8 @@ class StatusDialog(QDialog):
         """
         super().__init__(parent)
         self.status_id = status_id
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.model = StatusModel()
         self.setupUI()
         
@@ -114,10 +116,17 @@ class StatusDialog(QDialog):
             success = self.model.createStatus(status_name)
             
         if success:
+            self.saved_id = self.status_id or success.id
             self.accept()
+        elif success.duplicate:
+            QMessageBox.warning(
+                self,
+                "Duplicate Status",
+                f"The status {status_name} already exists."
+            )
         else:
             QMessageBox.warning(
                 self,
                 "Error",
-                "Could not save status. Please check if a similar one already exists."
+                "Could not save status. Status names are limited to 45 characters."
             ) 
\ No newline at end of file
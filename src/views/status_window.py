@@ -1,11 +1,13 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.status_model import StatusModel
 from views.status_dialog import StatusDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView
+from views.widgets.search_bar import SearchBar
 
 class StatusWindow(QWidget):
     def __init__(self):
@@ -87,7 +89,7 @@ class StatusWindow(QWidget):
             QPushButton#deleteButton:hover {
                 background-color: #c82333;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
@@ -120,17 +122,22 @@ class StatusWindow(QWidget):
         contentLayout.addLayout(toolbar)
         
         # Tabla de status
-        self.statusTable = QTableWidget()
-        self.statusTable.setColumnCount(1)  # Solo Status
-        self.statusTable.setHorizontalHeaderLabels(['Status'])
+        self.statusTableModel = RecordTableModel([('Status', 'Status')], self,
+                                                 id_field='id_status',
+                                                 fetch_one=self.statusModel.getStatusById,
+                                                 search_fields=('Status',),
+                                                 sort_fields={'Status':
+                                                              self.statusModel.DEFAULT_SORT})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.statusTableModel)
+        toolbar.insertWidget(0, self.searchBar)
+        self.statusTable = RecordTableView(self.statusTableModel)
         
         # Configurar la tabla
         header = self.statusTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Status
         
-        self.statusTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.statusTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.statusTable.setEditTriggers(QTableWidget.NoEditTriggers)
         
         contentLayout.addWidget(self.statusTable)
         mainLayout.addWidget(contentFrame)
@@ -145,28 +152,17 @@ class StatusWindow(QWidget):
 
     def loadStatus(self):
         """Carga los status en la tabla"""
-        self.statusTable.setRowCount(0)
-        status_list = self.statusModel.getAllStatus()
-        
-        for row, status in enumerate(status_list):
-            self.statusTable.insertRow(row)
-            # Almacenar el ID como datos del item pero mostrar solo el Status
-            item = QTableWidgetItem(status['Status'])
-            item.setData(Qt.UserRole, status['id_status'])
-            self.statusTable.setItem(row, 0, item)
+        self.statusTableModel.setPager(self.statusModel.page)
 
     def getSelectedStatusId(self):
         """Obtiene el ID del status seleccionado"""
-        selectedItems = self.statusTable.selectedItems()
-        if not selectedItems:
-            return None
-        return selectedItems[0].data(Qt.UserRole)
+        return self.statusTable.selectedValue('id_status')
 
     def addStatus(self):
         """Abre el diálogo para agregar un nuevo status"""
         dialog = StatusDialog(self)
         if dialog.exec_() == StatusDialog.Accepted:
-            self.loadStatus()
+            self.statusTableModel.refreshRecord(dialog.saved_id)
 
     def editStatus(self):
         """Abre el diálogo para editar un status existente"""
@@ -174,10 +170,11 @@ class StatusWindow(QWidget):
         if not status_id:
             QMessageBox.warning(self, "Selection Required", "Please select a status to edit")
             return
+        row = self.statusTable.selectedRow()
             
         dialog = StatusDialog(self, status_id)
         if dialog.exec_() == StatusDialog.Accepted:
-            self.loadStatus()
+            self.statusTableModel.refreshRecord(status_id, row)
 
     def deleteStatus(self):
         """Elimina el status seleccionado"""
@@ -185,6 +182,7 @@ class StatusWindow(QWidget):
         if not status_id:
             QMessageBox.warning(self, "Selection Required", "Please select a status to delete")
             return
+        row = self.statusTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -196,6 +194,6 @@ class StatusWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             if self.statusModel.deleteStatus(status_id):
-                self.loadStatus()
+                self.statusTableModel.removeId(status_id, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete status") 
\ No newline at end of file
@@ -11,6 +11,8 @@ class UserDialog(QDialog):
     def __init__(self, parent=None, user_id=None):
         super().__init__(parent)
         self.user_id = user_id
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.saved_id = None
         self.user_model = UserModel()
         
         # Establecer el ícono de la ventana
@@ -192,6 +194,7 @@ class UserDialog(QDialog):
             )
         
         if success:
+            self.saved_id = self.user_id or success.id
             self.accept()
         else:
             QMessageBox.critical(self, "Error", "Failed to save user") 
\ No newline at end of file
@@ -112,13 +112,10 @@ class UserRolesDialog(QDialog):
     def saveRoles(self):
         """Save selected roles for the user"""
         try:
-            # First remove all current roles
-            self.user_model.remove_all_user_roles(self.user_id)
-            
-            # Assign selected roles
-            for role_id, checkbox in self.role_checkboxes.items():
-                if checkbox.isChecked():
-                    self.user_model.assign_role_to_user(self.user_id, role_id)
+            # Replace current roles with the selected ones in a single commit
+            selected_role_ids = [role_id for role_id, checkbox in self.role_checkboxes.items()
+                                 if checkbox.isChecked()]
+            self.user_model.set_user_roles(self.user_id, selected_role_ids)
             
             QMessageBox.information(self, "Success", "Roles updated successfully")
             self.accept()
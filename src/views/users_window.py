@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox, QWidget)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
@@ -7,6 +7,8 @@ import os
 from models.user_model import UserModel
 from views.user_dialog import UserDialog
 from views.user_roles_dialog import UserRolesDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView, format_datetime, format_default
+from views.widgets.search_bar import SearchBar
 
 class UsersWindow(QMainWindow):
     def __init__(self):
@@ -72,12 +74,12 @@ class UsersWindow(QMainWindow):
                 border: 1px solid #cccccc;
                 border-radius: 5px;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -137,9 +139,20 @@ class UsersWindow(QMainWindow):
         contentLayout.addLayout(toolbarLayout)
         
         # Tabla de usuarios
-        self.usersTable = QTableWidget()
-        self.usersTable.setColumnCount(5)
-        self.usersTable.setHorizontalHeaderLabels(["Username", "Email", "Worker", "Created", "ID"])
+        self.usersTableModel = RecordTableModel([
+            ("Username", 'username'),
+            ("Email", 'email'),
+            ("Worker", 'worker_name', format_default('No Worker')),
+            ("Created", 'create_time', format_datetime),
+            ("ID", 'id_user'),
+        ], self, id_field='id_user', fetch_one=self.userModel.get_user_by_id,
+            search_fields=('username', 'email', 'worker_name'),
+            sort_fields={'username': 'username', 'id_user': 'id'})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.usersTableModel)
+        toolbarLayout.insertWidget(0, self.searchBar)
+        self.usersTable = RecordTableView(self.usersTableModel)
         
         # Configurar la tabla
         header = self.usersTable.horizontalHeader()
@@ -150,10 +163,6 @@ class UsersWindow(QMainWindow):
         header.setSectionResizeMode(4, QHeaderView.Fixed)    # ID
         self.usersTable.setColumnWidth(4, 50)  # ID width
         
-        self.usersTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.usersTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.usersTable.setEditTriggers(QTableWidget.NoEditTriggers)
-        
         contentLayout.addWidget(self.usersTable)
         mainLayout.addWidget(contentFrame)
         
@@ -161,48 +170,17 @@ class UsersWindow(QMainWindow):
     
     def loadUsers(self):
         """Carga los usuarios en la tabla"""
-        self.usersTable.setRowCount(0)
-        users = self.userModel.get_all_users()
-        
-        # Diccionario para mantener la relación entre filas e IDs
-        self.userIds = {}
-        
-        for row, user in enumerate(users):
-            self.usersTable.insertRow(row)
-            
-            # Username
-            self.usersTable.setItem(row, 0, QTableWidgetItem(user['username']))
-            
-            # Email
-            self.usersTable.setItem(row, 1, QTableWidgetItem(user['email']))
-            
-            # Worker
-            worker_name = user['worker_name'] if user['worker_name'] else 'No Worker'
-            self.usersTable.setItem(row, 2, QTableWidgetItem(worker_name))
-            
-            # Created
-            create_time = user['create_time'].strftime('%Y-%m-%d %H:%M:%S') if user['create_time'] else ''
-            self.usersTable.setItem(row, 3, QTableWidgetItem(create_time))
-            
-            # ID
-            self.usersTable.setItem(row, 4, QTableWidgetItem(str(user['id_user'])))
-            
-            # Guardar el ID del usuario
-            self.userIds[row] = user['id_user']
+        self.usersTableModel.setPager(self.userModel.page)
     
     def getSelectedUserId(self):
         """Obtiene el ID del usuario seleccionado"""
-        selectedItems = self.usersTable.selectedItems()
-        if not selectedItems:
-            return None
-        row = selectedItems[0].row()
-        return self.userIds.get(row)
+        return self.usersTable.selectedValue('id_user')
     
     def showAddUserDialog(self):
         """Muestra el diálogo para agregar un usuario"""
         dialog = UserDialog(self)
         if dialog.exec_() == UserDialog.Accepted:
-            self.loadUsers()
+            self.usersTableModel.refreshRecord(dialog.saved_id)
     
     def editSelectedUser(self):
         """Edita el usuario seleccionado"""
@@ -210,9 +188,10 @@ class UsersWindow(QMainWindow):
         if not userId:
             QMessageBox.warning(self, "Selection Required", "Please select a user to edit")
             return
+        row = self.usersTable.selectedRow()
         dialog = UserDialog(self, userId)
         if dialog.exec_() == UserDialog.Accepted:
-            self.loadUsers()
+            self.usersTableModel.refreshRecord(userId, row)
     
     def deleteSelectedUser(self):
         """Elimina el usuario seleccionado"""
@@ -220,6 +199,7 @@ class UsersWindow(QMainWindow):
         if not userId:
             QMessageBox.warning(self, "Selection Required", "Please select a user to delete")
             return
+        row = self.usersTable.selectedRow()
             
         reply = QMessageBox.question(
             self,
@@ -231,20 +211,19 @@ class UsersWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             if self.userModel.delete_user(userId):
-                self.loadUsers()
+                self.usersTableModel.removeId(userId, row)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete user")
     
     def showUserRolesDialog(self):
         """Muestra el diálogo para gestionar roles del usuario"""
-        selectedRows = self.usersTable.selectedItems()
-        if not selectedRows:
+        user = self.usersTable.selectedRecord()
+        if user is None:
             QMessageBox.warning(self, "Error", "Por favor seleccione un usuario")
             return
         
-        row = selectedRows[0].row()
-        user_id = int(self.usersTable.item(row, 4).text())
-        username = self.usersTable.item(row, 0).text()
+        user_id = user['id_user']
+        username = user['username']
         
         dialog = UserRolesDialog(self, user_id, username)
         dialog.exec_() 
\ No newline at end of file
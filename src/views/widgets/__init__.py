@@ -0,0 +1,3 @@
+"""
+Widgets compartidos por las ventanas
+"""
@@ -0,0 +1,154 @@
+"""
+Carga de datos en segundo plano para las ventanas.
+
+Las ventanas ejecutaban sus consultas en el hilo de la interfaz y la
+aplicación quedaba congelada hasta recibir las filas. ``BackgroundLoader``
+ejecuta la función de carga en un ``QRunnable`` del pool de hilos y entrega
+el resultado con una señal en el hilo de la interfaz.
+
+Cada petición deja obsoletas las anteriores: si el usuario refresca varias
+veces, solo llega el resultado de la última. Al cerrar la ventana dueña se
+cancelan las peticiones pendientes. Una consulta ya enviada al servidor
+termina igual, pero su resultado se descarta.
+"""
+import os
+import logging
+import threading
+from typing import Any, Callable, Optional
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QEvent, pyqtSignal
+
+logger = logging.getLogger('BackgroundLoader')
+
+_pool: Optional[QThreadPool] = None
+
+def loader_pool() -> QThreadPool:
+    """Pool de hilos compartido por las cargas
+
+    El tamaño se lee de DB_LOADER_THREADS (por defecto 4). Se mantiene
+    pequeño para no acaparar las conexiones del pool de la base.
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(max(1, int(os.getenv('DB_LOADER_THREADS', '4'))))
+    return _pool
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+class LoadTask(QRunnable):
+    """Ejecuta una función de carga fuera del hilo de la interfaz"""
+
+    def __init__(self, request_id: int, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        super().__init__()
+        self.requestId = request_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        # Se crea en el hilo de la interfaz: las señales llegan allí en cola
+        self.signals = _TaskSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Evita que la tarea empiece o que entregue su resultado"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self) -> None:
+        if self.cancelled:
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Error en la carga en segundo plano: {str(e)}")
+            if not self.cancelled:
+                self.signals.failed.emit(self.requestId, str(e))
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(self.requestId, result)
+
+class BackgroundLoader(QObject):
+    """Ejecuta cargas en segundo plano; solo entrega la más reciente"""
+
+    # Resultado de la última petición
+    loaded = pyqtSignal(object)
+    # Mensaje de error de la última petición
+    failed = pyqtSignal(str)
+    # True al iniciar una carga, False al terminar o cancelarse
+    busyChanged = pyqtSignal(bool)
+
+    def __init__(self, parent: Optional[QObject] = None, pool: Optional[QThreadPool] = None):
+        """Inicializa el cargador
+
+        Args:
+            parent (QObject, optional): Objeto padre; si es un widget, cerrarlo
+                cancela la carga pendiente
+            pool (QThreadPool, optional): Pool a usar; por defecto loader_pool()
+        """
+        super().__init__(parent)
+        self._pool = pool or loader_pool()
+        self._requestId = 0
+        self._task: Optional[LoadTask] = None
+        if parent is not None and parent.isWidgetType():
+            self.cancelOnClose(parent)
+
+    def cancelOnClose(self, widget: QObject) -> None:
+        """Cancela la carga pendiente cuando ``widget`` se cierra"""
+        widget.installEventFilter(self)
+
+    def load(self, fn: Callable[..., Any], *args, **kwargs) -> int:
+        """Ejecuta ``fn(*args, **kwargs)`` en el pool, reemplazando la petición en curso
+
+        Returns:
+            int: Número de la petición
+        """
+        wasBusy = self._task is not None
+        if self._task is not None:
+            self._task.cancel()
+        self._requestId += 1
+        task = LoadTask(self._requestId, fn, args, kwargs)
+        task.signals.finished.connect(self._onFinished)
+        task.signals.failed.connect(self._onFailed)
+        self._task = task
+        self._pool.start(task)
+        if not wasBusy:
+            self.busyChanged.emit(True)
+        return self._requestId
+
+    def cancel(self) -> None:
+        """Descarta la petición en curso"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        self._task = None
+        self._requestId += 1
+        self.busyChanged.emit(False)
+
+    def isBusy(self) -> bool:
+        """Indica si hay una petición en curso"""
+        return self._task is not None
+
+    def _finish(self, request_id: int) -> bool:
+        # Resultados de peticiones reemplazadas o canceladas se descartan
+        if request_id != self._requestId or self._task is None:
+            return False
+        self._task = None
+        self.busyChanged.emit(False)
+        return True
+
+    def _onFinished(self, request_id: int, result: Any) -> None:
+        if self._finish(request_id):
+            self.loaded.emit(result)
+
+    def _onFailed(self, request_id: int, message: str) -> None:
+        if self._finish(request_id):
+            self.failed.emit(message)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Close:
+            self.cancel()
+        return False
@@ -0,0 +1,65 @@
+"""
+Filtro por columna de los listados.
+
+Lista desplegable con los valores de una columna (p. ej. los status) que
+filtra un RecordTableModel paginado. El filtro se resuelve en el
+servidor con los filtros que el modelo de datos permite (PAGE_FILTERS).
+Las opciones que salen de la base se cargan en segundo plano; mientras
+tanto (o si la consulta falla) solo está la opción sin filtro.
+"""
+from typing import Any, Callable, Iterable, Optional, Tuple, Union
+from PyQt5.QtWidgets import QComboBox
+from views.widgets.record_table import RecordTableModel
+from views.widgets.background_loader import BackgroundLoader
+
+Options = Iterable[Tuple[str, Any]]
+
+class FilterCombo(QComboBox):
+    """Lista desplegable que filtra un RecordTableModel por una columna"""
+
+    def __init__(self, model: RecordTableModel, name: str,
+                 options: Union[Options, Callable[[], Options]],
+                 field: Optional[str] = None, all_text: str = "All", parent=None):
+        """Inicializa el filtro
+
+        Args:
+            model (RecordTableModel): Modelo a filtrar
+            name (str): Filtro del paginador (PAGE_FILTERS del modelo de datos)
+            options: ``(texto, valor)`` de cada opción, o una función que los devuelve
+                (se ejecuta en segundo plano)
+            field (str, optional): Campo de las filas con el valor filtrado
+            all_text (str): Texto de la opción sin filtro
+            parent (QWidget, optional): Widget padre
+        """
+        super().__init__(parent)
+        self.model = model
+        self.name = name
+        self.field = field
+        self.addItem(all_text, None)
+        if callable(options):
+            self.loader = BackgroundLoader(self)
+            self.loader.loaded.connect(self.addOptions)
+            self.loader.load(lambda: list(options()))
+        else:
+            self.addOptions(options)
+        self.setMinimumWidth(140)
+        self.setStyleSheet("""
+            QComboBox {
+                padding: 4px;
+                border: 1px solid #cccccc;
+                border-radius: 3px;
+                background-color: white;
+            }
+            QComboBox:focus {
+                border: 1px solid #66afe9;
+            }
+        """)
+        self.currentIndexChanged.connect(self._indexChanged)
+
+    def addOptions(self, options: Options) -> None:
+        """Agrega opciones después de la opción sin filtro"""
+        for text, value in options:
+            self.addItem(str(text), value)
+
+    def _indexChanged(self, index: int) -> None:
+        self.model.setFilter(self.name, self.currentData(), self.field)
@@ -0,0 +1,67 @@
+"""
+Caché de páginas de los listados.
+
+Al alternar el orden o los filtros de un listado, el usuario vuelve a
+pedir páginas que acaba de ver. ``PageCache`` guarda las últimas páginas
+recibidas por clave (orden, filtros, búsqueda y posición) para que
+volver a ellas no consulte la base. Las entradas vencen a los
+``DB_PAGE_CACHE_TTL`` segundos, de modo que los cambios hechos desde otra
+terminal terminan apareciendo; los cambios hechos desde la propia tabla
+la vacían.
+
+Se usa solo desde el hilo de la interfaz.
+"""
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Segundos que una página se reutiliza; 0 desactiva la caché
+PAGE_CACHE_TTL = float(os.getenv('DB_PAGE_CACHE_TTL', '60'))
+
+# Páginas conservadas por tabla
+PAGE_CACHE_ENTRIES = int(os.getenv('DB_PAGE_CACHE_ENTRIES', '32'))
+
+class PageCache:
+    """Caché LRU con TTL de páginas de un listado"""
+
+    def __init__(self, ttl: float = PAGE_CACHE_TTL, max_entries: int = PAGE_CACHE_ENTRIES):
+        """Inicializa la caché
+
+        Args:
+            ttl (float): Segundos que una página es válida; 0 desactiva la caché
+            max_entries (int): Páginas conservadas; se descartan las menos usadas
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Página guardada para ``key`` o None si no está o venció"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Guarda una página recibida; el valor no debe modificarse después"""
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Descarta todas las páginas"""
+        self._entries.clear()
@@ -0,0 +1,887 @@
+"""
+Tabla virtual para los listados.
+
+Un ``QTableWidget`` crea un ``QTableWidgetItem`` por celda al cargar: con
+decenas de miles de serials la ventana se congela armando la tabla.
+``RecordTableModel`` guarda las filas tal como llegan de la base (registros
+compactos de ``RowFormat.RECORD``) y arma el texto de cada celda en
+``data()`` solo cuando la vista la pinta. Con un paginador, las filas se
+piden por página a medida que el usuario se desplaza (``canFetchMore`` /
+``fetchMore``).
+
+Las consultas se ejecutan con un BackgroundLoader: la ventana se abre de
+inmediato y la vista muestra un indicador mientras llegan las filas.
+
+Tras crear, editar o eliminar un registro, la ventana no recarga el listado:
+``refreshRecord`` consulta solo esa fila por su ID y la inserta en su lugar
+según el orden de la página, la actualiza o la mueve; ``removeId`` la quita.
+``refreshRecords`` hace lo mismo con varias filas en una sola consulta en
+segundo plano.
+La vista conserva el desplazamiento y la selección.
+
+setSearch() filtra el listado. Si todas las filas ya están cargadas, el
+filtro se resuelve en memoria con un SearchIndex (el índice se prepara en
+el hilo de cada carga); si quedan páginas en el servidor, la búsqueda se
+envía al paginador y las páginas llegan ya filtradas.
+
+El orden (al pulsar un encabezado) y los filtros por columna también los
+resuelve el paginador, limitado a los ordenamientos y filtros que el
+modelo permite. Las páginas recibidas se guardan en un PageCache por
+orden, filtros, búsqueda y posición: alternar entre ordenamientos ya
+vistos no vuelve a consultar la base.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, pyqtSignal
+from PyQt5.QtWidgets import QTableView, QWidget, QLabel, QProgressBar, QVBoxLayout
+from database.row_formats import RowFormat
+from database.pagination import MAX_SEARCH_TERMS, Page, SortKey
+from views.widgets.background_loader import BackgroundLoader
+from views.widgets.page_cache import PageCache
+from views.widgets.search_index import Prepared, SearchIndex, normalize_query, prepare_rows
+
+# Filas pedidas por página al desplazarse
+FETCH_SIZE = 500
+
+# Función que recibe el valor de la celda (incluido None) y devuelve el texto
+Formatter = Callable[[Any], str]
+
+def format_datetime(value: Any) -> str:
+    """Fecha y hora como ``YYYY-MM-DD HH:MM:SS`` (vacío si es None)"""
+    if value is None:
+        return ''
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    # SQLite devuelve texto
+    return str(value)[:19]
+
+def format_yes_no(value: Any) -> str:
+    """Booleano como Yes/No"""
+    return 'Yes' if value else 'No'
+
+def format_default(default: str) -> Formatter:
+    """Texto a mostrar cuando el valor está vacío"""
+    return lambda value: str(value) if value else default
+
+def _fetchPage(fn: Callable[..., Page], fields: Sequence[str],
+               *args, **kwargs) -> Tuple[Page, Optional[Prepared]]:
+    # Se ejecuta en el hilo de la carga: el índice de búsqueda se prepara allí también
+    page = fn(*args, **kwargs)
+    return page, prepare_rows(page.rows, fields) if fields else None
+
+def _fetchRecords(fn: Callable[[List[Any]], Dict[Any, Any]],
+                  record_ids: List[Any]) -> Tuple[List[Any], Dict[Any, Any]]:
+    # Se ejecuta en el hilo de la carga; los IDs acompañan a las filas para quitar las borradas
+    return record_ids, fn(record_ids)
+
+class RecordTableModel(QAbstractTableModel):
+    """Modelo de tabla de solo lectura sobre filas de la base"""
+
+    # True mientras hay una consulta en curso
+    loadingChanged = pyqtSignal(bool)
+    # Mensaje de error de la última consulta
+    loadFailed = pyqtSignal(str)
+
+    def __init__(self, columns: Sequence[Tuple], parent=None, fetch_size: int = FETCH_SIZE,
+                 id_field: Optional[str] = None,
+                 fetch_one: Optional[Callable[[Any], Optional[Any]]] = None,
+                 fetch_many: Optional[Callable[[List[Any]], Dict[Any, Any]]] = None,
+                 search_fields: Sequence[str] = (), sort_fields: Optional[Dict[str, str]] = None):
+        """Inicializa el modelo
+
+        Args:
+            columns (Sequence[Tuple]): ``(título, campo)`` o ``(título, campo, formatter)``
+                por columna; el campo es el nombre de la columna en las filas
+            parent (QObject, optional): Objeto padre; si es la ventana, cerrarla
+                cancela la carga pendiente
+            fetch_size (int): Filas por página cuando se usa un paginador
+            id_field (str, optional): Campo con el ID de cada fila
+            fetch_one (Callable, optional): Devuelve la fila de un ID con las mismas
+                columnas que el listado (o None si ya no existe); lo usa refreshRecord()
+            fetch_many (Callable, optional): Devuelve un diccionario ID → fila de varios
+                IDs en una consulta; lo usa refreshRecords() en segundo plano
+            search_fields (Sequence[str]): Campos en los que busca setSearch(); sin
+                campos, solo filtra el paginador
+            sort_fields (Dict[str, str], optional): Columnas ordenables: campo → nombre
+                del ordenamiento en el paginador (PAGE_SORTS); sin paginador, las filas
+                se ordenan en memoria por el campo
+        """
+        super().__init__(parent)
+        self.titles = [column[0] for column in columns]
+        self.fields = [column[1] for column in columns]
+        self.formatters: List[Optional[Formatter]] = [
+            column[2] if len(column) > 2 else None for column in columns
+        ]
+        self.fetchSize = fetch_size
+        self.idField = id_field
+        self.fetchOne = fetch_one
+        self.fetchMany = fetch_many
+        # Filas visibles; con un filtro local activo, subconjunto de _allRows
+        self._rows: List[Any] = []
+        self._allRows: List[Any] = self._rows
+        # Fila de _allRows por ID: evita recorrer la tabla al editar o quitar una fila
+        self._byId: Dict[Any, Any] = {}
+        self._pager: Optional[Callable[..., Page]] = None
+        self._source: Optional[Callable[[], Page]] = None
+        self._nextKey: Optional[tuple] = None
+        # Orden de las filas según la primera página
+        self._sortKeys: Tuple[SortKey, ...] = ()
+        self._descending = False
+        # IDs insertados fuera de página: se omiten si luego llegan en una página
+        self._insertedIds: Set[Any] = set()
+        # La petición en curso reemplaza las filas (True) o agrega una página (False)
+        self._replace = False
+        self.lastError: Optional[str] = None
+        # Índice sobre _allRows (mismas posiciones)
+        self._index: Optional[SearchIndex] = SearchIndex(search_fields) if search_fields else None
+        # Búsqueda pedida, la que resolvió el servidor para _allRows y la de la carga en curso
+        self._search = ''
+        self._serverSearch = ''
+        self._loadingSearch = ''
+        # Ordenamiento pedido al paginador (None: el predeterminado) y filtros por columna
+        self.sortFields: Dict[str, str] = dict(sort_fields or {})
+        self._sort: Optional[str] = None
+        self._filters: Dict[str, Any] = {}
+        # Campo de las filas con el valor de cada filtro, si se conoce
+        self._filterFields: Dict[str, str] = {}
+        # Orden en memoria (campo, descendente) de las listas sin paginador
+        self._localSort: Optional[Tuple[str, bool]] = None
+        self._pageCache = PageCache()
+        # Clave de caché de la página en curso (None si no se guarda)
+        self._loadingKey: Optional[tuple] = None
+
+        self.loader = BackgroundLoader(self)
+        if parent is not None and parent.isWidgetType():
+            self.loader.cancelOnClose(parent)
+        self.loader.loaded.connect(self._pageLoaded)
+        self.loader.failed.connect(self._pageFailed)
+        self.loader.busyChanged.connect(self.loadingChanged)
+        # Consultas de refreshRecords(): no reemplazan la carga de páginas
+        self.refreshLoader = BackgroundLoader(self)
+        if parent is not None and parent.isWidgetType():
+            self.refreshLoader.cancelOnClose(parent)
+        self.refreshLoader.loaded.connect(self._recordsLoaded)
+        self.refreshLoader.failed.connect(self._recordsFailed)
+        # IDs pedidos a refreshRecords() cuyas filas aún no llegan
+        self._pendingRefresh: List[Any] = []
+
+    # Carga
+
+    def _load(self, fn: Callable[..., Page], *args, **kwargs) -> None:
+        fields = self._index.fields if self._index is not None else ()
+        self.loader.load(_fetchPage, fn, fields, *args, **kwargs)
+
+    def _loadPage(self, after_key: Optional[tuple], search: str) -> None:
+        kwargs: Dict[str, Any] = {}
+        if search:
+            kwargs['search'] = search
+        if self._sort:
+            kwargs['sort'] = self._sort
+        if self._filters:
+            kwargs['filters'] = dict(self._filters)
+        key = (self._sort, tuple(sorted(self._filters.items())), search, after_key)
+        cached = self._pageCache.get(key)
+        if cached is not None:
+            # Se descarta la petición en curso, como lo haría una nueva carga
+            self.loader.cancel()
+            self._loadingKey = None
+            self._applyPage(cached)
+            return
+        self._loadingKey = key
+        self._load(self._pager, after_key=after_key, limit=self.fetchSize,
+                   row_format=RowFormat.RECORD, **kwargs)
+
+    def _restart(self) -> None:
+        # Primera página con el orden, los filtros y la búsqueda actuales
+        self._nextKey = None
+        self._replace = True
+        self.lastError = None
+        self._loadingSearch = self._search
+        self._loadPage(None, self._search)
+
+    def setPager(self, pager: Callable[..., Page]) -> None:
+        """Reinicia la tabla sobre un listado paginado y pide la primera página
+
+        Las filas actuales se conservan hasta que llega la nueva página. Si hay
+        una búsqueda activa, la página llega ya filtrada.
+
+        Args:
+            pager (Callable): Método ``page(after_key, limit, row_format, search)`` de un modelo
+        """
+        self._pager = pager
+        self._source = None
+        self._pageCache.clear()
+        self._restart()
+
+    def setSource(self, fn: Callable[..., Sequence[Any]], *args, **kwargs) -> None:
+        """Reinicia la tabla con una lista completa cargada en segundo plano
+
+        Args:
+            fn (Callable): Función que devuelve todas las filas; recibe ``args`` y ``kwargs``
+        """
+        self._pager = None
+        self._source = lambda: Page(list(fn(*args, **kwargs)), None, 0)
+        self.reload()
+
+    def setRows(self, rows: Sequence[Any]) -> None:
+        """Reinicia la tabla con filas ya cargadas (sin consulta)"""
+        self.loader.cancel()
+        self.beginResetModel()
+        self._pager = None
+        self._source = None
+        self._nextKey = None
+        self._sortKeys = ()
+        self._insertedIds.clear()
+        self._serverSearch = ''
+        self._allRows = self._rows = list(rows)
+        self._indexIds()
+        if self._localSort is not None:
+            self._sortRows(*self._localSort)
+        if self._index is not None:
+            self._index.rebuild(self._allRows)
+            self._filterRows()
+        self.endResetModel()
+
+    def reload(self) -> None:
+        """Vuelve a cargar desde la primera página, sin usar páginas guardadas"""
+        if self._pager is not None:
+            self.setPager(self._pager)
+        elif self._source is not None:
+            self._nextKey = None
+            self._replace = True
+            self.lastError = None
+            # La lista completa se filtra en memoria al llegar
+            self._loadingSearch = ''
+            self._loadingKey = None
+            self._load(self._source)
+
+    def isLoading(self) -> bool:
+        """Indica si hay una consulta en curso"""
+        return self.loader.isBusy()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._pager is not None and self._nextKey is not None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        # La vista lo llama en cada desplazamiento: una página a la vez
+        if not self.canFetchMore(parent) or self.loader.isBusy():
+            return
+        self._replace = False
+        self._loadPage(self._nextKey, self._serverSearch)
+
+    def _pageLoaded(self, result: Tuple[Page, Optional[Prepared]]) -> None:
+        if self._loadingKey is not None:
+            self._pageCache.put(self._loadingKey, result)
+            self._loadingKey = None
+        self._applyPage(result)
+
+    def _applyPage(self, result: Tuple[Page, Optional[Prepared]]) -> None:
+        page, prepared = result
+        self._nextKey = page.next_key
+        rows = page.rows
+        if self._replace:
+            self.beginResetModel()
+            self._allRows = self._rows = list(rows)
+            self._indexIds()
+            self._sortKeys = page.keys
+            self._descending = page.descending
+            self._insertedIds.clear()
+            # El paginador solo aplica los primeros términos; el resto se filtra aquí
+            self._serverSearch = ' '.join(self._loadingSearch.split()[:MAX_SEARCH_TERMS])
+            if self._pager is None and self._localSort is not None:
+                self._sortRows(*self._localSort)
+                prepared = None
+            if self._index is not None:
+                if prepared is None:
+                    self._index.rebuild(self._allRows)
+                else:
+                    self._index.clear()
+                    self._index.extend(prepared)
+                self._filterRows()
+            self.endResetModel()
+            return
+        if self._insertedIds:
+            filtered = [row for row in rows if row[self.idField] not in self._insertedIds]
+            if len(filtered) != len(rows) and self._index is not None:
+                prepared = prepare_rows(filtered, self._index.fields)
+            rows = filtered
+        if rows:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+            self._rows.extend(rows)
+            if self.idField is not None:
+                self._byId.update((row[self.idField], row) for row in rows)
+            if self._index is not None:
+                self._index.extend(prepared)
+            self.endInsertRows()
+
+    def _pageFailed(self, message: str) -> None:
+        # No reintentar en cada desplazamiento; reload() vuelve a empezar
+        self._nextKey = None
+        self.lastError = message
+        self.loadFailed.emit(message)
+
+    # Búsqueda
+
+    def searchText(self) -> str:
+        """Búsqueda activa (normalizada)"""
+        return self._search
+
+    def setSearch(self, text: str) -> None:
+        """Filtra el listado: filas que contienen todos los términos de ``text``
+
+        Cada término se busca como subcadena en los campos de búsqueda, sin
+        distinguir mayúsculas. Con todas las filas cargadas (o si la búsqueda
+        solo agrega texto a la que resolvió el servidor) se filtra en memoria;
+        si no, la búsqueda se envía al paginador.
+        """
+        query = normalize_query(text)
+        if query == self._search:
+            return
+        self._search = query
+        if self._pager is None and self.loader.isBusy() and self._replace:
+            # La lista completa en camino se filtra al llegar
+            return
+        if self._canFilterLocally():
+            self.beginResetModel()
+            self._filterRows()
+            self.endResetModel()
+        elif self._pager is not None:
+            self._restart()
+
+    def isFiltered(self) -> bool:
+        """Indica si un filtro en memoria oculta filas cargadas"""
+        return self._rows is not self._allRows
+
+    def _canFilterLocally(self) -> bool:
+        # Cada término del servidor es subcadena de algún término nuevo: las filas
+        # que coinciden con la búsqueda nueva ya están en _allRows
+        return (self._index is not None and self._nextKey is None and self.lastError is None
+                and not (self.loader.isBusy() and self._replace)
+                and self._serverSearch in self._search)
+
+    def _filterRows(self) -> None:
+        # Dentro de un reset del modelo
+        if self._search == self._serverSearch or self._index is None or self.hasMore():
+            self._rows = self._allRows
+        else:
+            self._rows = self._index.filter(self._allRows, self._search)
+
+    def _matches(self, record: Any, query: str) -> bool:
+        return not query or self._index is None or self._index.matches(record, query)
+
+    def _mirrorIndex(self) -> Optional[SearchIndex]:
+        # Sin filtro local, las filas visibles son las indexadas
+        return self._index if not self.isFiltered() else None
+
+    # Orden y filtros
+
+    def isSortable(self, column: int) -> bool:
+        """Indica si la columna puede ordenarse (está en ``sort_fields``)"""
+        return 0 <= column < len(self.fields) and self.fields[column] in self.sortFields
+
+    def sort(self, column: int, order: int = Qt.AscendingOrder) -> None:
+        """Ordena por la columna indicada; las columnas no ordenables se ignoran"""
+        if not self.isSortable(column):
+            return
+        field = self.fields[column]
+        descending = order == Qt.DescendingOrder
+        if self._pager is not None:
+            self.setSort(('-' if descending else '') + self.sortFields[field])
+            return
+        # Lista completa: se ordena en memoria
+        self._localSort = (field, descending)
+        self.beginResetModel()
+        self._sortRows(field, descending)
+        if self._index is not None:
+            self._index.rebuild(self._allRows)
+            self._filterRows()
+        self.endResetModel()
+
+    def setSort(self, sort: Optional[str]) -> None:
+        """Cambia el ordenamiento del paginador y pide la primera página
+
+        Args:
+            sort (str, optional): Uno de PAGE_SORTS del modelo, con prefijo ``-`` en
+                orden descendente; None para el predeterminado
+        """
+        if sort == self._sort:
+            return
+        self._sort = sort
+        if self._pager is not None:
+            self._restart()
+
+    def filters(self) -> Dict[str, Any]:
+        """Filtros por columna activos"""
+        return dict(self._filters)
+
+    def setFilter(self, name: str, value: Any, field: Optional[str] = None) -> None:
+        """Filtra el listado paginado por una columna y pide la primera página
+
+        Args:
+            name (str): Uno de PAGE_FILTERS del modelo
+            value: Valor a filtrar (una tupla acepta cualquiera de sus valores);
+                None quita el filtro
+            field (str, optional): Campo de las filas con ese valor; permite decidir
+                sin consultar si una fila editada sigue en el listado
+        """
+        if isinstance(value, (list, set)):
+            value = tuple(value)
+        if value == self._filters.get(name):
+            return
+        if value is None:
+            self._filters.pop(name, None)
+            self._filterFields.pop(name, None)
+        else:
+            self._filters[name] = value
+            if field is not None:
+                self._filterFields[name] = field
+        if self._pager is not None:
+            self._restart()
+
+    def _matchesFilters(self, record: Any) -> bool:
+        for name, field in self._filterFields.items():
+            value = self._filters[name]
+            if isinstance(value, tuple):
+                if record[field] not in value:
+                    return False
+            elif record[field] != value:
+                return False
+        return True
+
+    def _sortRows(self, field: str, descending: bool) -> None:
+        # Dentro de un reset del modelo; los vacíos quedan al final
+        present = [row for row in self._allRows if row[field] is not None]
+        empty = [row for row in self._allRows if row[field] is None]
+        try:
+            present.sort(key=lambda row: row[field], reverse=descending)
+        except TypeError:
+            present.sort(key=lambda row: str(row[field]), reverse=descending)
+        self._allRows[:] = present + empty
+        self._sortKeys = (SortKey(field, field),)
+        self._descending = descending
+
+    # Acceso a las filas
+
+    def record(self, row: int) -> Optional[Any]:
+        """Fila original (registro o diccionario) en la posición indicada"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def hasMore(self) -> bool:
+        """Indica si quedan páginas por cargar"""
+        return self._nextKey is not None
+
+    # Cambios de una fila
+
+    def _indexIds(self) -> None:
+        self._byId = ({row[self.idField]: row for row in self._allRows}
+                      if self.idField is not None else {})
+
+    def rowOfId(self, record_id: Any, hint: Optional[int] = None) -> Optional[int]:
+        """Posición de la fila con el ID indicado o None si no está cargada
+
+        La fila se ubica por ID y, con las filas ordenadas, por búsqueda
+        binaria sobre su clave de orden; solo si eso falla (filas sin orden
+        conocido) se recorre la tabla.
+
+        Args:
+            record_id: ID buscado
+            hint (int, optional): Posición probable (p. ej. la fila seleccionada)
+        """
+        if self.idField is None or record_id is None:
+            return None
+        if hint is not None and 0 <= hint < len(self._rows) \
+                and self._rows[hint][self.idField] == record_id:
+            return hint
+        record = self._byId.get(record_id)
+        if record is None:
+            return None
+        if self.isFiltered() and not self._matches(record, self._search):
+            # Oculta por el filtro local
+            return None
+        return self._positionOf(record, self._rows)
+
+    def _positionOf(self, record: Any, rows: List[Any]) -> Optional[int]:
+        """Posición en ``rows`` de la fila con el ID de ``record`` (con su misma clave de orden)"""
+        recordId = record[self.idField]
+        if self._sortKeys:
+            try:
+                key = self._sortKey(record)
+                position = self._bisect(key, rows, right=False)
+                while position < len(rows) and self._sortKey(rows[position]) == key:
+                    if rows[position][self.idField] == recordId:
+                        return position
+                    position += 1
+            except TypeError:
+                pass
+        # Orden desconocido o distinto del de Python (p. ej. la intercalación de MySQL)
+        for position, current in enumerate(rows):
+            if current[self.idField] == recordId:
+                return position
+        return None
+
+    def _sortKey(self, record: Any) -> tuple:
+        return tuple(key.order_value(record) for key in self._sortKeys)
+
+    def _bisect(self, key: tuple, rows: List[Any], right: bool) -> int:
+        """Primera posición de ``rows`` con clave posterior a ``key`` (``right``) o no anterior
+
+        Raises:
+            TypeError: Si las claves no son comparables (p. ej. None)
+        """
+        low, high = 0, len(rows)
+        while low < high:
+            middle = (low + high) // 2
+            current = self._sortKey(rows[middle])
+            if self._descending:
+                before = current >= key if right else current > key
+            else:
+                before = current <= key if right else current < key
+            if before:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _sortedPosition(self, record: Any, rows: List[Any],
+                        exclude: Optional[int] = None) -> Optional[int]:
+        """Posición de ``record`` en ``rows`` según el orden del listado
+
+        Args:
+            record: Fila a ubicar
+            rows (List): Filas ordenadas
+            exclude (int, optional): Posición de la versión anterior de la fila, que
+                no cuenta (la posición es la que tendrá tras quitarla)
+
+        Returns:
+            Optional[int]: None si la fila corresponde a una página aún no cargada
+        """
+        size = len(rows) - (exclude is not None)
+        if not self._sortKeys:
+            return size
+        try:
+            low = self._bisect(self._sortKey(record), rows, right=True)
+            if exclude is not None and exclude < low:
+                low -= 1
+        except TypeError:
+            # Valores no comparables (p. ej. None): al final de lo cargado
+            low = size
+        if low == size and self.hasMore():
+            return None
+        return low
+
+    def upsertRecord(self, record: Any, hint: Optional[int] = None) -> Optional[int]:
+        """Inserta la fila en su lugar o reemplaza la que tiene su ID
+
+        Si su clave de orden cambió, la fila se mueve (la selección la sigue).
+
+        Args:
+            record: Fila con las columnas del listado
+            hint (int, optional): Posición probable de la fila actual
+
+        Returns:
+            Optional[int]: Posición final o None si quedó fuera de lo cargado
+        """
+        recordId = record[self.idField] if self.idField is not None else None
+        # La fila cambió: las páginas guardadas pueden tenerla en otro lugar
+        self._pageCache.clear()
+        # Posición de la versión anterior, antes de reemplazarla en _allRows
+        row = self.rowOfId(recordId, hint)
+        if not self._matchesFilters(record):
+            # Ya no coincide con los filtros por columna
+            self._insertedIds.discard(recordId)
+            if self.isFiltered() and recordId is not None:
+                self._removeHidden(recordId)
+            if row is not None:
+                self.removeRow(row)
+            return None
+        mirrored = not self.isFiltered()
+        if mirrored:
+            visible = self._matches(record, self._serverSearch)
+        else:
+            self._upsertHidden(record, recordId)
+            visible = self._matches(record, self._search)
+        index = self._mirrorIndex()
+        if not visible:
+            # Ya no coincide con la búsqueda
+            self._insertedIds.discard(recordId)
+            if row is not None:
+                self.removeRow(row)
+            return None
+        if row is None:
+            position = self._sortedPosition(record, self._rows)
+            if position is None:
+                return None
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._rows.insert(position, record)
+            if mirrored and recordId is not None:
+                self._byId[recordId] = record
+            if index is not None:
+                index.insert(position, record)
+            self.endInsertRows()
+            if self.hasMore() and recordId is not None:
+                self._insertedIds.add(recordId)
+            return position
+
+        # Posición entre las demás filas
+        position = self._sortedPosition(record, self._rows, exclude=row)
+        if position is None:
+            # Llegará con la página que le corresponde
+            self._insertedIds.discard(recordId)
+            self.removeRow(row)
+            return None
+        if position != row:
+            # Destino en coordenadas previas al movimiento
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(),
+                               position + 1 if position > row else position)
+            self._rows.pop(row)
+            self._rows.insert(position, record)
+            if index is not None:
+                index.pop(row)
+                index.insert(position, record)
+            self.endMoveRows()
+        else:
+            self._rows[row] = record
+            if index is not None:
+                index.replace(row, record)
+        if mirrored:
+            self._byId[recordId] = record
+        self.dataChanged.emit(self.index(position, 0),
+                              self.index(position, len(self.fields) - 1))
+        return position
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or row < 0 or count < 1 or row + count > len(self._rows):
+            return False
+        index = self._mirrorIndex()
+        self._pageCache.clear()
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        if not self.isFiltered() and self.idField is not None:
+            for record in self._rows[row:row + count]:
+                self._byId.pop(record[self.idField], None)
+        del self._rows[row:row + count]
+        if index is not None:
+            for position in range(row + count - 1, row - 1, -1):
+                index.pop(position)
+        self.endRemoveRows()
+        return True
+
+    def _upsertHidden(self, record: Any, record_id: Any) -> None:
+        """Refleja una fila en _allRows y el índice mientras hay un filtro local"""
+        # Con filtro local todo está cargado: _sortedPosition nunca devuelve None
+        if record_id is not None:
+            self._removeHidden(record_id)
+        if self._matches(record, self._serverSearch):
+            position = self._sortedPosition(record, self._allRows)
+            self._allRows.insert(position, record)
+            self._index.insert(position, record)
+            if record_id is not None:
+                self._byId[record_id] = record
+
+    def _removeHidden(self, record_id: Any) -> None:
+        record = self._byId.pop(record_id, None)
+        if record is None:
+            return
+        position = self._positionOf(record, self._allRows)
+        if position is not None:
+            del self._allRows[position]
+            self._index.pop(position)
+
+    def removeId(self, record_id: Any, hint: Optional[int] = None) -> bool:
+        """Quita la fila con el ID indicado
+
+        Returns:
+            bool: True si la fila estaba cargada
+        """
+        row = self.rowOfId(record_id, hint)
+        if self.isFiltered() and self.idField is not None:
+            self._removeHidden(record_id)
+        return row is not None and self.removeRow(row)
+
+    def refreshRecord(self, record_id: Any, hint: Optional[int] = None) -> Optional[int]:
+        """Consulta solo la fila del ID y la refleja en la tabla
+
+        La fila se inserta, actualiza o mueve; si ya no existe, se quita. Sin
+        ID (p. ej. el backend no lo informó) se recarga el listado.
+
+        Args:
+            record_id: ID del registro creado o modificado
+            hint (int, optional): Posición probable de la fila actual
+
+        Returns:
+            Optional[int]: Posición de la fila o None si no quedó cargada
+        """
+        if record_id is None or self.fetchOne is None:
+            self.reload()
+            return None
+        record = self.fetchOne(record_id)
+        if record is None:
+            self.removeId(record_id, hint)
+            return None
+        return self.upsertRecord(record, hint)
+
+    def refreshRecords(self, record_ids: Sequence[Any]) -> None:
+        """Consulta en segundo plano las filas de varios IDs y las refleja en la tabla
+
+        Las filas se piden juntas con ``fetch_many``; al llegar se insertan,
+        actualizan o mueven como en refreshRecord(), y las que ya no existen se
+        quitan. Los IDs de una petición anterior aún en curso se vuelven a pedir.
+        Sin ``fetch_many`` o con algún ID desconocido (None) se recarga el listado.
+
+        Args:
+            record_ids (Sequence): IDs de los registros creados o modificados
+        """
+        if not record_ids:
+            return
+        if self.fetchMany is None or any(recordId is None for recordId in record_ids):
+            self.reload()
+            return
+        self._pendingRefresh = list(dict.fromkeys([*self._pendingRefresh, *record_ids]))
+        self.refreshLoader.load(_fetchRecords, self.fetchMany, list(self._pendingRefresh))
+
+    def _recordsLoaded(self, result: Tuple[List[Any], Dict[Any, Any]]) -> None:
+        recordIds, records = result
+        self._pendingRefresh = []
+        for recordId in recordIds:
+            record = records.get(recordId)
+            if record is None:
+                self.removeId(recordId)
+            else:
+                self.upsertRecord(record)
+
+    def _recordsFailed(self, message: str) -> None:
+        # Los IDs quedan pendientes para la siguiente llamada; las páginas siguen igual
+        self.lastError = message
+        self.loadFailed.emit(message)
+
+    # QAbstractTableModel
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.fields)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][self.fields[index.column()]]
+            formatter = self.formatters[index.column()]
+            if formatter is not None:
+                return formatter(value)
+            return '' if value is None else str(value)
+        if role == Qt.UserRole:
+            return self._rows[index.row()][self.fields[index.column()]]
+        return QVariant()
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.titles[section]
+        return super().headerData(section, orientation, role)
+
+class _Placeholder(QWidget):
+    """Indicador de carga o de error sobre la vista"""
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignCenter)
+        self.label = QLabel()
+        self.label.setAlignment(Qt.AlignCenter)
+        self.label.setStyleSheet("color: #6c757d; border: none;")
+        # Rango 0-0: barra indeterminada (animada)
+        self.spinner = QProgressBar()
+        self.spinner.setRange(0, 0)
+        self.spinner.setTextVisible(False)
+        self.spinner.setFixedSize(160, 8)
+        layout.addWidget(self.label)
+        layout.addWidget(self.spinner, 0, Qt.AlignCenter)
+        self.hide()
+
+class RecordTableView(QTableView):
+    """Vista de un RecordTableModel: selección de una fila, sin edición"""
+
+    def __init__(self, model: RecordTableModel, parent=None):
+        """Inicializa la vista
+
+        Args:
+            model (RecordTableModel): Modelo a mostrar
+            parent (QWidget, optional): Widget padre
+        """
+        super().__init__(parent)
+        self.setModel(model)
+        self.setSelectionBehavior(QTableView.SelectRows)
+        self.setSelectionMode(QTableView.SingleSelection)
+        self.setEditTriggers(QTableView.NoEditTriggers)
+
+        self.placeholder = _Placeholder(self.viewport())
+        model.loadingChanged.connect(self._updatePlaceholder)
+        model.loadFailed.connect(self._updatePlaceholder)
+        model.modelReset.connect(self._updatePlaceholder)
+
+        # Encabezados: un clic ordena (en el servidor) por las columnas ordenables.
+        # No se usa setSortingEnabled(), que ordenaría por la columna 0 al activarse
+        self._sortSection = -1
+        self._sortOrder = Qt.AscendingOrder
+        header = self.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(False)
+        header.setSortIndicator(self._sortSection, self._sortOrder)
+        header.sortIndicatorChanged.connect(self._sortIndicatorChanged)
+
+    def _updatePlaceholder(self, *args) -> None:
+        model = self.model()
+        if model.rowCount() > 0:
+            # Con filas visibles la vista sigue usable; solo se indica la carga
+            self.viewport().setCursor(Qt.BusyCursor if model.isLoading() else Qt.ArrowCursor)
+            self.placeholder.hide()
+            return
+        if model.isLoading():
+            self.placeholder.label.setText("Loading...")
+            self.placeholder.spinner.show()
+        elif model.lastError:
+            self.placeholder.label.setText("Could not load the data")
+            self.placeholder.spinner.hide()
+        else:
+            self.placeholder.hide()
+            return
+        self.placeholder.setGeometry(self.viewport().rect())
+        self.placeholder.show()
+        self.placeholder.raise_()
+
+    def _sortIndicatorChanged(self, section: int, order: int) -> None:
+        header = self.horizontalHeader()
+        if not self.model().isSortable(section):
+            # El encabezado invierte el indicador en cualquier clic: se restaura
+            header.blockSignals(True)
+            header.setSortIndicator(self._sortSection, self._sortOrder)
+            header.blockSignals(False)
+            return
+        self._sortSection, self._sortOrder = section, order
+        header.setSortIndicatorShown(True)
+        self.model().sort(section, order)
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self.placeholder.setGeometry(self.viewport().rect())
+
+    def selectedRow(self) -> Optional[int]:
+        """Posición de la fila seleccionada o None si no hay selección"""
+        # selectedRows() exige toda la fila seleccionada, y las columnas ocultas no lo están
+        indexes = self.selectionModel().selectedIndexes()
+        return indexes[0].row() if indexes else None
+
+    def selectedRecord(self) -> Optional[Any]:
+        """Fila seleccionada o None si no hay selección"""
+        row = self.selectedRow()
+        return None if row is None else self.model().record(row)
+
+    def selectedValue(self, field: str, default: Any = None) -> Any:
+        """Valor de un campo de la fila seleccionada (``default`` si no hay selección)"""
+        record = self.selectedRecord()
+        return default if record is None else record[field]
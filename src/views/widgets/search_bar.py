@@ -0,0 +1,67 @@
+"""
+Campo de búsqueda de los listados.
+
+Filtra un RecordTableModel mientras el usuario escribe. Las teclas se
+agrupan: la búsqueda se aplica cuando el usuario deja de escribir por
+DEBOUNCE_MS (Enter la aplica de inmediato, Esc la borra). El filtrado
+en memoria o en el servidor lo decide el modelo.
+"""
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QLineEdit
+from views.widgets.record_table import RecordTableModel
+
+# Milisegundos sin teclear antes de aplicar la búsqueda
+DEBOUNCE_MS = 150
+
+class SearchBar(QLineEdit):
+    """Campo de texto que filtra un RecordTableModel"""
+
+    def __init__(self, model: RecordTableModel, parent=None, placeholder: str = "Search..."):
+        """Inicializa el campo
+
+        Args:
+            model (RecordTableModel): Modelo a filtrar
+            parent (QWidget, optional): Widget padre
+            placeholder (str): Texto de ayuda del campo vacío
+        """
+        super().__init__(parent)
+        self.model = model
+        self.setPlaceholderText(placeholder)
+        self.setClearButtonEnabled(True)
+        self.setMinimumWidth(220)
+        self.setStyleSheet("""
+            QLineEdit {
+                padding: 5px;
+                border: 1px solid #cccccc;
+                border-radius: 3px;
+                background-color: white;
+            }
+            QLineEdit:focus {
+                border: 1px solid #66afe9;
+            }
+        """)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(DEBOUNCE_MS)
+        self._timer.timeout.connect(self.applySearch)
+        self.textChanged.connect(self._textChanged)
+        self.returnPressed.connect(self.applySearch)
+
+    def _textChanged(self, text: str) -> None:
+        if not text:
+            # Botón de borrar: sin espera
+            self.applySearch()
+        else:
+            self._timer.start()
+
+    def applySearch(self) -> None:
+        """Aplica de inmediato el texto actual"""
+        self._timer.stop()
+        self.model.setSearch(self.text())
+
+    def keyPressEvent(self, event) -> None:
+        if event.key() == Qt.Key_Escape and self.text():
+            self.clear()
+            return
+        super().keyPressEvent(event)
@@ -0,0 +1,220 @@
+"""
+Índice en memoria para la búsqueda de los listados.
+
+Recorrer las filas comparando texto en cada tecla cuesta más de un cuadro
+de pantalla con decenas de miles de serials. ``SearchIndex`` guarda el
+texto de búsqueda de cada fila (campos en minúsculas) en un arreglo de
+bytes de numpy, que se recorre con una sola operación vectorizada, y por
+cada trigrama el conjunto de filas que lo contienen. Un término selectivo
+se resuelve intersecando conjuntos y comprobando solo las candidatas; uno
+corto o muy común, recorriendo el arreglo. Si la búsqueda extiende la
+anterior (el usuario sigue escribiendo), solo se revisan sus coincidencias.
+
+El índice sigue las posiciones de las filas del modelo; los bloques se
+preparan con prepare_rows() en el hilo de la carga.
+"""
+from collections import defaultdict
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import numpy as np
+
+# Largo de los n-gramas indexados
+GRAM = 3
+
+# Separador entre campos: ningún término lo contiene, así que no une campos
+_SEPARATOR = '\x1f'
+
+# Los trigramas se usan si su conjunto más chico tiene menos de esta fracción de
+# las filas; con términos más comunes es más rápido recorrer el arreglo
+_SELECTIVE = 1 / 16
+
+# Textos, arreglo de bytes y trigramas de un bloque (posiciones relativas al bloque)
+Prepared = Tuple[List[str], np.ndarray, Dict[str, List[int]]]
+
+def normalize_query(text: str) -> str:
+    """Texto de búsqueda en minúsculas y con los espacios colapsados"""
+    return ' '.join(text.lower().split())
+
+def search_text(record: Any, fields: Sequence[str]) -> str:
+    """Texto de búsqueda de una fila"""
+    values = (record[field] for field in fields)
+    return _SEPARATOR.join('' if value is None else str(value) for value in values).lower()
+
+def _encode(texts: Sequence[str]) -> np.ndarray:
+    return np.array([text.encode('utf-8') for text in texts], dtype=bytes)
+
+def prepare_rows(rows: Iterable[Any], fields: Sequence[str]) -> Prepared:
+    """Calcula textos y trigramas de un bloque de filas
+
+    No toca el índice, por lo que puede ejecutarse en el hilo de la carga.
+    """
+    texts = [search_text(row, fields) for row in rows]
+    grams: Dict[str, List[int]] = defaultdict(list)
+    for position, text in enumerate(texts):
+        for gram in {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}:
+            grams[gram].append(position)
+    return texts, _encode(texts), grams
+
+class SearchIndex:
+    """Índice de búsqueda por subcadena sobre las filas de un listado"""
+
+    def __init__(self, fields: Sequence[str]):
+        """Inicializa el índice vacío
+
+        Args:
+            fields (Sequence[str]): Campos de cada fila que se buscan
+        """
+        self.fields = tuple(fields)
+        self._texts: List[str] = []
+        # Arreglos por bloque; se unen en _array al buscar
+        self._chunks: List[np.ndarray] = []
+        self._array: Optional[np.ndarray] = None
+        # None si un cambio de fila desplazó las posiciones: solo se recorre el arreglo
+        self._grams: Optional[Dict[str, Set[int]]] = defaultdict(set)
+        self._lastQuery = ''
+        self._lastMatches: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def clear(self) -> None:
+        """Vacía el índice"""
+        self._texts = []
+        self._chunks = []
+        self._array = None
+        self._grams = defaultdict(set)
+        self._forget()
+
+    def extend(self, prepared: Prepared) -> None:
+        """Agrega al final un bloque preparado con prepare_rows()"""
+        texts, array, grams = prepared
+        offset = len(self._texts)
+        self._texts.extend(texts)
+        self._chunks.append(array)
+        self._array = None
+        if self._grams is not None:
+            for gram, positions in grams.items():
+                self._grams[gram].update(offset + position for position in positions)
+        self._forget()
+
+    def rebuild(self, rows: Sequence[Any]) -> None:
+        """Reconstruye el índice completo"""
+        self.clear()
+        self.extend(prepare_rows(rows, self.fields))
+
+    # Cambios de una fila: mantienen los textos alineados con las filas del modelo
+
+    def insert(self, position: int, record: Any) -> None:
+        self._texts.insert(position, search_text(record, self.fields))
+        self._stale()
+
+    def replace(self, position: int, record: Any) -> None:
+        self._texts[position] = search_text(record, self.fields)
+        self._stale()
+
+    def pop(self, position: int) -> None:
+        del self._texts[position]
+        self._stale()
+
+    def _stale(self) -> None:
+        # Los conjuntos guardan posiciones: dejan de usarse hasta la siguiente carga
+        # completa; el arreglo se vuelve a armar desde los textos en la próxima búsqueda
+        self._grams = None
+        self._chunks = []
+        self._array = None
+        self._forget()
+
+    def _forget(self) -> None:
+        self._lastQuery = ''
+        self._lastMatches = None
+
+    def _haystack(self) -> np.ndarray:
+        if self._array is None:
+            if self._chunks and sum(len(chunk) for chunk in self._chunks) == len(self._texts):
+                self._array = np.concatenate(self._chunks) if len(self._chunks) > 1 \
+                    else self._chunks[0]
+            else:
+                self._array = _encode(self._texts)
+            self._chunks = [self._array]
+        return self._array
+
+    # Búsqueda
+
+    def matches(self, record: Any, query: str) -> bool:
+        """Indica si una fila contiene todos los términos de ``query``"""
+        text = search_text(record, self.fields)
+        return all(term in text for term in normalize_query(query).split())
+
+    def _gramCandidates(self, term: str) -> Optional[np.ndarray]:
+        """Filas que contienen todos los trigramas del término, o None si no es selectivo"""
+        if self._grams is None or len(term) < GRAM:
+            return None
+        postings = []
+        for i in range(len(term) - GRAM + 1):
+            rows = self._grams.get(term[i:i + GRAM])
+            if not rows:
+                return np.empty(0, dtype=np.intp)
+            postings.append(rows)
+        postings.sort(key=len)
+        if len(postings[0]) > len(self._texts) * _SELECTIVE:
+            return None
+        candidates = postings[0].intersection(*postings[1:])
+        return np.array(sorted(candidates), dtype=np.intp)
+
+    def search(self, query: str) -> np.ndarray:
+        """Posiciones (en orden) de las filas que contienen todos los términos
+
+        Args:
+            query (str): Términos separados por espacios; cada uno se busca como
+                subcadena en cualquiera de los campos, sin distinguir mayúsculas
+
+        Returns:
+            np.ndarray: Posiciones de las filas
+        """
+        query = normalize_query(query)
+        terms = query.split()
+        if not terms:
+            return np.arange(len(self._texts))
+
+        haystack = self._haystack()
+        candidates: Optional[np.ndarray] = None
+        pending = terms
+        # Una búsqueda que extiende la anterior solo puede reducir su resultado:
+        # basta revisar sus coincidencias con los términos nuevos
+        if self._lastMatches is not None and self._lastQuery and self._lastQuery in query:
+            candidates = self._lastMatches
+            previous = set(self._lastQuery.split())
+            pending = [term for term in terms if term not in previous]
+        # Los términos largos suelen ser los más selectivos
+        for term in sorted(pending, key=len, reverse=True):
+            indexed = self._gramCandidates(term)
+            if indexed is not None:
+                candidates = indexed if candidates is None \
+                    else np.intersect1d(candidates, indexed, assume_unique=True)
+            # Los trigramas no garantizan la subcadena completa: se comprueba
+            encoded = term.encode('utf-8')
+            if candidates is None or len(candidates) == len(haystack):
+                candidates = np.flatnonzero(np.char.find(haystack, encoded) >= 0)
+            elif len(candidates):
+                candidates = candidates[np.char.find(haystack[candidates], encoded) >= 0]
+            if not len(candidates):
+                break
+        self._lastQuery = query
+        self._lastMatches = candidates
+        return candidates
+
+    def filter(self, rows: Sequence[Any], query: str) -> List[Any]:
+        """Filas (en orden) que contienen todos los términos de ``query``
+
+        Args:
+            rows (Sequence): Filas indexadas, en el mismo orden que el índice
+            query (str): Texto de búsqueda (ver search())
+        """
+        positions = self.search(query)
+        if len(positions) == len(rows):
+            return list(rows)
+        if len(positions) < len(rows) // 8:
+            return [rows[position] for position in positions.tolist()]
+        mask = np.zeros(len(rows), dtype=bool)
+        mask[positions] = True
+        return list(compress(rows, mask.tolist()))
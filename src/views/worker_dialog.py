@@ -11,6 +11,8 @@ class WorkerDialog(QDialog):
     def __init__(self, parent=None, workerId=None):
         super().__init__(parent)
         self.workerId = workerId
+        # ID del registro guardado (el nuevo al crear); None hasta aceptar
+        self.savedId = None
         self.workerModel = WorkerModel()
         self.positionModel = PositionModel()
         
@@ -151,6 +153,7 @@ class WorkerDialog(QDialog):
             )
         
         if success:
+            self.savedId = self.workerId or success.id
             self.accept()
         else:
             QMessageBox.critical(self, "Error", "Failed to save worker") 
\ No newline at end of file
@@ -1,11 +1,14 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QPushButton, QHeaderView,
                              QSpacerItem, QSizePolicy, QMessageBox, QMainWindow, QDialog)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 import os
 from models.worker_model import WorkerModel
+from database.row_formats import RowFormat
 from views.worker_dialog import WorkerDialog
+from views.widgets.record_table import RecordTableModel, RecordTableView, format_datetime, format_default
+from views.widgets.search_bar import SearchBar
 
 class WorkersWindow(QMainWindow):
     def __init__(self):
@@ -71,12 +74,12 @@ class WorkersWindow(QMainWindow):
                 border: 1px solid #cccccc;
                 border-radius: 5px;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 background-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -132,15 +135,21 @@ class WorkersWindow(QMainWindow):
         contentLayout.addLayout(toolbarLayout)
         
         # Tabla de trabajadores
-        self.workersTable = QTableWidget()
-        self.workersTable.setColumnCount(3)  # Reducido a 3 columnas
-        self.workersTable.setHorizontalHeaderLabels(["Name", "Position", "Created"])
+        self.workersTableModel = RecordTableModel([
+            ("Name", 'Name'),
+            ("Position", 'position_name', format_default('No Position')),
+            ("Created", 'create_time', format_datetime),
+        ], self, id_field='idWorkers', fetch_one=self.workerModel.getWorkerById,
+            search_fields=('Name', 'position_name'),
+            sort_fields={'Name': 'name', 'position_name': 'position', 'create_time': 'created'})
+
+        # Búsqueda al inicio de la barra de herramientas
+        self.searchBar = SearchBar(self.workersTableModel)
+        toolbarLayout.insertWidget(0, self.searchBar)
+        self.workersTable = RecordTableView(self.workersTableModel)
         self.workersTable.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.workersTable.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.workersTable.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.workersTable.setSelectionBehavior(QTableWidget.SelectRows)
-        self.workersTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.workersTable.setEditTriggers(QTableWidget.NoEditTriggers)
         contentLayout.addWidget(self.workersTable)
         
         mainLayout.addWidget(contentFrame)
@@ -149,40 +158,22 @@ class WorkersWindow(QMainWindow):
     
     def loadWorkers(self):
         """Carga los trabajadores en la tabla"""
-        self.workersTable.setRowCount(0)
-        workers = self.workerModel.getAllWorkers()
-        
-        # Diccionario para mantener la relación entre filas e IDs
-        self.workerIds = {}
-        
-        for row, worker in enumerate(workers):
-            self.workersTable.insertRow(row)
-            
-            # Nombre
-            self.workersTable.setItem(row, 0, QTableWidgetItem(worker['Name']))
-            
-            # Posición
-            position = worker['position_name'] if worker['position_name'] else 'No Position'
-            self.workersTable.setItem(row, 1, QTableWidgetItem(position))
-            
-            # Fecha de creación
-            create_time = worker['create_time'].strftime('%Y-%m-%d %H:%M:%S') if worker['create_time'] else ''
-            self.workersTable.setItem(row, 2, QTableWidgetItem(create_time))
-            
-            # Guardar el ID del trabajador
-            self.workerIds[row] = worker['idWorkers']
+        # Lista corta y sin paginador: se carga completa en registros compactos
+        self.workersTableModel.setSource(self.workerModel.getAllWorkers, row_format=RowFormat.RECORD)
     
     def showAddWorkerDialog(self):
         """Muestra el diálogo para agregar un trabajador"""
         dialog = WorkerDialog(self)
         if dialog.exec_() == QDialog.Accepted:
-            self.loadWorkers()
+            self.workersTableModel.refreshRecord(dialog.savedId)
     
     def showEditWorkerDialog(self, workerId):
         """Muestra el diálogo para editar un trabajador"""
+        # La fila seleccionada suele ser la del trabajador; rowOfId lo verifica
+        row = self.workersTable.selectedRow()
         dialog = WorkerDialog(self, workerId)
         if dialog.exec_() == QDialog.Accepted:
-            self.loadWorkers()
+            self.workersTableModel.refreshRecord(workerId, row)
     
     def deleteWorker(self, workerId):
         """Elimina un trabajador"""
@@ -196,17 +187,13 @@ class WorkersWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             if self.workerModel.deleteWorker(workerId):
-                self.loadWorkers()
+                self.workersTableModel.removeId(workerId, self.workersTable.selectedRow())
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete worker")
 
     def getSelectedWorkerId(self):
         """Obtiene el ID del trabajador seleccionado"""
-        selectedItems = self.workersTable.selectedItems()
-        if not selectedItems:
-            return None
-        row = selectedItems[0].row()
-        return self.workerIds.get(row)
+        return self.workersTable.selectedValue('idWorkers')
 
     def editSelectedWorker(self):
         """Edita el trabajador seleccionado"""